@@ -1,20 +1,16 @@
 """
 Credit Risk Assessment Agents
 Specialized LLM agents for credit analysis workflow
+
+Chains are built lazily through the registry: use get_agent("income_analyzer")
+rather than importing chain instances.
 """
 
-from agents.financial_data_collector import financial_data_collector
-from agents.income_analyzer import income_analyzer
-from agents.debt_analyzer import debt_analyzer
-from agents.collateral_evaluator import collateral_evaluator
-from agents.risk_scorer import risk_scorer
-from agents.decision_writer import decision_writer
+from agents.registry import AGENT_NAMES, get_agent, warm_up_agents, built_agents
 
 __all__ = [
-    "financial_data_collector",
-    "income_analyzer", 
-    "debt_analyzer",
-    "collateral_evaluator",
-    "risk_scorer",
-    "decision_writer"
+    "AGENT_NAMES",
+    "get_agent",
+    "warm_up_agents",
+    "built_agents",
 ]
@@ -3,36 +3,93 @@ Base Agent Configuration
 Shared configuration and utilities for all credit risk agents
 """
 
-from langchain_openai import ChatOpenAI
+import asyncio
+import random
+
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel
-from typing import Type, Optional
+from typing import Type, Optional, Dict, Any, List, TYPE_CHECKING
+from agents.http_client import get_async_http_client, REQUEST_TIMEOUT
+from agents.llm_scheduler import get_llm_scheduler
+from agents.prompt_payload import encode_prompt_inputs, count_tokens
+from agents.response_cache import get_response_cache
 from config.settings import settings
 from config.logging_config import get_logger
+from monitoring.metrics import llm_retries
 
 logger = get_logger(__name__) # Logger for the module 
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+# HTTP statuses retried after a failed LLM call (as the OpenAI SDK does), besides 5xx
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 8.0
+
 
-def get_llm(temperature: Optional[float] = None) -> ChatOpenAI:
+def get_llm(temperature: Optional[float] = None, max_retries: Optional[int] = None) -> "ChatOpenAI":
     """
     Get configured LLM instance.
     
+    All instances share one pooled async HTTP client, so connections are
+    kept alive and reused across agents and requests.
+    
     Args:
         temperature: Override default temperature if needed
+        max_retries: Override the SDK's own retries (default settings.openai_max_retries)
         
     Returns:
         Configured ChatOpenAI instance
     """
+    if not settings.openai_api_key:
+        raise ValueError("OPENAI_API_KEY is not set; it is required to build LLM agents")
+    
+    # Imported here: the OpenAI SDK accounts for about half of the app import time
+    from langchain_openai import ChatOpenAI
+    
     return ChatOpenAI(
         model=settings.openai_model,
         temperature=temperature if temperature is not None else settings.openai_temperature,
         api_key=settings.openai_api_key,
-        max_retries=3,
-        request_timeout=60
+        max_retries=max_retries if max_retries is not None else settings.openai_max_retries,
+        request_timeout=REQUEST_TIMEOUT,
+        http_async_client=get_async_http_client()
     )
 
 
+def retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """
+    Backoff before retrying a failed LLM call.
+    
+    Args:
+        error: Exception raised by the call
+        attempt: Number of retries already made
+        
+    Returns:
+        Seconds to wait (the provider's Retry-After if given, else jittered
+        exponential backoff), or None if the error is not transient
+    """
+    import openai
+    
+    retry_after = None
+    if isinstance(error, openai.APIStatusError):
+        if error.status_code not in RETRYABLE_STATUS_CODES and error.status_code < 500:
+            return None
+        retry_after = error.response.headers.get("retry-after")
+    elif not isinstance(error, openai.APIConnectionError):  # Includes timeouts
+        return None
+    
+    try:
+        return min(max(float(retry_after), 0.0), RETRY_MAX_DELAY_SECONDS)
+    except (TypeError, ValueError):
+        delay = min(RETRY_BASE_DELAY_SECONDS * 2 ** attempt, RETRY_MAX_DELAY_SECONDS)
+        return delay * random.uniform(0.75, 1.0)
+
+
 def create_agent_prompt(
     system_message: str,
     include_history: bool = False
@@ -90,6 +147,125 @@ def create_structured_agent(
     return chain
 
 
+class CachedAgentChain:
+    """
+    Agent chain (prompt → LLM → structured output) with a response cache in front.
+    
+    Dict and list inputs are projected onto the agent's declared payload fields
+    and compactly encoded before rendering. The rendered prompt, model,
+    temperature and output schema form the cache key, so an identical request
+    is answered from the cache without an LLM call.
+    """
+    
+    def __init__(
+        self,
+        prompt: ChatPromptTemplate,
+        output_model: Type[BaseModel],
+        agent_name: str,
+        temperature: Optional[float] = None,
+        payload_fields: Optional[Dict[str, List[str]]] = None
+    ):
+        self.prompt = prompt
+        self.output_model = output_model
+        self.agent_name = agent_name
+        self.payload_fields = payload_fields
+        self.temperature = temperature if temperature is not None else settings.openai_temperature
+        # Scheduled calls retry through the scheduler (see _call_llm), not inside the SDK
+        max_retries = 0 if get_llm_scheduler() is not None else None
+        self.structured_llm = get_llm(self.temperature, max_retries).with_structured_output(output_model)
+    
+    async def ainvoke(self, inputs: Dict[str, Any], config: Optional[RunnableConfig] = None) -> BaseModel:
+        """
+        Invoke the agent, serving identical requests from the response cache.
+        
+        Args:
+            inputs: Prompt template variables (dicts/lists are projected and encoded)
+            config: Optional runnable config (callbacks, tags, metadata)
+            
+        Returns:
+            Structured output model instance
+        """
+        prompt_value = await self.prompt.ainvoke(
+            encode_prompt_inputs(inputs, self.payload_fields),
+            config=config
+        )
+        cache = get_response_cache()
+        
+        if cache is None:
+            return await self._call_llm(prompt_value, config)
+        
+        key = cache.make_key(
+            prompt_value.to_messages(),
+            settings.openai_model,
+            self.temperature,
+            self.output_model.__name__
+        )
+        cached = await cache.get(key, self.agent_name)
+        if cached is not None:
+            logger.debug(f"Response cache hit for {self.agent_name}")
+            return self.output_model.model_validate_json(cached)
+        
+        result = await self._call_llm(prompt_value, config)
+        await cache.set(key, result.model_dump_json())
+        return result
+    
+    async def _call_llm(self, prompt_value: PromptValue, config: Optional[RunnableConfig]) -> BaseModel:
+        """
+        Send the rendered prompt to the LLM once the rate limit scheduler grants capacity.
+        
+        Transient failures (429, 5xx, connection errors) are retried up to
+        settings.openai_max_retries times; every retry takes capacity from the
+        scheduler again, so retries after a 429 stay within the rate limits.
+        """
+        scheduler = get_llm_scheduler()
+        if scheduler is None:
+            return await self.structured_llm.ainvoke(prompt_value, config=config)
+        
+        estimated_tokens = (
+            sum(count_tokens(m.content) for m in prompt_value.to_messages())
+            + settings.llm_expected_output_tokens
+        )
+        attempt = 0
+        while True:
+            await scheduler.acquire(estimated_tokens, self.agent_name)
+            try:
+                return await self.structured_llm.ainvoke(prompt_value, config=config)
+            except Exception as e:
+                delay = retry_delay(e, attempt) if attempt < settings.openai_max_retries else None
+                if delay is None:
+                    raise
+                attempt += 1
+                llm_retries.labels(agent=self.agent_name).inc()
+                logger.warning(
+                    f"LLM call for {self.agent_name} failed ({type(e).__name__}); "
+                    f"retry {attempt}/{settings.openai_max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+
+def create_agent_chain(
+    prompt: ChatPromptTemplate,
+    output_model: Type[BaseModel],
+    agent_name: str,
+    temperature: Optional[float] = None,
+    payload_fields: Optional[Dict[str, List[str]]] = None
+) -> CachedAgentChain:
+    """
+    Create a cached agent chain from a prompt template.
+    
+    Args:
+        prompt: Agent prompt template
+        output_model: Pydantic model for structured output
+        agent_name: Agent name used for cache metrics
+        temperature: Optional temperature override
+        payload_fields: Field paths the agent needs per prompt variable
+        
+    Returns:
+        Configured CachedAgentChain
+    """
+    return CachedAgentChain(prompt, output_model, agent_name, temperature, payload_fields)
+
+
 BANKING_CONTEXT = """
 You are an expert banking analyst specializing in credit risk assessment.
 You operate under strict regulatory frameworks including:
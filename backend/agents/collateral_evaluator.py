@@ -4,7 +4,7 @@ Evaluates collateral quality and loan-to-value metrics
 """
 
 from langchain_core.prompts import ChatPromptTemplate
-from agents.base_agent import get_llm, BANKING_CONTEXT
+from agents.base_agent import create_agent_chain, BANKING_CONTEXT
 from app.models import CollateralEvaluation
 from config.logging_config import get_logger
 
@@ -111,11 +111,24 @@ Focus on interpreting them and providing qualitative insights about marketabilit
 legal considerations, and market conditions.""")
 ])
 
+# Fields sent to this agent per prompt variable (see agents/prompt_payload.py)
+PAYLOAD_FIELDS = {
+    "collateral_info": [
+        "collateral_type",
+        "description",
+        "estimated_value",
+        "valuation_date",
+        "valuation_source",
+        "encumbrances",
+        "insurance_coverage",
+    ],
+}
+
 def get_collateral_evaluator():
     """Get the Collateral Evaluator agent chain."""
-    llm = get_llm()
-    structured_llm = llm.with_structured_output(CollateralEvaluation)
-    chain = collateral_evaluator_prompt | structured_llm
-    return chain
-
-collateral_evaluator = get_collateral_evaluator()
+    return create_agent_chain(
+        collateral_evaluator_prompt,
+        CollateralEvaluation,
+        "collateral_evaluator",
+        payload_fields=PAYLOAD_FIELDS
+    )
@@ -4,7 +4,7 @@ Analyzes existing debt obligations and calculates key ratios
 """
 
 from langchain_core.prompts import ChatPromptTemplate
-from agents.base_agent import get_llm, BANKING_CONTEXT
+from agents.base_agent import create_agent_chain, BANKING_CONTEXT
 from app.models import DebtAnalysis
 from config.logging_config import get_logger
 
@@ -99,11 +99,31 @@ interpreting them and providing qualitative insights about debt management,
 composition quality, and sustainability.""")
 ])
 
+# Fields sent to this agent per prompt variable (see agents/prompt_payload.py)
+PAYLOAD_FIELDS = {
+    "existing_debts": [
+        "debt_type",
+        "original_amount",
+        "current_balance",
+        "monthly_payment",
+        "interest_rate",
+        "remaining_months",
+        "is_secured",
+        "payment_history",
+    ],
+    "income_analysis": [
+        "total_monthly_income",
+        "income_stability_score",
+        "income_trend",
+        "verification_status",
+    ],
+}
+
 def get_debt_analyzer():
     """Get the Debt Analyzer agent chain."""
-    llm = get_llm()
-    structured_llm = llm.with_structured_output(DebtAnalysis)
-    chain = debt_analyzer_prompt | structured_llm
-    return chain
-
-debt_analyzer = get_debt_analyzer()
+    return create_agent_chain(
+        debt_analyzer_prompt,
+        DebtAnalysis,
+        "debt_analyzer",
+        payload_fields=PAYLOAD_FIELDS
+    )
@@ -4,7 +4,7 @@ Generates final credit decision and comprehensive report
 """
 
 from langchain_core.prompts import ChatPromptTemplate
-from agents.base_agent import get_llm, BANKING_CONTEXT
+from agents.base_agent import create_agent_chain, BANKING_CONTEXT
 from app.models import CreditDecision, DecisionType
 from config.logging_config import get_logger
 
@@ -63,9 +63,9 @@ LOAN TERMS GUIDELINES (if approved):
 - Amount as requested or reduced based on payment capacity
 - Monthly payment must align with affordability analysis
 
-NOTE: Loan terms (interest rate, monthly payment) will be provided 
-pre-calculated based on the applicant's credit profile and risk assessment.
-Focus on determining the appropriate decision type and conditions.
+NOTE: Choose the approved amount, term and interest rate. The monthly payment,
+total interest, total repayment and APR are recomputed from the amortization
+schedule of those terms, so focus on the decision type and conditions.
 
 Output your decision in the required structured format with full justification.
 """
@@ -74,7 +74,7 @@ decision_writer_prompt = ChatPromptTemplate.from_messages([
     ("system", SYSTEM_PROMPT),
     ("human", """Generate credit decision based on complete analysis:
 
-APPLICANT: {applicant_name}
+APPLICATION ID: {application_id}
 
 LOAN REQUEST:
 - Amount: {requested_amount} EUR
@@ -107,11 +107,49 @@ Generate:
 8. Validity period for the decision""")
 ])
 
+# Fields sent to this agent per prompt variable (see agents/prompt_payload.py)
+PAYLOAD_FIELDS = {
+    "risk_assessment": [
+        "overall_risk_level",
+        "risk_score",
+        "probability_of_default",
+        "loss_given_default",
+        "expected_loss",
+        "risk_factors",
+        "mitigating_factors",
+        "regulatory_flags",
+        "basel_risk_weight",
+    ],
+    "income_analysis": [
+        "income_sustainability",
+        "max_affordable_payment",
+        "stress_test_result",
+    ],
+    "debt_analysis": [
+        "debt_to_income_ratio",
+        "projected_dti_ratio",
+        "debt_service_coverage_ratio",
+        "payment_shock_risk",
+        "debt_red_flags",
+    ],
+    "collateral_evaluation": [
+        "collateral_present",
+        "loan_to_value_ratio",
+        "collateral_quality",
+        "collateral_coverage_ratio",
+    ],
+    "financial_summary": [
+        "verification_status",
+        "red_flags",
+    ],
+}
+
 def get_decision_writer():
     """Get the Decision Writer agent chain."""
-    llm = get_llm(temperature=0.2)
-    structured_llm = llm.with_structured_output(CreditDecision)
-    chain = decision_writer_prompt | structured_llm
-    return chain
-
-decision_writer = get_decision_writer()
+    return create_agent_chain(
+        decision_writer_prompt,
+        CreditDecision,
+        "decision_writer",
+        temperature=0.2,
+        payload_fields=PAYLOAD_FIELDS
+    )
@@ -4,7 +4,7 @@ Collects and validates financial data from loan applications
 """
 
 from langchain_core.prompts import ChatPromptTemplate
-from agents.base_agent import get_llm, BANKING_CONTEXT
+from agents.base_agent import create_agent_chain, BANKING_CONTEXT
 from app.models import FinancialDataSummary
 from config.logging_config import get_logger
 
@@ -59,11 +59,33 @@ Provide a comprehensive financial data summary including:
 - Any red flags identified""")
 ])
 
+# Fields sent to this agent per prompt variable (see agents/prompt_payload.py)
+PAYLOAD_FIELDS = {
+    "application_data": [
+        "applicant.date_of_birth",
+        "applicant.nationality",
+        "employment",
+        "existing_debts.debt_type",
+        "existing_debts.current_balance",
+        "existing_debts.monthly_payment",
+        "existing_debts.interest_rate",
+        "existing_debts.remaining_months",
+        "existing_debts.payment_history",
+        "collateral.collateral_type",
+        "collateral.estimated_value",
+        "collateral.encumbrances",
+        "loan_request.loan_purpose",
+        "loan_request.requested_amount",
+        "loan_request.requested_term_months",
+        "credit_history",
+    ],
+}
+
 def get_financial_data_collector():
     """Get the Financial Data Collector agent chain."""
-    llm = get_llm() # Get the LLM instance
-    structured_llm = llm.with_structured_output(FinancialDataSummary) # Configure structured output
-    chain = financial_data_collector_prompt | structured_llm # Create the chain : Prompt → LLM → Structured Output
-    return chain # the complete agent pipeline
-
-financial_data_collector = get_financial_data_collector()
+    return create_agent_chain(
+        financial_data_collector_prompt,
+        FinancialDataSummary,
+        "financial_data_collector",
+        payload_fields=PAYLOAD_FIELDS
+    )
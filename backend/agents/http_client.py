@@ -0,0 +1,139 @@
+"""
+Shared HTTP Client
+Process-wide pooled httpx client reused by every ChatOpenAI instance.
+
+Without it each agent chain owns its own OpenAI client and connection pool,
+so the six agents of one workflow pay separate TCP/TLS handshakes. The shared
+client keeps connections alive across agents and requests, caps the number of
+provider connections and negotiates HTTP/2 when the h2 package is installed.
+"""
+
+import importlib.util
+from functools import lru_cache
+
+import httpx
+
+from config.settings import settings
+from config.logging_config import get_logger
+from monitoring.metrics import http_pool_connections_open, http_pool_in_flight, http_pool_utilization
+
+logger = get_logger(__name__)
+
+# Per-request timeout (seconds), matches the previous ChatOpenAI request_timeout
+REQUEST_TIMEOUT = 60.0
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response body stream that releases its in-flight slot when closed"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, transport: "InstrumentedTransport"):
+        self._stream = stream
+        self._transport = transport
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._transport._release()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    Connection-pooling transport that reports request concurrency and pool utilisation.
+
+    A request counts as in flight from the moment it is sent until its
+    response body is closed. With HTTP/2 many in-flight requests share one
+    connection, so utilisation is measured on the connections the pool
+    actually holds open, refreshed whenever a request starts or finishes.
+    """
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, max_connections: int):
+        self._transport = transport
+        self._max_connections = max_connections
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests sent whose response body is not closed yet"""
+        return self._in_flight
+
+    @property
+    def open_connections(self) -> int:
+        """Number of provider connections currently open in the pool"""
+        # httpx does not expose its httpcore pool publicly
+        pool = getattr(self._transport, "_pool", None)
+        if pool is None:
+            return 0
+        return sum(not connection.is_closed() for connection in pool.connections)
+
+    def _update_metrics(self) -> None:
+        open_connections = self.open_connections
+        http_pool_in_flight.set(self._in_flight)
+        http_pool_connections_open.set(open_connections)
+        http_pool_utilization.set(open_connections / self._max_connections)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._update_metrics()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._in_flight += 1
+        self._update_metrics()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._release()
+            raise
+        response.stream = _TrackedStream(response.stream, self)
+        # The pool may have opened a connection for this request
+        self._update_metrics()
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _http2_available() -> bool:
+    """Whether HTTP/2 is enabled and supported by the installed packages"""
+    return settings.http2_enabled and importlib.util.find_spec("h2") is not None
+
+
+@lru_cache()
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide pooled async HTTP client configured from settings.
+
+    Returns:
+        Shared httpx.AsyncClient with keep-alive and bounded pool limits
+    """
+    limits = httpx.Limits(
+        max_connections=settings.http_pool_max_connections,
+        max_keepalive_connections=settings.http_pool_max_keepalive,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds
+    )
+    http2 = _http2_available()
+    transport = InstrumentedTransport(
+        httpx.AsyncHTTPTransport(limits=limits, http2=http2),
+        max_connections=settings.http_pool_max_connections
+    )
+
+    logger.info(
+        f"Shared HTTP client: max_connections={settings.http_pool_max_connections}, "
+        f"max_keepalive={settings.http_pool_max_keepalive}, http2={http2}"
+    )
+    return httpx.AsyncClient(transport=transport, timeout=REQUEST_TIMEOUT)
+
+
+async def close_async_http_client() -> None:
+    """Close the shared client (if created) and release its pooled connections"""
+    if get_async_http_client.cache_info().currsize == 0:
+        return
+    await get_async_http_client().aclose()
+    get_async_http_client.cache_clear()
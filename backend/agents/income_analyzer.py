@@ -4,7 +4,7 @@ Performs deep analysis of applicant income and affordability
 """
 
 from langchain_core.prompts import ChatPromptTemplate
-from agents.base_agent import get_llm, BANKING_CONTEXT
+from agents.base_agent import create_agent_chain, BANKING_CONTEXT
 from app.models import IncomeAnalysis
 from config.logging_config import get_logger
 
@@ -20,8 +20,8 @@ You are the Income Analyzer Agent. Your role is to:
 4. IDENTIFY income-related risks and opportunities
 5. PROVIDE recommendations based on calculations
 
-NOTE: Mathematical calculations (annual income, max affordable payment, stress tests) 
-are provided to you pre-calculated. Focus on QUALITATIVE analysis:
+NOTE: Mathematical calculations (annual income, max affordable payment, stress tests,
+Monte Carlo DTI breach probability) are provided to you pre-calculated. Focus on QUALITATIVE analysis:
 - Income source quality and stability
 - Employment sector resilience
 - Income growth potential
@@ -86,11 +86,29 @@ IMPORTANT: Use the pre-calculated values. Focus on interpreting them and providi
 qualitative insights about income stability, reliability, and sustainability.""")
 ])
 
+# Fields sent to this agent per prompt variable (see agents/prompt_payload.py)
+PAYLOAD_FIELDS = {
+    "financial_summary": [
+        "total_monthly_income",
+        "income_stability_score",
+        "income_sources",
+        "employment_stability",
+        "income_trend",
+        "verification_status",
+        "red_flags",
+    ],
+    "application_data": [
+        "applicant.date_of_birth",
+        "employment",
+        "loan_request.loan_purpose",
+    ],
+}
+
 def get_income_analyzer():
     """Get the Income Analyzer agent chain."""
-    llm = get_llm()
-    structured_llm = llm.with_structured_output(IncomeAnalysis)
-    chain = income_analyzer_prompt | structured_llm
-    return chain
-
-income_analyzer = get_income_analyzer()
+    return create_agent_chain(
+        income_analyzer_prompt,
+        IncomeAnalysis,
+        "income_analyzer",
+        payload_fields=PAYLOAD_FIELDS
+    )
@@ -0,0 +1,118 @@
+"""
+LLM Request Scheduler
+Process-wide asyncio token-bucket scheduler enforcing the provider rate limits.
+
+Every agent LLM call acquires capacity from two buckets before it is sent:
+- requests per minute (settings.rate_limit_requests)
+- tokens per minute (settings.rate_limit_tokens), charged with the estimated
+  prompt tokens plus the reserved output tokens
+
+Waiters are served strictly in arrival order, so under a burst throughput
+levels off at the provider limit instead of collapsing into 429 retries.
+"""
+
+import asyncio
+import time
+from functools import lru_cache
+from typing import Optional
+
+from config.settings import settings
+from config.logging_config import get_logger
+from monitoring.metrics import llm_scheduler_queue_depth, llm_scheduler_wait
+
+logger = get_logger(__name__)
+
+
+class LLMRequestScheduler:
+    """
+    FIFO token-bucket scheduler for LLM calls (requests/min and tokens/min).
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._updated_at = time.monotonic()
+        # asyncio.Lock wakes waiters in FIFO order: only the head of the queue
+        # waits for bucket capacity, everyone else queues behind it
+        self._lock = asyncio.Lock()
+        self._queue_depth = 0
+
+    def _refill(self) -> None:
+        """Add the capacity accrued since the last refill"""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._available_requests = min(
+            self.requests_per_minute,
+            self._available_requests + elapsed * self.requests_per_minute / 60
+        )
+        self._available_tokens = min(
+            self.tokens_per_minute,
+            self._available_tokens + elapsed * self.tokens_per_minute / 60
+        )
+
+    def _seconds_until_available(self, tokens: float) -> float:
+        """Time until both buckets hold enough capacity for one call"""
+        request_wait = (1 - self._available_requests) * 60 / self.requests_per_minute
+        token_wait = (tokens - self._available_tokens) * 60 / self.tokens_per_minute
+        return max(request_wait, token_wait, 0.0)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls currently waiting for capacity"""
+        return self._queue_depth
+
+    async def acquire(self, estimated_tokens: int, agent: str = "unknown") -> float:
+        """
+        Wait for rate limit capacity and consume it.
+
+        Args:
+            estimated_tokens: Estimated total tokens (prompt + output) of the call
+            agent: Agent name (metrics label)
+
+        Returns:
+            Seconds spent waiting
+        """
+        # A single call larger than the per-minute budget would never fit the bucket
+        tokens = min(float(estimated_tokens), float(self.tokens_per_minute))
+        start = time.monotonic()
+
+        self._queue_depth += 1
+        llm_scheduler_queue_depth.set(self._queue_depth)
+        try:
+            async with self._lock:
+                while True:
+                    self._refill()
+                    if self._available_requests >= 1 and self._available_tokens >= tokens:
+                        self._available_requests -= 1
+                        self._available_tokens -= tokens
+                        break
+                    await asyncio.sleep(self._seconds_until_available(tokens))
+        finally:
+            self._queue_depth -= 1
+            llm_scheduler_queue_depth.set(self._queue_depth)
+
+        waited = time.monotonic() - start
+        llm_scheduler_wait.labels(agent=agent).observe(waited)
+        if waited > 1:
+            logger.info(f"LLM call for {agent} waited {waited:.2f}s for rate limit capacity")
+        return waited
+
+
+@lru_cache()
+def get_llm_scheduler() -> Optional[LLMRequestScheduler]:
+    """
+    Get the process-wide scheduler configured from the rate limit settings.
+
+    Returns:
+        Shared scheduler, or None if scheduling is disabled
+    """
+    if not settings.llm_scheduler_enabled:
+        return None
+
+    return LLMRequestScheduler(
+        requests_per_minute=settings.rate_limit_requests,
+        tokens_per_minute=settings.rate_limit_tokens
+    )
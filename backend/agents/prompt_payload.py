@@ -0,0 +1,146 @@
+"""
+Prompt Payload Builder
+Compact, field-projected encoding of the data sent to each agent.
+
+Each agent module declares PAYLOAD_FIELDS: for every prompt variable, the
+dotted field paths it actually needs (paths apply element-wise to lists).
+Dict and list inputs are projected onto those paths and encoded as
+indentation-free JSON with enums unwrapped, None values dropped and floats
+rounded, so agents no longer receive PII or earlier agents' prose they do
+not use.
+"""
+
+import json
+import math
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from config.settings import settings
+
+# Decimal places kept for floats in prompt payloads
+FLOAT_PRECISION = 4
+
+# Fallback characters-per-token ratio when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+
+def project_fields(data: Any, fields: List[str]) -> Any:
+    """
+    Keep only the given dotted field paths of a dict (element-wise for lists).
+
+    Args:
+        data: Dict, list of dicts or scalar
+        fields: Dotted paths, e.g. ["employment", "applicant.date_of_birth"]
+
+    Returns:
+        Projected copy of data
+    """
+    if isinstance(data, list):
+        return [project_fields(item, fields) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    result: Dict[str, Any] = {}
+    nested: Dict[str, List[str]] = {}
+    for field in fields:
+        head, _, rest = field.partition(".")
+        if head not in data:
+            continue
+        if rest:
+            nested.setdefault(head, []).append(rest)
+        else:
+            result[head] = data[head]
+
+    for head, rest_fields in nested.items():
+        if head not in result:
+            result[head] = project_fields(data[head], rest_fields)
+
+    return result
+
+
+def _compact(value: Any) -> Any:
+    """Convert a value into its smallest JSON-ready form"""
+    if isinstance(value, dict):
+        return {k: _compact(v) for k, v in value.items() if v is not None and v != [] and v != {}}
+    if isinstance(value, (list, tuple)):
+        return [_compact(v) for v in value]
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return str(value)
+        rounded = round(value, FLOAT_PRECISION)
+        return int(rounded) if rounded.is_integer() else rounded
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def encode_payload(data: Any, fields: Optional[List[str]] = None) -> str:
+    """
+    Encode data for a prompt: optional field projection, then compact JSON.
+
+    Args:
+        data: Dict or list to encode
+        fields: Optional dotted field paths to keep
+
+    Returns:
+        Indentation-free JSON string
+    """
+    if fields is not None:
+        data = project_fields(data, fields)
+    return json.dumps(_compact(data), separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def encode_prompt_inputs(
+    inputs: Dict[str, Any],
+    payload_fields: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, Any]:
+    """
+    Encode structured prompt variables; scalars only have enums unwrapped.
+
+    Args:
+        inputs: Prompt template variables
+        payload_fields: Agent's declared field paths per variable
+
+    Returns:
+        Prompt variables ready for template rendering
+    """
+    payload_fields = payload_fields or {}
+    return {
+        name: encode_payload(value, payload_fields.get(name)) if isinstance(value, (dict, list)) else _compact(value)
+        for name, value in inputs.items()
+    }
+
+
+@lru_cache()
+def _get_encoding():
+    """Tokenizer for the configured model, or None if unavailable (e.g. offline)"""
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(settings.openai_model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens for the configured model (character estimate without a tokenizer).
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Token count
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(encoding.encode(text))
@@ -0,0 +1,79 @@
+"""
+Agent Registry
+Lazily built, process-wide agent chains.
+
+Agent modules only define prompts, payload fields and a get_<agent>() factory;
+nothing is built at import time, so importing graphs, services or calculations
+needs neither OPENAI_API_KEY nor ChatOpenAI construction. Each chain is built
+on first use, or up front by warm_up_agents() during application startup.
+"""
+
+import importlib
+import threading
+import time
+from typing import Dict, List
+
+from agents.base_agent import CachedAgentChain
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Agents in workflow order; each module agents/<name>.py defines get_<name>()
+AGENT_NAMES: List[str] = [
+    "financial_data_collector",
+    "income_analyzer",
+    "debt_analyzer",
+    "collateral_evaluator",
+    "risk_scorer",
+    "decision_writer",
+]
+
+_agents: Dict[str, CachedAgentChain] = {}
+_lock = threading.Lock()
+
+
+def get_agent(name: str) -> CachedAgentChain:
+    """
+    Get an agent chain, building it on first use.
+
+    Args:
+        name: Agent name (see AGENT_NAMES)
+
+    Returns:
+        Shared agent chain
+    """
+    agent = _agents.get(name)
+    if agent is not None:
+        return agent
+
+    if name not in AGENT_NAMES:
+        raise KeyError(f"Unknown agent: {name}")
+
+    with _lock:
+        agent = _agents.get(name)
+        if agent is None:
+            module = importlib.import_module(f"agents.{name}")
+            agent = getattr(module, f"get_{name}")()
+            _agents[name] = agent
+            logger.debug(f"Built agent chain: {name}")
+    return agent
+
+
+def warm_up_agents() -> float:
+    """
+    Build every agent chain ahead of the first request.
+
+    Returns:
+        Seconds spent building the chains
+    """
+    start = time.perf_counter()
+    for name in AGENT_NAMES:
+        get_agent(name)
+    duration = time.perf_counter() - start
+    logger.info(f"Warmed up {len(AGENT_NAMES)} agent chains in {duration * 1000:.1f}ms")
+    return duration
+
+
+def built_agents() -> List[str]:
+    """Names of the agent chains built so far"""
+    return [name for name in AGENT_NAMES if name in _agents]
@@ -0,0 +1,211 @@
+"""
+LLM Response Cache
+Content-addressed cache for structured agent outputs.
+
+Entries are keyed by a SHA-256 hash of the rendered prompt messages, the model
+name, the temperature and the output schema, so resubmits, client retries and
+QA replays of an identical prompt skip the LLM call entirely.
+
+Two tiers:
+- In-memory LRU with TTL (per process)
+- Optional SQLite file that survives restarts
+
+The memory tier is read and written inline. The sqlite3 calls block, so the
+SQLite tier runs in worker threads (asyncio.to_thread) and never on the event
+loop; it has its own lock, so memory hits never wait for disk I/O.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage
+
+from config.settings import settings
+from config.logging_config import get_logger
+from monitoring.metrics import llm_cache_hits, llm_cache_misses, llm_cache_evictions
+
+logger = get_logger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Two-tier (memory LRU + optional SQLite) cache of serialized agent outputs.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: int = 3600,
+        sqlite_path: Optional[str] = None,
+        sqlite_ttl_seconds: int = 86400
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.sqlite_ttl_seconds = sqlite_ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.Lock()  # memory tier
+        self._db_lock = threading.Lock()  # SQLite connection, shared by worker threads
+        self._db: Optional[sqlite3.Connection] = None
+
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._db.commit()
+            logger.info(f"LLM response cache persistent tier: {sqlite_path}")
+
+    @staticmethod
+    def make_key(
+        messages: Sequence[BaseMessage],
+        model: str,
+        temperature: float,
+        output_schema: str
+    ) -> str:
+        """
+        Build the content address of a request.
+
+        Args:
+            messages: Rendered prompt messages
+            model: Model name
+            temperature: Sampling temperature
+            output_schema: Name of the structured output model
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(
+            {
+                "messages": [[m.type, m.content] for m in messages],
+                "model": model,
+                "temperature": temperature,
+                "schema": output_schema,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str, agent: str) -> Optional[str]:
+        """
+        Look up a cached value, promoting persistent hits into memory.
+
+        The memory tier is checked inline; the SQLite tier is only read (in a
+        worker thread) on a memory miss.
+
+        Args:
+            key: Cache key from make_key
+            agent: Agent name (metrics label)
+
+        Returns:
+            Serialized output, or None on a miss
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if now - stored_at <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    llm_cache_hits.labels(agent=agent, tier="memory").inc()
+                    return value
+                del self._entries[key]
+                llm_cache_evictions.labels(tier="memory", reason="expired").inc()
+
+        if self._db is not None:
+            value = await asyncio.to_thread(self._get_persistent, key, now)
+            if value is not None:
+                with self._lock:
+                    self._store_in_memory(key, value, now)
+                llm_cache_hits.labels(agent=agent, tier="sqlite").inc()
+                return value
+
+        llm_cache_misses.labels(agent=agent).inc()
+        return None
+
+    def _get_persistent(self, key: str, now: float) -> Optional[str]:
+        """SQLite tier lookup; expired entries are deleted"""
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT value, stored_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, stored_at = row
+            if now - stored_at <= self.sqlite_ttl_seconds:
+                return value
+            self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._db.commit()
+        llm_cache_evictions.labels(tier="sqlite", reason="expired").inc()
+        return None
+
+    async def set(self, key: str, value: str) -> None:
+        """
+        Store a serialized output in every enabled tier.
+
+        Args:
+            key: Cache key from make_key
+            value: Serialized output
+        """
+        now = time.time()
+        with self._lock:
+            self._store_in_memory(key, value, now)
+        if self._db is not None:
+            await asyncio.to_thread(self._set_persistent, key, value, now)
+
+    def _set_persistent(self, key: str, value: str, stored_at: float) -> None:
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, value, stored_at)
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Drop all entries from every tier"""
+        with self._lock:
+            self._entries.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+
+    def _store_in_memory(self, key: str, value: str, stored_at: float) -> None:
+        """Insert into the LRU tier, evicting the least recently used entries (lock held)"""
+        self._entries[key] = (stored_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            llm_cache_evictions.labels(tier="memory", reason="capacity").inc()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@lru_cache()
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Get the process-wide response cache configured from settings.
+
+    Returns:
+        Shared cache instance, or None if caching is disabled
+    """
+    if not settings.llm_cache_enabled:
+        return None
+
+    return LLMResponseCache(
+        max_entries=settings.llm_cache_max_entries,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        sqlite_path=settings.llm_cache_sqlite_path,
+        sqlite_ttl_seconds=settings.llm_cache_sqlite_ttl_seconds
+    )
@@ -4,7 +4,7 @@ Calculates comprehensive risk scores and probability of default
 """
 
 from langchain_core.prompts import ChatPromptTemplate
-from agents.base_agent import get_llm, BANKING_CONTEXT
+from agents.base_agent import create_agent_chain, BANKING_CONTEXT
 from app.models import RiskAssessment
 from config.logging_config import get_logger
 
@@ -91,11 +91,60 @@ interpreting them and providing qualitative insights about risk factors,
 mitigating circumstances, and risk management strategies.""")
 ])
 
+# Fields sent to this agent per prompt variable (see agents/prompt_payload.py)
+PAYLOAD_FIELDS = {
+    "financial_summary": [
+        "income_stability_score",
+        "income_trend",
+        "verification_status",
+        "red_flags",
+        "data_quality_score",
+    ],
+    "income_analysis": [
+        "income_sustainability",
+        "income_diversification",
+        "disposable_income_monthly",
+        "max_affordable_payment",
+        "calculations.stability_score",
+        "calculations.stress_test_passed",
+        "calculations.stress_simulation.breach_probability",
+    ],
+    "debt_analysis": [
+        "debt_to_income_ratio",
+        "projected_dti_ratio",
+        "debt_service_coverage_ratio",
+        "payment_shock_risk",
+        "debt_red_flags",
+        "calculations.debt_burden_level",
+    ],
+    "collateral_evaluation": [
+        "collateral_present",
+        "collateral_type",
+        "loan_to_value_ratio",
+        "collateral_quality",
+        "collateral_coverage_ratio",
+        "collateral_risks",
+    ],
+    "credit_history": [
+        "credit_score",
+        "accounts_open",
+        "accounts_closed",
+        "oldest_account_years",
+        "recent_inquiries",
+        "delinquencies_30_days",
+        "delinquencies_60_days",
+        "delinquencies_90_days",
+        "bankruptcies",
+        "foreclosures",
+        "collections",
+    ],
+}
+
 def get_risk_scorer():
     """Get the Risk Scorer agent chain."""
-    llm = get_llm()
-    structured_llm = llm.with_structured_output(RiskAssessment)
-    chain = risk_scorer_prompt | structured_llm
-    return chain
-
-risk_scorer = get_risk_scorer()
+    return create_agent_chain(
+        risk_scorer_prompt,
+        RiskAssessment,
+        "risk_scorer",
+        payload_fields=PAYLOAD_FIELDS
+    )
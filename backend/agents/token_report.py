@@ -0,0 +1,171 @@
+"""
+Prompt Token Report
+Input tokens per agent before and after payload projection.
+
+Usage:
+    python -m agents.token_report ../examples/sample_application.json
+"""
+
+import importlib
+import json
+from typing import Any, Dict
+
+from agents.prompt_payload import encode_prompt_inputs, count_tokens, _get_encoding, CHARS_PER_TOKEN
+from config.settings import settings
+
+
+def _legacy_encode(name: str, value: Any) -> str:
+    """Encoding used before payload projection (full json.dumps of every field)"""
+    if not isinstance(value, (dict, list)):
+        return value
+    indent = 2 if name in ("application_data", "calculations") else None
+    return json.dumps(value, indent=indent, default=str)
+
+
+def _render_tokens(prompt, inputs: Dict[str, Any]) -> int:
+    """Input tokens of a rendered prompt"""
+    messages = prompt.format_messages(**inputs)
+    return sum(count_tokens(m.content) for m in messages)
+
+
+def token_report(application: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    """
+    Compare input tokens per agent before and after payload projection.
+
+    Earlier analyses are filled with the deterministic fast-mode templates so
+    the report needs no LLM calls.
+
+    Args:
+        application: Loan application as a dict (LoanApplication.model_dump())
+
+    Returns:
+        Mapping agent name -> {"before", "after", "saved_pct"}
+    """
+    # Agent modules hold the prompts and payload fields; no chains are built here
+    fdc, ia, da, ce, rs, dw = (
+        importlib.import_module(f"agents.{name}")
+        for name in (
+            "financial_data_collector",
+            "income_analyzer",
+            "debt_analyzer",
+            "collateral_evaluator",
+            "risk_scorer",
+            "decision_writer",
+        )
+    )
+    from graphs.deterministic_analysis import (
+        compute_income_calculations,
+        compute_debt_calculations,
+        compute_collateral_calculations,
+        compute_risk_calculations,
+        build_financial_summary,
+        build_income_analysis,
+        build_debt_analysis,
+        build_collateral_evaluation,
+        build_risk_assessment,
+    )
+
+    app = application
+    loan_request = app.get("loan_request", {})
+    income_calcs = compute_income_calculations(app)
+    debt_calcs = compute_debt_calculations(app)
+    collateral_calcs = compute_collateral_calculations(app)
+    risk_calcs = compute_risk_calculations(app, income_calcs, debt_calcs, collateral_calcs)
+
+    financial_summary = build_financial_summary(app).model_dump()
+    income_analysis = {**build_income_analysis(income_calcs).model_dump(), "calculations": income_calcs}
+    debt_analysis = {**build_debt_analysis(debt_calcs).model_dump(), "calculations": debt_calcs}
+    collateral_evaluation = {
+        **build_collateral_evaluation(collateral_calcs).model_dump(),
+        "calculations": collateral_calcs
+    }
+    risk_assessment = {
+        **build_risk_assessment(app, risk_calcs, income_calcs, debt_calcs, collateral_calcs).model_dump(),
+        "calculations": risk_calcs
+    }
+
+    applicant = app.get("applicant", {})
+    loan_inputs = {
+        "requested_amount": loan_request.get("requested_amount", 0),
+        "requested_term": loan_request.get("requested_term_months", 0),
+    }
+    agents = {
+        "financial_data_collector": (fdc, {"application_data": app}),
+        "income_analyzer": (ia, {
+            "financial_summary": financial_summary,
+            "application_data": app,
+            "calculations": income_calcs,
+            **loan_inputs
+        }),
+        "debt_analyzer": (da, {
+            "existing_debts": app.get("existing_debts", []),
+            "income_analysis": financial_summary,
+            "estimated_payment": debt_calcs["estimated_payment"],
+            "calculations": debt_calcs,
+            **loan_inputs
+        }),
+        "collateral_evaluator": (ce, {
+            "collateral_info": app.get("collateral") or "No collateral provided - unsecured loan",
+            "loan_purpose": loan_request.get("loan_purpose", "other"),
+            "calculations": collateral_calcs,
+            **loan_inputs
+        }),
+        "risk_scorer": (rs, {
+            "financial_summary": financial_summary,
+            "income_analysis": income_analysis,
+            "debt_analysis": debt_analysis,
+            "collateral_evaluation": collateral_evaluation,
+            "credit_history": app.get("credit_history", {}),
+            "loan_purpose": loan_request.get("loan_purpose", "other"),
+            "calculations": risk_calcs,
+            **loan_inputs
+        }),
+        "decision_writer": (dw, {
+            "risk_assessment": risk_assessment,
+            "income_analysis": income_analysis,
+            "debt_analysis": debt_analysis,
+            "collateral_evaluation": collateral_evaluation,
+            "financial_summary": financial_summary,
+            "loan_purpose": loan_request.get("loan_purpose", "other"),
+            **loan_inputs
+        }),
+    }
+
+    report = {}
+    for name, (module, inputs) in agents.items():
+        prompt = getattr(module, f"{name}_prompt")
+        before_inputs = {k: _legacy_encode(k, v) for k, v in inputs.items()}
+        after_inputs = encode_prompt_inputs(inputs, getattr(module, "PAYLOAD_FIELDS", None))
+        if name == "decision_writer":
+            # Previously "APPLICANT: <full name>", now "APPLICATION ID: <id>"
+            before_inputs["application_id"] = f"{applicant.get('first_name', '')} {applicant.get('last_name', '')}".strip()
+            after_inputs["application_id"] = app.get("application_id") or ""
+
+        before = _render_tokens(prompt, before_inputs)
+        after = _render_tokens(prompt, after_inputs)
+        report[name] = {
+            "before": before,
+            "after": after,
+            "saved_pct": round((before - after) / before * 100, 1) if before else 0
+        }
+
+    return report
+
+
+if __name__ == "__main__":
+    import sys
+    from app.models import LoanApplication
+
+    with open(sys.argv[1]) as f:
+        data = json.load(f)
+    application = LoanApplication(**data.get("application", data)).model_dump()
+
+    report = token_report(application)
+    tokenizer = "tiktoken" if _get_encoding() is not None else f"~{CHARS_PER_TOKEN} chars/token estimate"
+    print(f"Input tokens per agent ({settings.openai_model}, {tokenizer})")
+    print(f"{'agent':<26}{'before':>8}{'after':>8}{'saved':>8}")
+    for name, row in report.items():
+        print(f"{name:<26}{row['before']:>8}{row['after']:>8}{row['saved_pct']:>7}%")
+    total_before = sum(r["before"] for r in report.values())
+    total_after = sum(r["after"] for r in report.values())
+    print(f"{'total':<26}{total_before:>8}{total_after:>8}{(total_before - total_after) / total_before * 100:>7.1f}%")
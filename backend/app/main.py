@@ -3,6 +3,11 @@ FastAPI Application - Credit Risk Assessment AI
 Main entry point for the REST API
 """
 
+import time
+
+# Measured against settings.import_time_budget_seconds at startup
+_import_started = time.perf_counter()
+
 import sys
 import os
 from pathlib import Path
@@ -10,29 +15,52 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Header, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from contextlib import asynccontextmanager
-import json
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from app.models import (
+    AmortizationInstallment,
     AssessmentRequest,
     AssessmentResponse,
+    AssessmentJob,
+    BatchAssessmentRequest,
+    BulkValidationRequest,
+    BulkValidationResponse,
+    CreditAssessmentReport,
+    DecisionType,
+    JobStatus,
     HealthResponse,
     LoanApplication,
-    ProgressUpdate
+    ProgressUpdate,
+    ReportPage,
+    RiskLevel
 )
+from app.compression import CompressionMiddleware
+from app.responses import PydanticJSONResponse, parse_fields, sse_event, ndjson_line
 from services.credit_assessment_service import credit_assessment_service
+from services.job_queue import AssessmentJobQueue, get_job_queue
+from services.bulk_validation import validate_applications_bulk, validate_columns
+from services.report_store import ReportStore, get_report_store
+from services.admission import AdmissionTicket, WorkflowOverloadedError, get_admission_controller
+from graphs.checkpointing import CheckpointNotFoundError
+from graphs.deterministic_analysis import iter_loan_terms_schedule
+from agents import warm_up_agents
+from agents.http_client import close_async_http_client
 from config.settings import settings
 from config.logging_config import get_logger
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from monitoring.metrics import render_metrics, mark_process_dead
+from prometheus_client import CONTENT_TYPE_LATEST
 from fastapi.responses import Response
 
 logger = get_logger(__name__)
 
+import_duration_seconds = time.perf_counter() - _import_started
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -40,8 +68,29 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"LangSmith tracing: {settings.langsmith_tracing_enabled}")
+    
+    logger.info(f"app.main imported in {import_duration_seconds * 1000:.0f}ms")
+    if import_duration_seconds > settings.import_time_budget_seconds:
+        logger.warning(
+            f"Import time {import_duration_seconds:.2f}s exceeds budget "
+            f"of {settings.import_time_budget_seconds:.2f}s"
+        )
+    
+    # Build agent chains and open stores before the first request rather than at
+    # import time; with several workers this runs in each worker after it started
+    if settings.agent_warmup_enabled and settings.openai_api_key:
+        warm_up_agents()
+    await credit_assessment_service.warm_up()
+    
+    if settings.job_queue_enabled:
+        await get_job_queue().start(recover=settings.job_queue_recover_on_start)
     yield
     logger.info("Shutting down application")
+    if settings.job_queue_enabled:
+        await get_job_queue().stop()
+    await credit_assessment_service.close()
+    await close_async_http_client()
+    mark_process_dead()
 
 
 app = FastAPI(
@@ -79,6 +128,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+    )
+
 
 @app.get("/", tags=["Root"])
 async def root():
@@ -101,8 +158,55 @@ async def health_check():
     )
 
 
+def _report_fields(
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated report fields to return, e.g. credit_decision,risk_assessment.probability_of_default"
+    )
+) -> Optional[Dict[str, Any]]:
+    """Sparse field selection on a CreditAssessmentReport"""
+    try:
+        return parse_fields(fields, CreditAssessmentReport)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={"error": str(e)})
+
+
+def _response_fields(
+    report_include: Optional[Dict[str, Any]] = Depends(_report_fields)
+) -> Optional[Dict[str, Any]]:
+    """Sparse field selection on the report inside an AssessmentResponse (envelope kept)"""
+    if report_include is None:
+        return None
+    envelope = {name: True for name in AssessmentResponse.model_fields if name != "report"}
+    return {**envelope, "report": report_include}
+
+
+def _overloaded(error: WorkflowOverloadedError) -> HTTPException:
+    """429 with Retry-After for a request that got no workflow slot"""
+    return HTTPException(
+        status_code=429,
+        detail={"error": str(error), "retry_after": error.retry_after},
+        headers={"Retry-After": str(error.retry_after)}
+    )
+
+
+async def _admit(endpoint: str) -> Optional[AdmissionTicket]:
+    """Take a workflow slot, or answer 429 with Retry-After when overloaded"""
+    controller = get_admission_controller()
+    if controller is None:
+        return None
+    try:
+        return await controller.acquire(endpoint)
+    except WorkflowOverloadedError as e:
+        raise _overloaded(e)
+
+
 @app.post("/api/v1/assess", response_model=AssessmentResponse, tags=["Assessment"])
-async def assess_credit_risk(request: AssessmentRequest):
+async def assess_credit_risk(
+    request: AssessmentRequest,
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
+    include: Optional[Dict[str, Any]] = Depends(_response_fields)
+):
     """
     Perform complete credit risk assessment on a loan application.
     
@@ -115,6 +219,19 @@ async def assess_credit_risk(request: AssessmentRequest):
     6. Final credit decision generation
     
     Returns a comprehensive report with decision, terms, and detailed analysis.
+    
+    Retries with an identical request body (and the same Idempotency-Key
+    header, if sent) join the in-flight assessment or receive its recent
+    result instead of starting a new workflow.
+    
+    Under overload (all workflow slots busy and the wait queue full) the
+    request is rejected with 429 and a Retry-After header. Only requests that
+    run a workflow take a slot; duplicates joining one or replaying its result
+    never wait for one.
+    
+    Set include_detailed_report=false to skip the narrative sections, and pass
+    fields= (e.g. credit_decision,risk_assessment.probability_of_default) to
+    return only those parts of the report.
     """
     logger.info(f"Received assessment request for application: {request.application.application_id}")
     
@@ -131,7 +248,14 @@ async def assess_credit_risk(request: AssessmentRequest):
     if validation["warnings"]:
         logger.warning(f"Application warnings: {validation['warnings']}")
     
-    response = await credit_assessment_service.assess_credit_risk(request)
+    try:
+        response = await credit_assessment_service.assess_credit_risk(
+            request,
+            idempotency_key=idempotency_key,
+            admission_endpoint="assess"
+        )
+    except WorkflowOverloadedError as e:
+        raise _overloaded(e)
     
     if not response.success:
         raise HTTPException(
@@ -139,7 +263,65 @@ async def assess_credit_risk(request: AssessmentRequest):
             detail={"error": response.error}
         )
     
-    return response
+    return PydanticJSONResponse(response, include=include)
+
+
+@app.post("/api/v1/assess/batch", tags=["Assessment"])
+async def assess_credit_risk_batch(request: BatchAssessmentRequest):
+    """
+    Assess many loan applications with bounded server-side concurrency.
+    
+    Results are streamed as newline-delimited JSON (one AssessmentResponse plus
+    `index` and `application_id` per line) in completion order. Invalid
+    applications produce a failed result line instead of rejecting the batch.
+    """
+    if len(request.applications) > settings.batch_max_applications:
+        raise HTTPException(
+            status_code=413,
+            detail={"error": f"Batch exceeds {settings.batch_max_applications} applications"}
+        )
+    
+    logger.info(f"Received batch assessment request: {len(request.applications)} applications")
+    
+    async def result_generator():
+        async for result in credit_assessment_service.assess_credit_risk_batch(request):
+            yield ndjson_line(result)
+    
+    return StreamingResponse(
+        result_generator(),
+        media_type="application/x-ndjson"
+    )
+
+
+@app.post("/api/v1/assess/{application_id}/resume", response_model=AssessmentResponse, tags=["Assessment"])
+async def resume_assessment(
+    application_id: str,
+    include: Optional[Dict[str, Any]] = Depends(_response_fields)
+):
+    """
+    Resume a failed assessment from its last completed node.
+    
+    Requires CHECKPOINT_SQLITE_PATH. Nodes that finished in the earlier run
+    (including their LLM calls) are not executed again.
+    """
+    if not settings.checkpoint_sqlite_path:
+        raise HTTPException(
+            status_code=400,
+            detail={"error": "Workflow checkpointing is disabled (set CHECKPOINT_SQLITE_PATH)"}
+        )
+    
+    try:
+        response = await credit_assessment_service.resume_assessment(application_id)
+    except CheckpointNotFoundError as e:
+        raise HTTPException(status_code=404, detail={"error": str(e)})
+    
+    if not response.success:
+        raise HTTPException(
+            status_code=500,
+            detail={"error": response.error}
+        )
+    
+    return PydanticJSONResponse(response, include=include)
 
 
 @app.post("/api/v1/assess/stream", tags=["Assessment"])
@@ -161,16 +343,166 @@ async def assess_credit_risk_streaming(request: AssessmentRequest):
             }
         )
     
+    ticket = await _admit("assess_stream")
+    
     async def event_generator():
-        async for update in credit_assessment_service.assess_credit_risk_streaming(request):
-            yield f"data: {json.dumps(update.model_dump())}\n\n"
+        try:
+            async for update in credit_assessment_service.assess_credit_risk_streaming(request):
+                yield sse_event(update)
+        finally:
+            if ticket is not None:
+                ticket.release()
     
     return StreamingResponse(
         event_generator(),
-        media_type="text/event-stream"
+        media_type="text/event-stream",
+        # Also frees the slot if the client disconnects before the stream starts
+        background=BackgroundTask(ticket.release) if ticket is not None else None
     )
 
 
+def _require_job_queue() -> AssessmentJobQueue:
+    if not settings.job_queue_enabled:
+        raise HTTPException(status_code=503, detail={"error": "Job queue is disabled"})
+    return get_job_queue()
+
+
+@app.post("/api/v1/jobs", response_model=AssessmentJob, status_code=202, tags=["Jobs"])
+async def submit_assessment_job(request: AssessmentRequest):
+    """
+    Queue a credit assessment and return its job id immediately.
+    
+    Poll GET /api/v1/jobs/{job_id} for status and progress, then fetch the
+    report from GET /api/v1/jobs/{job_id}/report.
+    """
+    queue = _require_job_queue()
+    
+    validation = credit_assessment_service.validate_application(request.application)
+    if not validation["valid"]:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "Invalid application",
+                "issues": validation["issues"]
+            }
+        )
+    
+    return await queue.submit(request)
+
+
+@app.get("/api/v1/jobs/{job_id}", response_model=AssessmentJob, tags=["Jobs"])
+async def get_assessment_job(job_id: str):
+    """Get the status and progress of a queued assessment"""
+    job = await _require_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail={"error": f"Job {job_id} not found"})
+    return job
+
+
+@app.get("/api/v1/jobs/{job_id}/report", response_model=CreditAssessmentReport, tags=["Jobs"])
+async def get_assessment_job_report(
+    job_id: str,
+    include: Optional[Dict[str, Any]] = Depends(_report_fields)
+):
+    """Get the credit assessment report of a completed job"""
+    queue = _require_job_queue()
+    job = await queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail={"error": f"Job {job_id} not found"})
+    
+    if job.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+        raise HTTPException(
+            status_code=409,
+            detail={"error": f"Job {job_id} is {job.status.value}", "progress": job.progress}
+        )
+    
+    response = await queue.get_response(job_id)
+    if job.status == JobStatus.FAILED or response is None or response.report is None:
+        raise HTTPException(status_code=500, detail={"error": job.error or "Assessment failed"})
+    
+    return PydanticJSONResponse(response.report, include=include)
+
+
+def _require_report_store() -> ReportStore:
+    store = get_report_store()
+    if store is None:
+        raise HTTPException(status_code=503, detail={"error": "Report store is disabled"})
+    return store
+
+
+@app.get("/api/v1/reports", response_model=ReportPage, tags=["Reports"])
+async def list_reports(
+    application_id: Optional[str] = None,
+    decision: Optional[DecisionType] = None,
+    risk_level: Optional[RiskLevel] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    store: ReportStore = Depends(_require_report_store)
+):
+    """
+    List stored report summaries, newest first.
+    
+    Filters combine with AND. Pass the returned next_cursor as cursor to fetch
+    the following page; next_cursor is null on the last page.
+    """
+    try:
+        page = await store.list_reports(
+            application_id=application_id,
+            decision=decision,
+            risk_level=risk_level,
+            since=since,
+            until=until,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={"error": str(e)})
+    return PydanticJSONResponse(page)
+
+
+@app.get("/api/v1/reports/{report_id}", response_model=CreditAssessmentReport, tags=["Reports"])
+async def get_report(
+    report_id: str,
+    store: ReportStore = Depends(_require_report_store),
+    include: Optional[Dict[str, Any]] = Depends(_report_fields)
+):
+    """Get a stored credit assessment report"""
+    report = await store.get(report_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail={"error": f"Report {report_id} not found"})
+    return PydanticJSONResponse(report, include=include)
+
+
+@app.get("/api/v1/reports/{report_id}/schedule", tags=["Reports"])
+async def get_report_schedule(report_id: str, store: ReportStore = Depends(_require_report_store)):
+    """
+    Stream the amortization schedule of a report's approved terms.
+
+    One AmortizationInstallment per line (newline-delimited JSON), generated
+    as the response is sent; a 480-month schedule is never held in memory.
+    The schedule is rebuilt from the stored terms (disbursement date, payment
+    day and fees), so it matches their total interest, repayment and APR; an
+    upfront fee is installment 0.
+    """
+    report = await store.get(report_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail={"error": f"Report {report_id} not found"})
+    terms = report.credit_decision.approved_terms
+    if terms is None:
+        raise HTTPException(
+            status_code=409,
+            detail={"error": f"Report {report_id} has no approved terms ({report.credit_decision.decision.value})"}
+        )
+
+    def installment_generator():
+        for installment in iter_loan_terms_schedule(terms):
+            yield ndjson_line(AmortizationInstallment(**installment))
+
+    return StreamingResponse(installment_generator(), media_type="application/x-ndjson")
+
+
 @app.post("/api/v1/validate", tags=["Validation"])
 async def validate_application(application: LoanApplication):
     """
@@ -182,6 +514,40 @@ async def validate_application(application: LoanApplication):
     return validation
 
 
+@app.post("/api/v1/validate/batch", response_model=BulkValidationResponse, tags=["Validation"])
+def validate_applications(request: BulkValidationRequest):
+    """
+    Validate many loan applications in one vectorized pass.
+    
+    Send either `applications` (objects shaped like /api/v1/validate input) or
+    `columns` (one list per field, fastest for large nightly files). Every row
+    gets the same issues and warnings the single-application check reports;
+    rows with neither are omitted unless include_clean_rows is set.
+    
+    Declared sync so FastAPI runs it in the threadpool, off the event loop.
+    """
+    rows = len(request.applications) if request.applications is not None else len(request.columns.requested_amount)
+    if rows > settings.bulk_validation_max_rows:
+        raise HTTPException(
+            status_code=413,
+            detail={"error": f"Bulk validation exceeds {settings.bulk_validation_max_rows} applications"}
+        )
+    
+    if request.applications is not None:
+        results = validate_applications_bulk(request.applications, include_clean=request.include_clean_rows)
+    else:
+        results = validate_columns(request.columns.model_dump(), include_clean=request.include_clean_rows)
+    
+    # Invalid rows are always listed, clean rows only on request
+    invalid_count = sum(not result["valid"] for result in results)
+    return PydanticJSONResponse(BulkValidationResponse(
+        total=rows,
+        valid_count=rows - invalid_count,
+        invalid_count=invalid_count,
+        results=results
+    ))
+
+
 @app.get("/api/v1/config", tags=["Configuration"])
 async def get_configuration():
     """Get current API configuration (non-sensitive)"""
@@ -210,8 +576,12 @@ async def metrics():
     - LLM token usage and latency
     - Error rates by type and component
     - Active workflow count
+    
+    With several workers (app.server) the values are aggregated over all of them.
     """
-    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    if settings.job_queue_enabled:
+        await get_job_queue().update_gauges()
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
 
 
 if __name__ == "__main__":
@@ -3,8 +3,8 @@ Pydantic Models (request/response schemas) for Credit Risk Assessment
 Structured data models for loan applications, analysis, and reports
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Literal
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Any, Dict, List, Optional, Literal
 from datetime import date, datetime
 from enum import Enum
 
@@ -57,6 +57,13 @@ class DecisionType(str, Enum):
     DECLINED = "declined"
 
 
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 # ============================================================================
 # INPUT MODELS
 # ============================================================================
@@ -255,7 +262,21 @@ class LoanTerms(BaseModel):
     total_interest: float = Field(...)
     total_repayment: float = Field(...)
     annual_percentage_rate: float = Field(...)
-    fees: float = Field(default=0)
+    fees: float = Field(default=0)  # Paid at disbursement
+    payment_day: int = Field(default=1, ge=1, le=28)
+    disbursement_date: Optional[date] = Field(default=None)
+    first_payment_date: Optional[date] = Field(default=None)
+
+
+class AmortizationInstallment(BaseModel):
+    installment: int = Field(...)
+    payment_date: Optional[date] = Field(default=None)
+    interest_rate: float = Field(...)
+    payment: float = Field(...)  # Principal + interest
+    principal: float = Field(...)
+    interest: float = Field(...)
+    fee: float = Field(default=0)
+    balance: float = Field(...)
 
 
 class CreditDecision(BaseModel):
@@ -290,6 +311,7 @@ class CreditAssessmentReport(BaseModel):
     executive_summary: str = Field(...)
     detailed_analysis: str = Field(...)
     recommendations: List[str] = Field(...)
+    degraded_sections: List[str] = Field(default_factory=list)  # Built from calculations after a deadline
     
     processing_time_seconds: float = Field(...)
     trace_id: Optional[str] = Field(default=None)
@@ -314,6 +336,94 @@ class AssessmentResponse(BaseModel):
     trace_url: Optional[str] = Field(default=None)
 
 
+class BatchAssessmentRequest(BaseModel):
+    applications: List[LoanApplication] = Field(..., min_length=1)
+    fast_mode: bool = Field(default=False)
+    include_detailed_report: bool = Field(default=True)
+    concurrency: Optional[int] = Field(default=None, ge=1)  # Capped by settings.batch_max_concurrency
+
+
+class BatchAssessmentResult(AssessmentResponse):
+    index: int = Field(...)  # Position of the application in the batch request
+    application_id: str = Field(...)
+
+
+class ApplicationColumns(BaseModel):
+    """Column-oriented applications for bulk validation (one list entry per application)"""
+    application_id: Optional[List[Optional[str]]] = Field(default=None)
+    requested_amount: List[Optional[float]] = Field(...)
+    requested_term_months: List[Optional[float]] = Field(...)
+    monthly_gross_income: List[Optional[float]] = Field(...)
+    monthly_net_income: List[Optional[float]] = Field(...)
+    credit_score: List[Optional[float]] = Field(...)
+    existing_debt_payments: Optional[List[Optional[float]]] = Field(default=None)  # Total monthly payments on existing debts
+    bankruptcies: Optional[List[Optional[float]]] = Field(default=None)
+    delinquencies_90_days: Optional[List[Optional[float]]] = Field(default=None)
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> "ApplicationColumns":
+        columns = (getattr(self, name) for name in type(self).model_fields)
+        lengths = {len(values) for values in columns if values is not None}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        return self
+
+
+class BulkValidationRequest(BaseModel):
+    # Exactly one of: application objects (as accepted by /api/v1/validate) or columns
+    applications: Optional[List[Dict[str, Any]]] = Field(default=None)
+    columns: Optional[ApplicationColumns] = Field(default=None)
+    include_clean_rows: bool = Field(default=False)  # Also list rows without issues or warnings
+
+    @model_validator(mode="after")
+    def check_one_input(self) -> "BulkValidationRequest":
+        if (self.applications is None) == (self.columns is None):
+            raise ValueError("Provide exactly one of applications or columns")
+        return self
+
+
+class BulkValidationResult(BaseModel):
+    index: int = Field(...)
+    application_id: Optional[str] = Field(default=None)
+    valid: bool = Field(...)
+    issues: List[str] = Field(default_factory=list)
+    warnings: List[str] = Field(default_factory=list)
+
+
+class BulkValidationResponse(BaseModel):
+    total: int = Field(...)
+    valid_count: int = Field(...)
+    invalid_count: int = Field(...)
+    results: List[BulkValidationResult] = Field(...)  # Rows with issues or warnings (all rows if include_clean_rows)
+
+
+class AssessmentJob(BaseModel):
+    job_id: str = Field(...)
+    application_id: str = Field(...)
+    status: JobStatus = Field(...)
+    progress: int = Field(ge=0, le=100)
+    created_at: datetime = Field(...)
+    started_at: Optional[datetime] = Field(default=None)
+    finished_at: Optional[datetime] = Field(default=None)
+    error: Optional[str] = Field(default=None)
+
+
+class ReportSummary(BaseModel):
+    report_id: str = Field(...)
+    application_id: str = Field(...)
+    applicant_name: str = Field(...)
+    report_date: datetime = Field(...)
+    decision: DecisionType = Field(...)
+    risk_level: RiskLevel = Field(...)
+    risk_score: int = Field(...)
+    confidence_score: float = Field(...)
+
+
+class ReportPage(BaseModel):
+    items: List[ReportSummary] = Field(...)
+    next_cursor: Optional[str] = Field(default=None)  # Pass as cursor= to fetch the next page
+
+
 class HealthResponse(BaseModel):
     status: str = Field(...)
     version: str = Field(...)
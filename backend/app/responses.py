@@ -0,0 +1,89 @@
+"""
+Response Serialization
+Fast JSON rendering of Pydantic models for API responses and stream events.
+
+Reports are large nested models with long narrative strings. The default path
+converts them to dicts (model_dump / jsonable_encoder) and then runs json.dumps
+over the result; here they are serialized in one pass by pydantic-core, straight
+to JSON bytes. See benchmarks/serialization.py for the measured difference.
+"""
+
+import inspect
+from typing import Any, Dict, Optional, Type, get_args
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """The model a field holds directly or through Optional, else None"""
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        if inspect.isclass(arg) and issubclass(arg, BaseModel):
+            return arg
+    return None
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[Dict[str, Any]]:
+    """
+    Turn a sparse field selection into a Pydantic include specification.
+
+    Args:
+        fields: Comma-separated dotted paths, e.g. "credit_decision,risk_assessment.probability_of_default"
+        model: Model the paths are relative to
+
+    Returns:
+        Nested include dict for model_dump_json, or None to include everything
+
+    Raises:
+        ValueError: If a path does not name a field of the model
+    """
+    if not fields:
+        return None
+
+    include: Dict[str, Any] = {}
+    for path in filter(None, (part.strip() for part in fields.split(","))):
+        node, cls = include, model
+        names = path.split(".")
+        for depth, name in enumerate(names):
+            if cls is None or name not in cls.model_fields:
+                raise ValueError(f"Unknown field '{path}'")
+            if depth == len(names) - 1:
+                node[name] = True
+            elif node.get(name) is True:
+                break  # Parent already selected in full
+            else:
+                node = node.setdefault(name, {})
+                cls = _nested_model(cls.model_fields[name].annotation)
+    return include or None
+
+
+def sse_event(model: BaseModel) -> str:
+    """Server-Sent Events frame carrying one model as JSON"""
+    return f"data: {model.model_dump_json()}\n\n"
+
+
+def ndjson_line(model: BaseModel) -> str:
+    """Newline-delimited JSON record of one model"""
+    return model.model_dump_json() + "\n"
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSONResponse that renders Pydantic models with model_dump_json.
+
+    Endpoints return PydanticJSONResponse(model) directly (keeping response_model
+    for the OpenAPI schema), which skips FastAPI's response re-validation and the
+    intermediate dict. Non-model content falls back to the standard encoder.
+    An include specification (see parse_fields) limits the rendered fields.
+    """
+
+    def __init__(self, content: Any, *args: Any, include: Optional[Dict[str, Any]] = None, **kwargs: Any):
+        self.include = include
+        super().__init__(content, *args, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(include=self.include).encode("utf-8")
+        return super().render(content)
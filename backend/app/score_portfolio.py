@@ -0,0 +1,55 @@
+"""
+Portfolio Scoring CLI
+Scores a CSV or Parquet file of loans with the deterministic risk pipeline.
+
+    python -m app.score_portfolio loans.csv scores.csv [--chunk-size N] [--workers N]
+        [--stress-scenarios N]
+
+Also installed as `credit-risk-score`. No API server or LLM is involved; see
+services/portfolio_scoring.py for the input and output columns.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from services.portfolio_scoring import DEFAULT_CHUNK_SIZE, score_file
+
+
+def main() -> None:
+    """Parse arguments and score the file"""
+    parser = argparse.ArgumentParser(
+        prog="credit-risk-score",
+        description="Compute DTI, DSCR, LTV, PD, LGD, expected loss and risk level for every loan in a file."
+    )
+    parser.add_argument("input", type=Path, help="Loans file (.csv, or .parquet with pyarrow installed)")
+    parser.add_argument("output", type=Path, help="Results file (.csv or .parquet), written as chunks finish")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per chunk")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument(
+        "--stress-scenarios", type=int, default=0,
+        help="Add the Monte Carlo affordability stress test with N scenarios per loan (default: off)"
+    )
+    args = parser.parse_args()
+
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    if args.stress_scenarios < 0:
+        parser.error("--stress-scenarios must not be negative")
+
+    started = time.perf_counter()
+    try:
+        rows = score_file(args.input, args.output, chunk_size=args.chunk_size, workers=args.workers,
+                          stress_scenarios=args.stress_scenarios)
+    except (OSError, ValueError, RuntimeError) as e:
+        parser.exit(1, f"credit-risk-score: error: {e}\n")
+    elapsed = time.perf_counter() - started
+    print(f"Scored {rows} loans in {elapsed:.1f}s ({rows / elapsed if elapsed else 0:,.0f} loans/s) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Server Launcher
+Runs the API with one uvicorn worker process per available CPU.
+
+A single process serves every request on one event loop, so CPU-bound work
+(report rendering, validation, calculations) caps throughput at one core.
+`python -m app.server` (or the `credit-risk-api` script) starts
+settings.workers processes instead (0 = one per CPU this process may run on).
+
+With more than one worker:
+- Prometheus metrics switch to multiprocess mode: PROMETHEUS_MULTIPROC_DIR is
+  prepared (stale files removed) before any worker imports prometheus_client,
+  and /metrics aggregates the shared files of all workers.
+- Interrupted jobs are requeued once here, before the workers start, instead
+  of by every worker's job queue.
+- Each worker builds its agents, compiles its graphs and opens its own database
+  connections in the application lifespan, i.e. after it was started.
+
+Admission control and request coalescing remain per worker, so the effective
+limits are max_concurrent_workflows / admission_queue_size times the workers.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import settings
+from config.logging_config import get_logger
+from config.runtime import available_cpus
+
+logger = get_logger(__name__)
+
+
+def worker_count() -> int:
+    """Configured number of workers, or one per available CPU"""
+    return settings.workers or available_cpus()
+
+
+def prepare_multiprocess_metrics() -> str:
+    """
+    Point PROMETHEUS_MULTIPROC_DIR at an empty directory for the workers.
+
+    Returns:
+        The metrics directory
+    """
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR") or settings.prometheus_multiproc_dir
+    if path:
+        os.makedirs(path, exist_ok=True)
+        # Files of a previous run would be added to this run's counters
+        for stale in Path(path).glob("*.db"):
+            stale.unlink()
+    else:
+        path = tempfile.mkdtemp(prefix="credit-risk-metrics-")
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+    return path
+
+
+def recover_job_queue() -> None:
+    """Requeue jobs interrupted by the previous run, once for all workers"""
+    from services.job_queue import recover_jobs
+
+    db = sqlite3.connect(settings.job_queue_sqlite_path)
+    try:
+        recover_jobs(db)
+    finally:
+        db.close()
+    # Read by each worker's settings: its queue must not requeue jobs another worker is running
+    os.environ["JOB_QUEUE_RECOVER_ON_START"] = "false"
+
+
+def main() -> None:
+    """Start the API server"""
+    import uvicorn
+
+    workers = worker_count()
+    if workers > 1:
+        if settings.job_queue_enabled and settings.job_queue_recover_on_start:
+            recover_job_queue()
+        metrics_dir = prepare_multiprocess_metrics()
+        logger.info(f"Starting {workers} workers (metrics directory {metrics_dir})")
+
+    uvicorn.run(
+        "app.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        workers=workers
+    )
+
+
+if __name__ == "__main__":
+    main()
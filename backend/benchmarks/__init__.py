@@ -0,0 +1,5 @@
+"""
+Benchmarks
+Standalone microbenchmarks, run from the backend directory with
+``python -m benchmarks.<name>``.
+"""
@@ -0,0 +1,128 @@
+"""
+Affordability Simulation Benchmark
+Inline latency and portfolio throughput of the Monte Carlo affordability stress test.
+
+    python -m benchmarks.affordability_simulation [--loans N] [--scenarios S] [--seed S]
+
+Times simulate_affordability per application (the call compute_income_calculations
+makes inside the income analysis node) and simulate_affordability_batch over a
+portfolio of N loans. Every loan of the portfolio is then simulated on its own
+as well: because all applications share the same scenarios, the batch records
+must be identical to the single-application results, whatever chunk a loan
+lands in. The script exits with status 1 if any differ.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from calculations.affordability_simulation import (
+    AFFORDABILITY_SIMULATION_DTYPE,
+    PERCENTILES,
+    simulate_affordability,
+    simulate_affordability_batch,
+)
+
+INLINE_CALLS = 500
+
+
+def build_portfolio(loans: int, seed: int) -> Dict[str, np.ndarray]:
+    """Mortgages, car and personal loans; some without income or existing debt, some at 0%"""
+    rng = np.random.default_rng(seed)
+    gross = np.round(rng.uniform(1500, 20000, loans), 2)
+    gross[rng.random(loans) < 0.02] = 0.0
+    debt = np.round(gross * rng.uniform(0, 0.3, loans), 2)
+    debt[rng.random(loans) < 0.2] = 0.0
+    rate = np.round(rng.uniform(1, 12, loans), 2)
+    rate[rng.random(loans) < 0.05] = 0.0
+    return {
+        "monthly_gross_income": gross,
+        "existing_monthly_debt": debt,
+        "loan_amount": np.round(rng.uniform(1000, 600000, loans), 2),
+        "loan_term_months": rng.integers(6, 481, loans),
+        "current_interest_rate": rate,
+    }
+
+
+def _single(portfolio: Dict[str, np.ndarray], index: int, scenarios: int) -> Dict[str, Any]:
+    return simulate_affordability(
+        float(portfolio["monthly_gross_income"][index]),
+        float(portfolio["existing_monthly_debt"][index]),
+        float(portfolio["loan_amount"][index]),
+        int(portfolio["loan_term_months"][index]),
+        float(portfolio["current_interest_rate"][index]),
+        scenarios=scenarios
+    )
+
+
+def _as_record(result: Dict[str, Any]) -> Tuple[float, ...]:
+    """simulate_affordability result in AFFORDABILITY_SIMULATION_DTYPE field order"""
+    values = {
+        "breach_probability": result["breach_probability"],
+        "mean_worst_dti": result["mean_worst_dti"],
+    }
+    for percentile in PERCENTILES:
+        values[f"worst_dti_p{percentile}"] = result["worst_dti_percentiles"][f"p{percentile}"]
+        values[f"peak_payment_p{percentile}"] = result["peak_payment_percentiles"][f"p{percentile}"]
+    return tuple(values[name] for name in AFFORDABILITY_SIMULATION_DTYPE.names)
+
+
+def time_inline(portfolio: Dict[str, np.ndarray], scenarios: int) -> List[float]:
+    """Latency (seconds) of single-application calls, warm scenario cache"""
+    _single(portfolio, 0, scenarios)
+    timings = []
+    for index in range(min(INLINE_CALLS, portfolio["loan_amount"].size)):
+        start = time.perf_counter()
+        _single(portfolio, index, scenarios)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def compare(portfolio: Dict[str, np.ndarray], records: np.ndarray, scenarios: int) -> int:
+    """Number of loans whose batch record differs from the single-application result"""
+    mismatches = 0
+    for index, record in enumerate(records.tolist()):
+        expected = _as_record(_single(portfolio, index, scenarios))
+        if expected != record:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"  loan {index} differs: single {expected}, batch {record}")
+    return mismatches
+
+
+def _elapsed(fn: Callable, *args: Any, **kwargs: Any) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--loans", type=int, default=5000)
+    parser.add_argument("--scenarios", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    portfolio = build_portfolio(args.loans, args.seed)
+    inline = time_inline(portfolio, args.scenarios)
+    batch_seconds, records = _elapsed(simulate_affordability_batch, scenarios=args.scenarios, **portfolio)
+    mismatches = compare(portfolio, records, args.scenarios)
+
+    print(f"Loans: {args.loans}, scenarios: {args.scenarios}")
+    print(f"inline median / p95           {statistics.median(inline) * 1000:7.2f}ms "
+          f"/ {np.percentile(inline, 95) * 1000:.2f}ms per application")
+    print(f"batch                         {batch_seconds * 1000:7.0f}ms "
+          f"({args.loans / batch_seconds:,.0f} applications/s)")
+    print(f"mean breach probability       {records['breach_probability'].mean():7.2f}%")
+    print(f"batch differing from inline   {mismatches:>7}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Amortization Benchmark
+Schedule generator and loan terms versus their calculations.vectorized mirrors.
+
+    python -m benchmarks.amortization [--loans N] [--seed S]
+
+Builds a portfolio of up to 480-month loans with mixed rates (including zero),
+disbursement dates (some missing), payment days 1-31, upfront and monthly fees
+and a rate step, then compares every installment of every schedule and every
+LoanTerms figure bit for bit. The script exits with status 1 if any differ.
+"""
+
+import argparse
+import struct
+import sys
+import time
+from datetime import date
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from calculations import vectorized
+from calculations.amortization import calculate_loan_terms, iter_amortization_schedule
+
+
+def build_portfolio(loans: int, seed: int) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    # At least 2 installments, so every loan reaches the rate step at installment 2
+    term = rng.integers(2, 481, loans)
+    term[rng.random(loans) < 0.3] = 480
+    dates = np.datetime64("2025-01-01", "D") + rng.integers(0, 730, loans).astype("m8[D]")
+    dates[rng.random(loans) < 0.1] = np.datetime64("NaT", "D")
+    return {
+        "amount": np.round(rng.uniform(500, 750000, loans), 2),
+        "term_months": term,
+        "annual_interest_rate": np.round(rng.choice([0.0, 1.9, 3.5, 4.5, 6.0, 11.0, 19.99], loans), 2),
+        "step_rate": np.round(rng.uniform(2, 9, loans), 2),
+        "disbursement_date": dates,
+        "payment_day": rng.integers(1, 32, loans),
+        "upfront_fee": rng.choice([0.0, 0.0, 250.0, 1499.5], loans),
+        "monthly_fee": rng.choice([0.0, 0.0, 1.5, 5.0], loans),
+    }
+
+
+def _same(expected: Any, actual: Any) -> bool:
+    """Bit-identical floats, equal integers, or the same date (None matches NaT)"""
+    if expected is None or isinstance(expected, date):
+        if expected is None:
+            return bool(np.isnat(actual))
+        return np.datetime64(expected, "D") == actual
+    return struct.pack("<d", float(expected)) == struct.pack("<d", float(actual))
+
+
+def _loan(portfolio: Dict[str, np.ndarray], index: int) -> Tuple[tuple, Dict[str, Any]]:
+    disbursement = portfolio["disbursement_date"][index]
+    args = (
+        float(portfolio["amount"][index]),
+        int(portfolio["term_months"][index]),
+        float(portfolio["annual_interest_rate"][index]),
+    )
+    kwargs = {
+        "rate_steps": [(2, float(portfolio["step_rate"][index]))],
+        "disbursement_date": None if np.isnat(disbursement) else disbursement.astype(date),
+        "payment_day": int(portfolio["payment_day"][index]),
+        "monthly_fee": float(portfolio["monthly_fee"][index]),
+    }
+    return args, kwargs
+
+
+def run_scalar(portfolio: Dict[str, np.ndarray]) -> Tuple[List[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    schedules, terms = [], []
+    for index in range(portfolio["amount"].size):
+        args, kwargs = _loan(portfolio, index)
+        schedules.append(list(iter_amortization_schedule(*args, **kwargs)))
+        terms.append(calculate_loan_terms(*args, upfront_fee=float(portfolio["upfront_fee"][index]), **kwargs))
+    return schedules, terms
+
+
+def _vectorized_kwargs(portfolio: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    return {
+        "amount": portfolio["amount"],
+        "term_months": portfolio["term_months"],
+        "annual_interest_rate": portfolio["annual_interest_rate"],
+        "rate_steps": [(2, portfolio["step_rate"])],
+        "disbursement_date": portfolio["disbursement_date"],
+        "payment_day": portfolio["payment_day"],
+        "monthly_fee": portfolio["monthly_fee"],
+    }
+
+
+def compare(
+    schedules: List[List[Dict[str, Any]]],
+    terms: List[Dict[str, Any]],
+    schedule_records: np.ndarray,
+    terms_records: np.ndarray
+) -> int:
+    """Number of loans whose schedule or terms differ"""
+    mismatches = 0
+    for index, (schedule, loan_terms) in enumerate(zip(schedules, terms)):
+        row = schedule_records[index]
+        same = int((row["installment"] > 0).sum()) == len(schedule)
+        same = same and all(
+            _same(value, row[key][number])
+            for number, installment in enumerate(schedule)
+            for key, value in installment.items()
+        )
+        same = same and all(_same(value, terms_records[key][index]) for key, value in loan_terms.items())
+        if not same:
+            mismatches += 1
+    return mismatches
+
+
+def _elapsed(fn: Callable, *args: Any, **kwargs: Any) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--loans", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    portfolio = build_portfolio(args.loans, args.seed)
+    kwargs = _vectorized_kwargs(portfolio)
+    scalar_seconds, (schedules, terms) = _elapsed(run_scalar, portfolio)
+    schedule_seconds, schedule_records = _elapsed(vectorized.amortization_schedule, **kwargs)
+    terms_seconds, terms_records = _elapsed(
+        vectorized.calculate_loan_terms, upfront_fee=portfolio["upfront_fee"], **kwargs
+    )
+    mismatches = compare(schedules, terms, schedule_records, terms_records)
+
+    installments = sum(len(schedule) for schedule in schedules)
+    print(f"Loans: {args.loans} ({installments} installments)")
+    print(f"scalar schedules + terms      {scalar_seconds * 1000:9.1f}ms")
+    print(f"vectorized schedules          {schedule_seconds * 1000:9.1f}ms")
+    print(f"vectorized schedules + terms  {terms_seconds * 1000:9.1f}ms "
+          f"({scalar_seconds / terms_seconds:.1f}x)")
+    print(f"mismatching loans             {mismatches:>9}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Debt Payoff Benchmark
+Month-by-month payoff loop versus the closed-form and vectorized projections.
+
+    python -m benchmarks.debt_payoff [--rows N] [--seed S]
+
+iterative_debt_payoff is the original loop implementation of
+project_debt_payoff, kept here as the reference. Each run times edge cases
+(zero rates, payments that do not or only just cover interest, no payment,
+zero and negative balances, the 600-month cap, negative rates, payments that
+divide the balance exactly) followed by a random portfolio of debts.
+tests/test_debt_payoff.py checks both projections against the loop on the
+same inputs.
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from calculations import vectorized
+from calculations.debt_calculations import project_debt_payoff
+
+Debt = Tuple[float, float, float]
+
+# (balance, monthly payment, annual rate %)
+EDGE_CASES: List[Debt] = [
+    (10000.0, 500.0, 0.0),            # zero rate, exact division
+    (11470.32, 1274.48, 0.0),         # zero rate, exact division with floating-point residue
+    (10000.0, 300.0, 0.0),            # zero rate, partial last month
+    (10000.0, 50.0, 6.0),             # payment equal to the interest
+    (10000.0, 49.99, 6.0),            # payment below the interest
+    (10000.0, 50.01, 6.0),            # payment just above the interest: capped at 600 months
+    (10000.0, 0.0, 5.0),              # no payment
+    (10000.0, -100.0, 5.0),           # negative payment
+    (0.0, 100.0, 5.0),                # nothing owed
+    (-250.0, 100.0, 5.0),             # credit balance
+    (500.0, 1000.0, 19.99),           # paid off in the first month
+    (250000.0, 1199.10, 4.5),         # 30-year mortgage
+    (5000.0, 100.0, -1.5),            # negative rate
+    (0.01, 0.01, 0.0),                # one cent
+    (1e9, 1e7, 12.0),                 # large balance
+]
+
+
+def iterative_debt_payoff(
+    debt_balance: float,
+    monthly_payment: float,
+    annual_interest_rate: float
+) -> Dict[str, Any]:
+    """Original month-by-month project_debt_payoff"""
+    if monthly_payment <= 0:
+        return {
+            "months_to_payoff": 999,
+            "total_interest_paid": 0,
+            "total_amount_paid": debt_balance
+        }
+
+    monthly_rate = (annual_interest_rate / 100) / 12
+    balance = debt_balance
+    months = 0
+    total_interest = 0
+    max_months = 600
+
+    while balance > 0 and months < max_months:
+        interest_charge = balance * monthly_rate
+        principal_payment = monthly_payment - interest_charge
+
+        if principal_payment <= 0:
+            return {
+                "months_to_payoff": 999,
+                "total_interest_paid": 0,
+                "total_amount_paid": 0,
+                "error": "Payment insufficient to cover interest"
+            }
+
+        balance -= principal_payment
+        total_interest += interest_charge
+        months += 1
+
+    return {
+        "months_to_payoff": months,
+        "years_to_payoff": round(months / 12, 1),
+        "total_interest_paid": round(total_interest, 2),
+        "total_amount_paid": round(debt_balance + total_interest, 2)
+    }
+
+
+def random_debts(rows: int, seed: int) -> List[Debt]:
+    """Card, auto and personal-loan like debts; one in ten pays only the interest or less"""
+    rng = np.random.default_rng(seed)
+    balances = np.round(rng.uniform(100, 60000, rows), 2)
+    rates = np.round(rng.choice([0.0, 3.9, 7.5, 12.99, 19.99, 24.99], rows) + rng.uniform(0, 2, rows), 2)
+    rates[rng.random(rows) < 0.1] = 0.0
+    interest = balances * rates / 1200
+    payments = np.round(interest + rng.uniform(5, 1500, rows), 2)
+    short = rng.random(rows) < 0.1
+    payments[short] = np.round(interest[short] * rng.uniform(0.5, 1.0, short.sum()), 2)
+    return list(zip(balances.tolist(), payments.tolist(), rates.tolist()))
+
+
+def _elapsed(fn: Callable, *args: Any) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def run(name: str, debts: List[Debt]) -> None:
+    columns = [np.array(column) for column in zip(*debts)]
+    loop_seconds, _ = _elapsed(lambda: [iterative_debt_payoff(*debt) for debt in debts])
+    closed_seconds, _ = _elapsed(lambda: [project_debt_payoff(*debt) for debt in debts])
+    vectorized_seconds, _ = _elapsed(vectorized.project_debt_payoff, *columns)
+    print(f"{name:<12} {len(debts):>8} {loop_seconds * 1000:9.1f}ms {closed_seconds * 1000:9.1f}ms "
+          f"{vectorized_seconds * 1000:9.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'debts':<12} {'count':>8} {'loop':>11} {'closed':>11} {'vectorized':>11}")
+    run("edge cases", EDGE_CASES)
+    run("portfolio", random_debts(args.rows, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Serialization Benchmark
+Compares the JSON paths for a realistic CreditAssessmentReport and SSE event.
+
+    python -m benchmarks.serialization [--iterations N]
+
+The report is assembled from examples/sample_application.json with the
+deterministic section builders, plus narrative text of typical LLM length.
+"""
+
+import argparse
+import json
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models import (
+    AssessmentRequest,
+    CreditAssessmentReport,
+    AssessmentResponse,
+    ProgressUpdate,
+)
+from app.responses import PydanticJSONResponse, sse_event
+from graphs.deterministic_analysis import (
+    compute_income_calculations,
+    compute_debt_calculations,
+    compute_collateral_calculations,
+    compute_risk_calculations,
+    build_financial_summary,
+    build_income_analysis,
+    build_debt_analysis,
+    build_collateral_evaluation,
+    build_risk_assessment,
+    build_credit_decision,
+)
+
+SAMPLE_APPLICATION = Path(__file__).resolve().parents[2] / "examples" / "sample_application.json"
+
+# Narrative sections are LLM prose of a few KB each
+NARRATIVE_PARAGRAPH = (
+    "The applicant demonstrates stable employment income with a consistent history of on-time "
+    "payments across revolving and installment accounts. Projected debt service remains within "
+    "policy limits after the requested loan, and collateral coverage provides additional comfort. "
+)
+
+
+def build_sample_response() -> AssessmentResponse:
+    """Realistic successful AssessmentResponse without calling any LLM"""
+    application = AssessmentRequest.model_validate_json(SAMPLE_APPLICATION.read_text()).application
+    app = application.model_dump()
+    income_calcs = compute_income_calculations(app)
+    debt_calcs = compute_debt_calculations(app)
+    collateral_calcs = compute_collateral_calculations(app)
+    risk_calcs = compute_risk_calculations(app, income_calcs, debt_calcs, collateral_calcs)
+
+    report = CreditAssessmentReport(
+        report_id=str(uuid.uuid4()),
+        application_id=application.application_id or str(uuid.uuid4()),
+        applicant_name=f"{application.applicant.first_name} {application.applicant.last_name}",
+        financial_summary=build_financial_summary(app),
+        income_analysis=build_income_analysis(income_calcs),
+        debt_analysis=build_debt_analysis(debt_calcs),
+        collateral_evaluation=build_collateral_evaluation(collateral_calcs),
+        risk_assessment=build_risk_assessment(app, risk_calcs, income_calcs, debt_calcs, collateral_calcs),
+        credit_decision=build_credit_decision(app, risk_calcs, income_calcs, debt_calcs),
+        executive_summary=NARRATIVE_PARAGRAPH * 6,
+        detailed_analysis=NARRATIVE_PARAGRAPH * 40,
+        recommendations=[NARRATIVE_PARAGRAPH] * 5,
+        processing_time_seconds=42.0
+    )
+    return AssessmentResponse(success=True, report=report, processing_time_seconds=42.0)
+
+
+def _time_per_call(fn: Callable[[], object], iterations: int) -> float:
+    """Best-of-5 mean microseconds per call"""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best * 1e6
+
+
+def run(iterations: int = 2000) -> Dict[str, float]:
+    """
+    Time each serialization path.
+
+    Args:
+        iterations: Calls per timing round
+
+    Returns:
+        Microseconds per call by path name
+    """
+    response = build_sample_response()
+    update = ProgressUpdate(
+        status="Risk assessment complete",
+        progress=71,
+        stage="assess_risk",
+        data={"calculations": response.report.risk_assessment.score_breakdown.model_dump()}
+    )
+
+    return {
+        "report: jsonable_encoder + json.dumps (FastAPI default)":
+            _time_per_call(lambda: json.dumps(jsonable_encoder(response)).encode(), iterations),
+        "report: PydanticJSONResponse":
+            _time_per_call(lambda: PydanticJSONResponse(response).body, iterations),
+        "sse: json.dumps(model_dump())":
+            _time_per_call(lambda: f"data: {json.dumps(update.model_dump())}\n\n", iterations * 10),
+        "sse: sse_event":
+            _time_per_call(lambda: sse_event(update), iterations * 10),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    size = len(PydanticJSONResponse(build_sample_response()).body)
+    print(f"Report size: {size / 1024:.1f} KiB")
+    for name, micros in run(args.iterations).items():
+        print(f"{name:<58} {micros:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Validation Benchmark
+Per-object validate_application versus the vectorized bulk validator.
+
+    python -m benchmarks.validation [--rows N]
+
+Rows are perturbed copies of examples/sample_application.json with a share of
+invalid values and warning triggers. The script also checks that both paths
+report identical issues and warnings for every row the per-object path accepts.
+"""
+
+import argparse
+import copy
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from pydantic import ValidationError
+
+from app.models import LoanApplication
+from services.bulk_validation import applications_to_columns, validate_applications_bulk, validate_columns
+from services.credit_assessment_service import credit_assessment_service
+
+SAMPLE_APPLICATION = Path(__file__).resolve().parents[2] / "examples" / "sample_application.json"
+
+
+def generate_applications(rows: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Perturbed sample applications (roughly one in ten triggers an issue or warning)"""
+    rng = random.Random(seed)
+    base = json.loads(SAMPLE_APPLICATION.read_text())["application"]
+    applications = []
+    for index in range(rows):
+        application = copy.deepcopy(base)
+        application["application_id"] = f"BENCH-{index}"
+        employment = application["employment"]
+        employment["monthly_gross_income"] = round(rng.uniform(1500, 20000), 2)
+        net_ratio = rng.uniform(1.0, 1.1) if rng.random() < 0.02 else rng.uniform(0.6, 0.85)
+        employment["monthly_net_income"] = round(employment["monthly_gross_income"] * net_ratio, 2)
+        application["credit_history"]["credit_score"] = rng.randint(300, 850)
+        application["credit_history"]["bankruptcies"] = int(rng.random() < 0.03)
+        application["credit_history"]["delinquencies_90_days"] = int(rng.random() < 0.05)
+        for debt in application.get("existing_debts", []):
+            debt["monthly_payment"] = round(rng.uniform(0, 600), 2)
+        application["loan_request"]["requested_amount"] = round(rng.uniform(1000, 500000), 2)
+        applications.append(application)
+    return applications
+
+
+def per_object(applications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """The /api/v1/validate path: parse a LoanApplication, then validate it"""
+    results = []
+    for application in applications:
+        try:
+            results.append(credit_assessment_service.validate_application(LoanApplication.model_validate(application)))
+        except ValidationError:
+            results.append(None)
+    return results
+
+
+def _elapsed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    applications = generate_applications(args.rows)
+    columns = applications_to_columns(applications)
+
+    expected = per_object(applications)
+    actual = validate_applications_bulk(applications, include_clean=True)
+    mismatches = sum(
+        1 for single, bulk in zip(expected, actual)
+        if single is not None and (single["issues"], single["warnings"]) != (bulk["issues"], bulk["warnings"])
+    )
+    print(f"Rows: {args.rows}, parity mismatches: {mismatches}")
+
+    baseline = _elapsed(per_object, applications)
+    timings = {
+        "per-object (LoanApplication + validate_application)": baseline,
+        "bulk, row-oriented (validate_applications_bulk)": _elapsed(validate_applications_bulk, applications),
+        "bulk, columnar (validate_columns)": _elapsed(validate_columns, columns),
+    }
+    for name, seconds in timings.items():
+        print(f"{name:<55} {seconds * 1000:9.1f} ms  {baseline / seconds:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Vectorized Calculations Benchmark
+Scalar calculations functions versus their calculations.vectorized mirrors.
+
+    python -m benchmarks.vectorized_calculations [--rows N] [--seed S]
+
+Inputs are random portfolios salted with the values the scalar code branches
+on (exact thresholds, zero and negative amounts, unknown categories) and with
+cent amounts that land on rounding ties. The script only times both paths;
+tests/test_vectorized_parity.py checks the results field by field on a seeded
+sample of the same inputs.
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+import calculations as scalar
+from calculations import vectorized
+from calculations.debt_calculations import calculate_debt_utilization
+from calculations.risk_calculations import calculate_capital_requirement
+
+EMPLOYMENT_TYPES = ["employed", "Self_Employed", "contractor", "freelance", "unemployed", "student", "retired"]
+INCOME_TRENDS = ["growing", "stable", "declining", "DECLINING", "unknown"]
+COLLATERAL_TYPES = ["real_estate", "residential_property", "commercial_property", "vehicle",
+                    "equipment", "securities", "inventory", "other", "art"]
+CONDITIONS = ["excellent", "good", "fair", "poor", "Unknown"]
+MARKETABILITY = ["excellent", "good", "fair", "poor", "n/a"]
+QUALITY_LEVELS = ["excellent", "good", "acceptable", "weak", "poor", "unrated"]
+BURDEN_LEVELS = ["low", "moderate", "high", "very_high", "Moderate", "none"]
+
+
+def _values(rng: np.random.Generator, rows: int, low: float, high: float, specials: List[float]) -> np.ndarray:
+    """Uniform cent amounts, one in five replaced by a special (threshold / edge) value"""
+    values = np.round(rng.uniform(low, high, rows), 2)
+    mask = rng.random(rows) < 0.2
+    values[mask] = rng.choice(np.asarray(specials, dtype=np.float64), mask.sum())
+    return values
+
+
+def _ints(rng: np.random.Generator, rows: int, low: int, high: int, specials: List[int]) -> np.ndarray:
+    values = rng.integers(low, high + 1, rows)
+    mask = rng.random(rows) < 0.2
+    values[mask] = rng.choice(np.asarray(specials), mask.sum())
+    return values
+
+
+def _choice(rng: np.random.Generator, rows: int, options: List[str]) -> np.ndarray:
+    return np.asarray(options)[rng.integers(0, len(options), rows)]
+
+
+def _flags(rng: np.random.Generator, rows: int) -> np.ndarray:
+    return rng.random(rows) < 0.5
+
+
+def build_cases(rows: int, seed: int) -> List[Tuple[str, Callable, Callable, Dict[str, np.ndarray]]]:
+    """(name, scalar function, vectorized function, keyword columns) for every mirrored function"""
+    rng = np.random.default_rng(seed)
+    income = lambda: _values(rng, rows, 0, 25000, [0.0, -100.0, 0.01, 5000.005, 1234.565])
+    debt = lambda: _values(rng, rows, 0, 8000, [0.0, -1.0, 0.005, 100.125, 2150.0])
+    ratio = lambda: _values(rng, rows, 0, 120, [0, 20, 28, 36, 43, 60, 75, 85, 95, 999, -5, 42.995])
+    dscr = lambda: _values(rng, rows, 0, 4, [0, 1.0, 1.25, 1.5, 2.0, 999.0, -0.5])
+    amount = lambda: _values(rng, rows, 0, 900000, [0.0, -10.0, 0.005, 250000.0, 99999.995])
+    years = lambda: _values(rng, rows, 0, 30, [0, 1, 3, 5, 0.99, 4.999])
+
+    return [
+        ("calculate_annual_income", scalar.calculate_annual_income, vectorized.calculate_annual_income,
+         dict(monthly_gross=income(), monthly_net=income())),
+        ("calculate_disposable_income", scalar.calculate_disposable_income, vectorized.calculate_disposable_income,
+         dict(monthly_net_income=income(), essential_expenses=debt(), existing_debt_payments=debt())),
+        ("calculate_max_affordable_payment", scalar.calculate_max_affordable_payment,
+         vectorized.calculate_max_affordable_payment,
+         dict(monthly_gross_income=income(), existing_monthly_debt=debt(),
+              max_dti_ratio=_values(rng, rows, 30, 50, [43.0]), housing_expense_ratio=_values(rng, rows, 20, 35, [28.0]))),
+        ("perform_income_stress_test", scalar.perform_income_stress_test, vectorized.perform_income_stress_test,
+         dict(monthly_gross_income=_values(rng, rows, 500, 25000, [0.01, 1000.0]), monthly_payment=debt(),
+              income_reduction_pct=_values(rng, rows, 0, 100, [0, 20, 100]),
+              interest_rate_increase_bps=_values(rng, rows, 0, 500, [0, 200]),
+              current_interest_rate=_values(rng, rows, 0, 15, [0, 4.0, -2.0]),
+              loan_amount=amount(), loan_term_months=_ints(rng, rows, 1, 480, [0, 12, 240, 360]))),
+        ("calculate_income_stability_score", scalar.calculate_income_stability_score,
+         vectorized.calculate_income_stability_score,
+         dict(years_employed=years(), employment_type=_choice(rng, rows, EMPLOYMENT_TYPES),
+              income_trend=_choice(rng, rows, INCOME_TRENDS), has_multiple_sources=_flags(rng, rows))),
+        ("calculate_estimated_payment", scalar.calculate_estimated_payment, vectorized.calculate_estimated_payment,
+         dict(amount=amount(), term_months=_ints(rng, rows, 1, 480, [1, 12, 60, 360]),
+              rate=_values(rng, rows, 0, 0.25, [0.0, 0.05, 0.0725]))),
+        ("calculate_dti_ratio", scalar.calculate_dti_ratio, vectorized.calculate_dti_ratio,
+         dict(total_monthly_debt=debt(), monthly_gross_income=income())),
+        ("calculate_dscr", scalar.calculate_dscr, vectorized.calculate_dscr,
+         dict(monthly_net_income=income(), total_monthly_debt=debt())),
+        ("assess_debt_burden", scalar.assess_debt_burden, vectorized.assess_debt_burden,
+         dict(dti_ratio=ratio(), dscr=dscr())),
+        ("calculate_debt_utilization", calculate_debt_utilization, vectorized.calculate_debt_utilization,
+         dict(total_debt_balance=amount(), total_credit_limit=amount())),
+        ("calculate_ltv_ratio", scalar.calculate_ltv_ratio, vectorized.calculate_ltv_ratio,
+         dict(loan_amount=amount(), collateral_value=amount())),
+        ("calculate_liquidation_value", scalar.calculate_liquidation_value, vectorized.calculate_liquidation_value,
+         dict(market_value=amount(), collateral_type=_choice(rng, rows, COLLATERAL_TYPES),
+              condition=_choice(rng, rows, CONDITIONS))),
+        ("assess_collateral_quality", scalar.assess_collateral_quality, vectorized.assess_collateral_quality,
+         dict(ltv_ratio=ratio(), collateral_type=_choice(rng, rows, COLLATERAL_TYPES),
+              has_insurance=_flags(rng, rows), has_clear_title=_flags(rng, rows),
+              marketability=_choice(rng, rows, MARKETABILITY))),
+        ("calculate_collateral_coverage", scalar.calculate_collateral_coverage,
+         vectorized.calculate_collateral_coverage,
+         dict(loan_amount=amount(), liquidation_value=amount(), required_coverage=_values(rng, rows, 1, 2, [1.2]))),
+        ("calculate_probability_of_default", scalar.calculate_probability_of_default,
+         vectorized.calculate_probability_of_default,
+         dict(credit_score=_ints(rng, rows, 300, 850, [549, 550, 600, 650, 700, 750]), dti_ratio=ratio(),
+              employment_years=years(), payment_history_score=_ints(rng, rows, 0, 100, [0, 100]),
+              debt_burden_level=_choice(rng, rows, BURDEN_LEVELS))),
+        ("calculate_loss_given_default", scalar.calculate_loss_given_default, vectorized.calculate_loss_given_default,
+         dict(ltv_ratio=ratio(), collateral_quality=_choice(rng, rows, QUALITY_LEVELS),
+              recovery_rate=_values(rng, rows, 0, 100, [70.0, 10.0, 95.0]), has_guarantor=_flags(rng, rows))),
+        ("calculate_expected_loss", scalar.calculate_expected_loss, vectorized.calculate_expected_loss,
+         dict(loan_amount=amount(), probability_of_default=_values(rng, rows, 0.1, 99, [0.1, 99.0]),
+              loss_given_default=_values(rng, rows, 5, 90, [5.0, 45.0]))),
+        ("calculate_risk_score", scalar.calculate_risk_score, vectorized.calculate_risk_score,
+         dict(probability_of_default=_values(rng, rows, 0.1, 99, [0.1]), loss_given_default=_values(rng, rows, 5, 90, [90.0]),
+              dti_ratio=ratio(), ltv_ratio=ratio(), credit_score=_ints(rng, rows, 250, 900, [300, 850]),
+              income_stability_score=_ints(rng, rows, 0, 100, [50]),
+              collateral_quality_score=_ints(rng, rows, 0, 100, [50]))),
+        ("calculate_capital_requirement", calculate_capital_requirement, vectorized.calculate_capital_requirement,
+         dict(loan_amount=amount(), risk_weight=_values(rng, rows, 20, 150, [20, 50, 100, 150]),
+              minimum_capital_ratio=_values(rng, rows, 8, 13, [8.0, 10.5]))),
+    ]
+
+
+def run_scalar(fn: Callable, columns: Dict[str, np.ndarray]) -> List[Any]:
+    """Scalar results per row (None where the scalar function raises)"""
+    names = list(columns)
+    results = []
+    for row in zip(*(columns[name].tolist() for name in names)):
+        try:
+            results.append(fn(**dict(zip(names, row))))
+        except (ZeroDivisionError, OverflowError):
+            results.append(None)
+    return results
+
+
+def _elapsed(fn: Callable, *args: Any, **kwargs: Any) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    total_scalar = total_vectorized = 0.0
+    print(f"Rows: {args.rows}")
+    print(f"{'function':<36} {'scalar':>10} {'vectorized':>11} {'speedup':>8}")
+    for name, scalar_fn, vectorized_fn, columns in build_cases(args.rows, args.seed):
+        scalar_seconds, _ = _elapsed(run_scalar, scalar_fn, columns)
+        vectorized_seconds, _ = _elapsed(vectorized_fn, **columns)
+        total_scalar += scalar_seconds
+        total_vectorized += vectorized_seconds
+        print(f"{name:<36} {scalar_seconds * 1000:8.1f}ms {vectorized_seconds * 1000:9.1f}ms "
+              f"{scalar_seconds / vectorized_seconds:7.1f}x")
+    print(f"{'total':<36} {total_scalar * 1000:8.1f}ms {total_vectorized * 1000:9.1f}ms "
+          f"{total_scalar / total_vectorized:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
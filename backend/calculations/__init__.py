@@ -3,6 +3,15 @@ Financial calculations module for credit risk assessment.
 
 This module provides deterministic, auditable financial calculations
 separate from LLM-based qualitative analysis.
+
+calculations.amortization builds loan schedules (lazily, one installment at a
+time) and the LoanTerms figures derived from them.
+
+calculations.affordability_simulation runs the Monte Carlo affordability
+stress test, for one application or (simulate_affordability_batch) a portfolio.
+
+calculations.vectorized holds NumPy mirrors of these functions for whole
+portfolios; import it explicitly (it is not re-exported here).
 """
 
 from .income_calculations import (
@@ -10,6 +19,7 @@ from .income_calculations import (
     calculate_disposable_income,
     calculate_max_affordable_payment,
     perform_income_stress_test,
+    calculate_income_stability_score,
 )
 
 from .debt_calculations import (
@@ -24,6 +34,7 @@ from .collateral_calculations import (
     calculate_ltv_ratio,
     calculate_liquidation_value,
     assess_collateral_quality,
+    calculate_collateral_coverage,
 )
 
 from .risk_calculations import (
@@ -33,6 +44,15 @@ from .risk_calculations import (
     calculate_risk_score,
 )
 
+from .amortization import (
+    iter_amortization_schedule,
+    calculate_loan_terms,
+)
+
+from .affordability_simulation import (
+    simulate_affordability,
+)
+
 # Export all functions for easy import
 # The __all__ list explicitly defines which functions are publicly available 
 # when someone does from calculations import *.
@@ -42,6 +62,7 @@ __all__ = [
     "calculate_disposable_income",
     "calculate_max_affordable_payment",
     "perform_income_stress_test",
+    "calculate_income_stability_score",
     # Debt calculations
     "calculate_estimated_payment",
     "calculate_dti_ratio",
@@ -52,9 +73,15 @@ __all__ = [
     "calculate_ltv_ratio",
     "calculate_liquidation_value",
     "assess_collateral_quality",
+    "calculate_collateral_coverage",
     # Risk calculations
     "calculate_probability_of_default",
     "calculate_loss_given_default",
     "calculate_expected_loss",
     "calculate_risk_score",
+    # Amortization
+    "iter_amortization_schedule",
+    "calculate_loan_terms",
+    # Affordability simulation
+    "simulate_affordability",
 ]
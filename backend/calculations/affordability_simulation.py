@@ -0,0 +1,272 @@
+"""
+Monte Carlo affordability stress calculations.
+
+perform_income_stress_test checks one income cut and one +200 bps rate
+scenario. simulate_affordability draws thousands of joint income and interest
+rate paths instead, and reports how often the debt-to-income ratio breaches
+the limit and how the payment burden is distributed.
+
+Model, in yearly steps over horizon_years (the loan reprices every year, as in
+the rate scenario of perform_income_stress_test):
+- Gross income follows a log-normal random walk (income_growth,
+  income_volatility). In any year a job loss (job_loss_probability) cuts that
+  year's income to job_loss_income_replacement of its level.
+- The loan rate follows a mean-reverting (Vasicek) path back to the current
+  rate, with rate_volatility_bps per year, floored at zero. Its shocks are
+  correlated with the income shocks (income_rate_correlation).
+- Each year the remaining balance is re-amortized at that year's rate over the
+  remaining term; existing debt payments stay constant.
+- A scenario's burden is its worst yearly DTI, today (year 0) included.
+
+For a given seed, scenario count, horizon and model every application sees the
+same scenarios (common random numbers). Results are therefore reproducible
+and do not depend on the batch an application is scored in.
+simulate_affordability_batch scores whole portfolios in bounded chunks.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+ArrayLike = Any
+
+DEFAULT_SCENARIOS = 2000
+DEFAULT_HORIZON_YEARS = 5
+DEFAULT_SEED = 42
+DTI_LIMIT = 43.0
+PERCENTILES = (50, 75, 90, 95, 99)
+
+# DTI reported when income is zero (as in perform_income_stress_test)
+NO_INCOME_DTI = 999.0
+
+# Upper bound on scenario x year values per application chunk (memory of one batch step)
+_CHUNK_VALUES = 4_000_000
+
+AFFORDABILITY_SIMULATION_DTYPE = np.dtype(
+    [("breach_probability", "f8"), ("mean_worst_dti", "f8")]
+    + [(f"worst_dti_p{p}", "f8") for p in PERCENTILES]
+    + [(f"peak_payment_p{p}", "f8") for p in PERCENTILES]
+)
+
+
+@lru_cache(maxsize=8)
+def _scenario_paths(
+    seed: int,
+    scenarios: int,
+    horizon_years: int,
+    income_growth: float,
+    income_volatility: float,
+    job_loss_probability: float,
+    job_loss_income_replacement: float,
+    income_rate_correlation: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Application-independent part of the scenarios (read-only, scenarios x horizon_years).
+
+    Returns:
+        (income relative to today, standard rate shocks correlated with the income shocks)
+    """
+    rng = np.random.default_rng(seed)
+    income_normals = rng.standard_normal((scenarios, horizon_years))
+    rate_normals = rng.standard_normal((scenarios, horizon_years))
+    job_loss_draws = rng.random((scenarios, horizon_years))
+
+    log_growth = (income_growth - income_volatility ** 2 / 2) + income_volatility * income_normals
+    income_factor = np.exp(np.cumsum(log_growth, axis=1))
+    income_factor *= np.where(job_loss_draws < job_loss_probability, job_loss_income_replacement, 1.0)
+    rate_shocks = (
+        income_rate_correlation * income_normals
+        + np.sqrt(1 - income_rate_correlation ** 2) * rate_normals
+    )
+    for path in (income_factor, rate_shocks):
+        path.setflags(write=False)
+    return income_factor, rate_shocks
+
+
+def _reprice(balance: np.ndarray, annual_rate: np.ndarray, months: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Re-amortize balance over the remaining months at annual_rate (%).
+
+    Returns:
+        (level monthly payment, balance left after the next 12 payments); both 0 once repaid
+    """
+    monthly_rate = annual_rate / 1200
+    log_growth = np.log1p(monthly_rate)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        year_growth = np.exp(12 * log_growth)
+        payment = np.where(
+            monthly_rate == 0,
+            balance / months,
+            balance * monthly_rate / -np.expm1(-months * log_growth)
+        )
+        remaining = np.where(
+            monthly_rate == 0,
+            balance - 12 * payment,
+            balance * year_growth - payment * (year_growth - 1) / monthly_rate
+        )
+    outstanding = (months > 0) & (balance > 0)
+    return (
+        np.where(outstanding, payment, 0.0),
+        np.where(outstanding & (months > 12), np.maximum(remaining, 0.0), 0.0),
+    )
+
+
+def _simulate_chunk(
+    gross_income: np.ndarray,
+    existing_debt: np.ndarray,
+    amount: np.ndarray,
+    term_months: np.ndarray,
+    current_rate: np.ndarray,
+    income_factor: np.ndarray,
+    rate_shocks: np.ndarray,
+    rate_volatility: float,
+    rate_mean_reversion: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Worst DTI and peak loan payment per (application, scenario)"""
+    gross = gross_income[:, None]
+    debt = existing_debt[:, None]
+    base_rate = current_rate[:, None]
+
+    # Year 0: today's income and rate
+    payment, balance = _reprice(amount[:, None], base_rate, term_months[:, None])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        worst_dti = np.where(gross > 0, (debt + payment) / gross * 100, NO_INCOME_DTI)
+    peak_payment = payment
+
+    rate = np.broadcast_to(base_rate, (amount.size, income_factor.shape[0]))
+    for year in range(1, income_factor.shape[1] + 1):
+        rate = rate + rate_mean_reversion * (base_rate - rate) + rate_volatility * rate_shocks[:, year - 1]
+        rate = np.maximum(rate, 0.0)
+        months = (term_months - 12 * year)[:, None]
+        payment, balance = _reprice(balance, rate, months)
+        income = gross * income_factor[:, year - 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dti = np.where(income > 0, (debt + payment) / income * 100, NO_INCOME_DTI)
+        worst_dti = np.maximum(worst_dti, dti)
+        peak_payment = np.maximum(peak_payment, payment)
+    return worst_dti, peak_payment
+
+
+def simulate_affordability_batch(
+    monthly_gross_income: ArrayLike,
+    existing_monthly_debt: ArrayLike,
+    loan_amount: ArrayLike,
+    loan_term_months: ArrayLike,
+    current_interest_rate: ArrayLike = 4.0,
+    scenarios: int = DEFAULT_SCENARIOS,
+    horizon_years: int = DEFAULT_HORIZON_YEARS,
+    seed: int = DEFAULT_SEED,
+    dti_limit: float = DTI_LIMIT,
+    income_growth: float = 0.02,
+    income_volatility: float = 0.10,
+    job_loss_probability: float = 0.03,
+    job_loss_income_replacement: float = 0.6,
+    rate_volatility_bps: float = 100.0,
+    rate_mean_reversion: float = 0.2,
+    income_rate_correlation: float = -0.3
+) -> np.ndarray:
+    """
+    Monte Carlo affordability stress test for a portfolio of applications.
+
+    Args:
+        monthly_gross_income: Current monthly gross income per application
+        existing_monthly_debt: Monthly payments on existing debts
+        loan_amount: Requested loan amount
+        loan_term_months: Loan term in months
+        current_interest_rate: Current loan rate (annual %)
+        scenarios: Joint income / rate paths drawn (shared by all applications)
+        horizon_years: Years simulated after today
+        seed: Random seed of the scenarios
+        dti_limit: DTI (%) counted as a breach above this value
+        income_growth: Expected yearly income growth (decimal)
+        income_volatility: Yearly income volatility (decimal)
+        job_loss_probability: Probability of a job loss in any year
+        job_loss_income_replacement: Share of income kept in a job loss year
+        rate_volatility_bps: Yearly rate volatility (basis points)
+        rate_mean_reversion: Share of the gap to the current rate closed each year
+        income_rate_correlation: Correlation of income and rate shocks
+
+    Returns:
+        AFFORDABILITY_SIMULATION_DTYPE record per application: breach
+        probability (%), mean and percentiles of the worst yearly DTI (%),
+        percentiles of the peak monthly loan payment
+    """
+    columns = np.broadcast_arrays(
+        np.asarray(monthly_gross_income, dtype=np.float64),
+        np.asarray(existing_monthly_debt, dtype=np.float64),
+        np.asarray(loan_amount, dtype=np.float64),
+        np.asarray(loan_term_months, dtype=np.float64),
+        np.asarray(current_interest_rate, dtype=np.float64),
+    )
+    gross, debt, amount, term, rate = (np.atleast_1d(column).ravel() for column in columns)
+    income_factor, rate_shocks = _scenario_paths(
+        seed, scenarios, horizon_years, income_growth, income_volatility,
+        job_loss_probability, job_loss_income_replacement, income_rate_correlation
+    )
+
+    out = np.empty(gross.size, dtype=AFFORDABILITY_SIMULATION_DTYPE)
+    chunk = max(1, _CHUNK_VALUES // (scenarios * (horizon_years + 1)))
+    for start in range(0, gross.size, chunk):
+        rows = slice(start, start + chunk)
+        worst_dti, peak_payment = _simulate_chunk(
+            gross[rows], debt[rows], amount[rows], term[rows], rate[rows],
+            income_factor, rate_shocks, rate_volatility_bps / 100, rate_mean_reversion
+        )
+        out["breach_probability"][rows] = np.round((worst_dti > dti_limit).mean(axis=1) * 100, 2)
+        out["mean_worst_dti"][rows] = np.round(worst_dti.mean(axis=1), 2)
+        for percentile, dti, payment in zip(
+            PERCENTILES,
+            np.percentile(worst_dti, PERCENTILES, axis=1),
+            np.percentile(peak_payment, PERCENTILES, axis=1)
+        ):
+            out[f"worst_dti_p{percentile}"][rows] = np.round(dti, 2)
+            out[f"peak_payment_p{percentile}"][rows] = np.round(payment, 2)
+    return out
+
+
+def simulate_affordability(
+    monthly_gross_income: float,
+    existing_monthly_debt: float,
+    loan_amount: float,
+    loan_term_months: int,
+    current_interest_rate: float = 4.0,
+    scenarios: int = DEFAULT_SCENARIOS,
+    horizon_years: int = DEFAULT_HORIZON_YEARS,
+    seed: int = DEFAULT_SEED,
+    dti_limit: float = DTI_LIMIT,
+    **model: float
+) -> Dict[str, Any]:
+    """
+    Monte Carlo affordability stress test for one application.
+
+    Args:
+        monthly_gross_income: Current monthly gross income
+        existing_monthly_debt: Monthly payments on existing debts
+        loan_amount: Requested loan amount
+        loan_term_months: Loan term in months
+        current_interest_rate: Current loan rate (annual %)
+        scenarios: Joint income / rate paths drawn
+        horizon_years: Years simulated after today
+        seed: Random seed of the scenarios
+        dti_limit: DTI (%) counted as a breach above this value
+        **model: Model parameters of simulate_affordability_batch
+
+    Returns:
+        Dictionary with the simulation settings, breach probability (%),
+        mean worst DTI and worst DTI / peak payment percentiles
+    """
+    record = simulate_affordability_batch(
+        monthly_gross_income, existing_monthly_debt, loan_amount, loan_term_months, current_interest_rate,
+        scenarios=scenarios, horizon_years=horizon_years, seed=seed, dti_limit=dti_limit, **model
+    )[0]
+    return {
+        "scenarios": scenarios,
+        "horizon_years": horizon_years,
+        "seed": seed,
+        "dti_limit": dti_limit,
+        "breach_probability": float(record["breach_probability"]),
+        "mean_worst_dti": float(record["mean_worst_dti"]),
+        "worst_dti_percentiles": {f"p{p}": float(record[f"worst_dti_p{p}"]) for p in PERCENTILES},
+        "peak_payment_percentiles": {f"p{p}": float(record[f"peak_payment_p{p}"]) for p in PERCENTILES},
+    }
@@ -0,0 +1,251 @@
+"""
+Amortization schedule calculations.
+
+Deterministic schedules for fully amortizing loans, and the LoanTerms figures
+derived from them. Conventions:
+- Interest accrues monthly at annual_rate / 12 (30/360), rounded to the cent
+  each installment; the last installment repays the remaining balance.
+- With a disbursement date, installments fall on payment_day of each month
+  (clamped to short months), starting the month after disbursement. The first
+  period's days beyond (or short of) 30, counted 30/360, add (or remove)
+  interest on the first installment only; the level payment is unchanged.
+- Stepped rates are (installment, annual rate %) pairs; from that installment
+  on the new rate applies and the payment is re-amortized over the remaining
+  installments.
+- An upfront fee is paid at disbursement (not financed); a monthly fee is
+  due with every installment. Both enter the APR, the annual rate (12 x the
+  monthly internal rate of return) of the cash flows seen by the borrower.
+
+calculations.vectorized.amortization_schedule builds the same schedules for
+many loans at once.
+"""
+
+import math
+from calendar import monthrange
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+RateSteps = Sequence[Tuple[int, float]]
+
+# Newton iterations for the APR stop below this change in the monthly rate
+APR_TOLERANCE = 1e-12
+APR_MAX_ITERATIONS = 100
+
+
+def level_payment(balance: float, monthly_rate: float, installments: int) -> float:
+    """
+    Level payment that repays balance over the given installments.
+
+    Args:
+        balance: Outstanding principal
+        monthly_rate: Monthly interest rate (decimal)
+        installments: Number of remaining installments
+
+    Returns:
+        Payment rounded to the cent
+    """
+    if monthly_rate == 0:
+        return round(balance / installments, 2)
+    return round(balance * monthly_rate / (1 - (1 + monthly_rate) ** -installments), 2)
+
+
+def days_360(start: date, end: date) -> int:
+    """Days between two dates on the 30/360 (bond basis) day count"""
+    start_day = min(start.day, 30)
+    end_day = min(end.day, 30) if start_day == 30 else end.day
+    return (end.year - start.year) * 360 + (end.month - start.month) * 30 + (end_day - start_day)
+
+
+def payment_date(disbursement_date: date, payment_day: int, installment: int) -> date:
+    """Due date of an installment: payment_day of the installment-th month after disbursement"""
+    months = disbursement_date.year * 12 + disbursement_date.month - 1 + installment
+    year, month = divmod(months, 12)
+    return date(year, month + 1, min(payment_day, monthrange(year, month + 1)[1]))
+
+
+def _rate_steps(term_months: int, rate_steps: Optional[RateSteps]) -> Dict[int, float]:
+    """Validated rate steps as {installment: annual rate %}"""
+    if term_months < 1:
+        raise ValueError("term_months must be at least 1")
+    steps = dict(rate_steps or ())
+    if len(steps) != len(rate_steps or ()) or any(not 1 <= installment <= term_months for installment in steps):
+        raise ValueError("rate_steps must name distinct installments between 1 and term_months")
+    return steps
+
+
+def iter_amortization_schedule(
+    amount: float,
+    term_months: int,
+    annual_interest_rate: float,
+    rate_steps: Optional[RateSteps] = None,
+    disbursement_date: Optional[date] = None,
+    payment_day: Optional[int] = None,
+    monthly_fee: float = 0.0
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily generate the amortization schedule, one installment at a time.
+
+    Args:
+        amount: Principal disbursed
+        term_months: Number of monthly installments
+        annual_interest_rate: Annual interest rate (%) until the first rate step
+        rate_steps: (installment, annual rate %) pairs for stepped rates
+        disbursement_date: Disbursement date; without it installments have no dates
+            and every period is 30 days
+        payment_day: Day of month payments are due (default: disbursement day)
+        monthly_fee: Fee due with every installment
+
+    Yields:
+        Dictionary per installment: installment number, payment_date (or None),
+        interest_rate, payment (principal + interest), principal, interest, fee
+        and the remaining balance
+    """
+    steps = _rate_steps(term_months, rate_steps)
+    if disbursement_date is not None:
+        payment_day = payment_day or disbursement_date.day
+        first_period_days = days_360(disbursement_date, payment_date(disbursement_date, payment_day, 1))
+    else:
+        first_period_days = 30
+
+    balance = amount
+    annual_rate = annual_interest_rate
+    payment = 0.0
+    for installment in range(1, term_months + 1):
+        if installment in steps:
+            annual_rate = steps[installment]
+        monthly_rate = annual_rate / 100 / 12
+        if installment == 1 or installment in steps:
+            payment = level_payment(balance, monthly_rate, term_months - installment + 1)
+
+        regular_interest = round(balance * monthly_rate, 2)
+        interest = regular_interest
+        if installment == 1 and first_period_days != 30:
+            odd_interest = balance * (annual_rate / 100 / 360) * (first_period_days - 30)
+            interest = round(regular_interest + odd_interest, 2)
+
+        principal = round(payment - regular_interest, 2)
+        if installment == term_months or principal > balance:
+            principal = balance
+        balance = round(balance - principal, 2)
+
+        yield {
+            "installment": installment,
+            "payment_date": (
+                payment_date(disbursement_date, payment_day, installment) if disbursement_date else None
+            ),
+            "interest_rate": annual_rate,
+            "payment": round(principal + interest, 2),
+            "principal": principal,
+            "interest": interest,
+            "fee": monthly_fee,
+            "balance": balance,
+        }
+        if balance <= 0:
+            break
+
+
+def calculate_apr(
+    net_amount: float,
+    payments: Sequence[float],
+    first_period_days: int = 30,
+    initial_rate: float = 0.0
+) -> float:
+    """
+    Annual percentage rate of a loan's cash flows.
+
+    Solves net_amount = sum(payment_k / (1 + i)^t_k) for the monthly rate i by
+    Newton's method, with t_1 = first_period_days / 30 and one month between
+    later payments.
+
+    Args:
+        net_amount: Amount actually received by the borrower
+        payments: Everything paid with each installment, fees included
+        first_period_days: 30/360 days until the first installment
+        initial_rate: Starting guess for the monthly rate (decimal)
+
+    Returns:
+        APR (%) = 12 x i, rounded to 2 decimals
+    """
+    first_period = first_period_days / 30
+    rate = initial_rate
+    for _ in range(APR_MAX_ITERATIONS):
+        discount = 1 / (1 + rate)
+        factor = math.pow(discount, first_period)
+        time = first_period
+        present_value = 0.0
+        derivative = 0.0
+        for payment in payments:
+            present_value += payment * factor
+            derivative -= time * payment * factor * discount
+            factor *= discount
+            time += 1
+        if derivative == 0:
+            break
+        step = (present_value - net_amount) / derivative
+        rate -= step
+        if abs(step) < APR_TOLERANCE:
+            break
+    # + 0.0 turns a -0.0 left by rounding noise around a zero rate into 0.0
+    return round(rate * 12 * 100, 2) + 0.0
+
+
+def calculate_loan_terms(
+    amount: float,
+    term_months: int,
+    annual_interest_rate: float,
+    rate_steps: Optional[RateSteps] = None,
+    disbursement_date: Optional[date] = None,
+    payment_day: Optional[int] = None,
+    upfront_fee: float = 0.0,
+    monthly_fee: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Summarize the amortization schedule of a loan.
+
+    Args:
+        amount: Principal disbursed
+        term_months: Number of monthly installments
+        annual_interest_rate: Annual interest rate (%) until the first rate step
+        rate_steps: (installment, annual rate %) pairs for stepped rates
+        disbursement_date: Disbursement date (enables payment dates and first-period interest)
+        payment_day: Day of month payments are due (default: disbursement day)
+        upfront_fee: Fee paid at disbursement
+        monthly_fee: Fee due with every installment
+
+    Returns:
+        Dictionary with the initial monthly payment (fee included), total
+        interest, total fees, total repayment (installments and monthly fees),
+        APR, installment count and first / last payment dates
+    """
+    initial_rate = _rate_steps(term_months, rate_steps).get(1, annual_interest_rate)
+    installments: List[Dict[str, Any]] = []
+    total_interest = 0.0
+    total_paid = 0.0
+    for installment in iter_amortization_schedule(
+        amount, term_months, annual_interest_rate, rate_steps, disbursement_date, payment_day, monthly_fee
+    ):
+        installments.append(installment)
+        total_interest += installment["interest"]
+        total_paid += installment["payment"] + installment["fee"]
+
+    first_period_days = 30
+    if disbursement_date is not None:
+        first_period_days = days_360(disbursement_date, installments[0]["payment_date"])
+    initial_monthly_rate = initial_rate / 100 / 12
+    monthly_payment = level_payment(amount, initial_monthly_rate, term_months)
+
+    return {
+        "monthly_payment": round(monthly_payment + monthly_fee, 2),
+        "total_interest": round(total_interest, 2),
+        "total_fees": round(upfront_fee + monthly_fee * len(installments), 2),
+        "total_repayment": round(total_paid, 2),
+        "annual_percentage_rate": calculate_apr(
+            amount - upfront_fee,
+            [installment["payment"] + installment["fee"] for installment in installments],
+            first_period_days,
+            initial_monthly_rate
+        ),
+        "installments": len(installments),
+        "first_payment_date": installments[0]["payment_date"],
+        "final_payment_date": installments[-1]["payment_date"],
+    }
@@ -4,8 +4,15 @@ Debt-related financial calculations.
 All calculations are deterministic and follow standard banking formulas.
 """
 
+import math
 from typing import Dict, List, Any
 
+# Payoff projections stop after 50 years
+MAX_PAYOFF_MONTHS = 600
+
+# Relative slack on the payoff term: absorbs floating-point error when the payments repay the balance exactly
+PAYOFF_TERM_TOLERANCE = 1e-9
+
 
 def calculate_estimated_payment(
     amount: float,
@@ -201,7 +208,14 @@ def project_debt_payoff(
 ) -> Dict[str, Any]:
     """
     Project debt payoff timeline.
-    
+
+    Closed form of the month-by-month amortization (balance * (1 + r) - payment
+    each month): the payoff month is the logarithmic annuity term
+    n = -ln(1 - balance * r / payment) / ln(1 + r), or balance / payment at a
+    zero rate, rounded up and capped at MAX_PAYOFF_MONTHS. The interest paid
+    over n months is n * payment minus the principal repaid, i.e.
+    n * payment + ((1 + r)^n - 1) * (balance - payment / r).
+
     Args:
         debt_balance: Current debt balance
         monthly_payment: Monthly payment amount
@@ -218,29 +232,31 @@ def project_debt_payoff(
         }
     
     monthly_rate = (annual_interest_rate / 100) / 12
-    balance = debt_balance
     months = 0
     total_interest = 0
-    
-    # Cap at 600 months (50 years) to prevent infinite loops
-    max_months = 600
-    
-    while balance > 0 and months < max_months:
-        interest_charge = balance * monthly_rate
-        principal_payment = monthly_payment - interest_charge
-        
-        if principal_payment <= 0:
-            # Payment doesn't cover interest
+
+    if debt_balance > 0:
+        if monthly_payment - debt_balance * monthly_rate <= 0:
+            # Payment doesn't cover interest: the balance never decreases
             return {
                 "months_to_payoff": 999,
                 "total_interest_paid": 0,
                 "total_amount_paid": 0,
                 "error": "Payment insufficient to cover interest"
             }
-        
-        balance -= principal_payment
-        total_interest += interest_charge
-        months += 1
+
+        if monthly_rate == 0:
+            term = debt_balance / monthly_payment
+        else:
+            term = -math.log1p(-debt_balance * monthly_rate / monthly_payment) / math.log1p(monthly_rate)
+        # Terms within rounding error of a whole month are paid off in that month
+        months = min(math.ceil(term * (1 - PAYOFF_TERM_TOLERANCE)), MAX_PAYOFF_MONTHS)
+
+        if monthly_rate == 0:
+            total_interest = 0.0
+        else:
+            growth = math.expm1(months * math.log1p(monthly_rate))
+            total_interest = months * monthly_payment + growth * (debt_balance - monthly_payment / monthly_rate)
     
     return {
         "months_to_payoff": months,
@@ -0,0 +1,1020 @@
+"""
+Vectorized financial calculations.
+
+NumPy mirrors of the scalar functions in this package, for scoring whole
+portfolios at once. Each function takes the same parameters as its scalar
+counterpart, but as arrays (or scalars, which are broadcast); categorical
+parameters are arrays of strings. Functions returning a number return a
+float64 (or int64) array; functions returning a dictionary return a structured
+array whose fields are the dictionary keys, nested keys joined with "_".
+
+Results are bit-for-bit identical to the scalar functions:
+- if/elif chains are evaluated over the same conditions (NaN falls through to
+  the else branch exactly as in Python),
+- min/max clamps keep Python's argument order semantics (see _py_min/_py_max),
+- round(x, n) is reproduced exactly, including half-even ties (see _py_round),
+- powers, logarithms and exponentials go through libm like Python's ** and
+  math module (NumPy's SIMD loops can differ in the last bit).
+
+Inputs for which the scalar function raises ZeroDivisionError produce inf/nan.
+benchmarks/vectorized_calculations.py checks the parity and measures the speedup.
+"""
+
+import math
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .amortization import APR_MAX_ITERATIONS, APR_TOLERANCE
+from .debt_calculations import MAX_PAYOFF_MONTHS, PAYOFF_TERM_TOLERANCE
+
+ArrayLike = Any
+
+# Dekker split constant (2**27 + 1): splits a double into two 26-bit halves
+_SPLITTER = 134217729.0
+
+# Above this magnitude x * 10**ndigits may have a rounding error >= 0.5 (scalar fallback)
+_ROUND_EXACT_LIMIT = 2.0 ** 44
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _float(values: ArrayLike) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _py_max(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """Elementwise max(a, b) with Python's semantics: b only if b > a"""
+    return np.where(b > a, b, a)
+
+
+def _py_min(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """Elementwise min(a, b) with Python's semantics: b only if b < a"""
+    return np.where(b < a, b, a)
+
+
+def _py_round(values: ArrayLike, ndigits: int) -> np.ndarray:
+    """
+    Elementwise round(x, ndigits) identical to Python's float rounding.
+
+    Python rounds the exact binary value to ndigits decimals, ties to even.
+    x * 10**ndigits rounds to hi; hi is rounded half-even, and where hi ends in
+    exactly .5 the exact remainder lo (Dekker's product) decides the direction.
+    """
+    x = _float(values)
+    scale = float(10 ** ndigits)
+    with np.errstate(invalid="ignore", over="ignore"):
+        hi = x * scale
+        n = np.round(hi)
+        ties = np.flatnonzero(np.abs(hi - n) == 0.5)
+        if ties.size:
+            # Exact .5 in the rounded product: the exact remainder lo breaks the tie
+            tie_x, tie_hi = x.ravel()[ties], hi.ravel()[ties]
+            split = tie_x * _SPLITTER
+            x_hi = split - (split - tie_x)
+            x_lo = tie_x - x_hi
+            lo = (x_hi * scale - tie_hi) + x_lo * scale
+            below = np.floor(tie_hi)
+            n = np.array(n, copy=True)
+            n.ravel()[ties] = np.select([lo > 0, lo < 0], [below + 1, below], n.ravel()[ties])
+        result = n / scale
+
+    large = np.abs(x) >= _ROUND_EXACT_LIMIT
+    if large.any():
+        result = np.array(result, copy=True)
+        result[large] = [round(value, ndigits) for value in x[large].tolist()]
+    return result
+
+
+def _libm(function: Any, *values: ArrayLike) -> np.ndarray:
+    """Elementwise math-module function (libm), which NumPy's SIMD loops can differ from in the last bit"""
+    arrays = np.broadcast_arrays(*(_float(value) for value in values))
+    results = map(function, *(array.ravel().tolist() for array in arrays))
+    return np.fromiter(results, dtype=np.float64, count=arrays[0].size).reshape(arrays[0].shape)
+
+
+def _pow(base: np.ndarray, exponent: np.ndarray) -> np.ndarray:
+    """Elementwise base ** exponent through libm pow, as Python's float ** does"""
+    return _libm(math.pow, base, exponent)
+
+
+def _lookup(values: ArrayLike, table: Dict[str, Any], default: Any, dtype: Any = np.float64) -> np.ndarray:
+    """Map strings through table (case-insensitive, like the scalar .lower() lookups)"""
+    values = np.asarray(values)
+    out = np.full(values.shape, default, dtype=dtype)
+    rest = np.ones(values.shape, dtype=bool)
+    if values.dtype.kind == "U":
+        # Exact matches of the (lower-case) keys need no per-string work
+        for key, value in table.items():
+            match = values == key
+            out[match] = value
+            rest &= ~match
+    if rest.any():
+        unique, inverse = np.unique(values[rest], return_inverse=True)
+        mapped = np.array([table.get(str(value).lower(), default) for value in unique], dtype=dtype)
+        out[rest] = mapped[inverse]
+    return out
+
+
+def _select(conditions: list, choices: list, default: Any) -> np.ndarray:
+    """if/elif/else chain of scalar choices: the first true condition wins, default otherwise"""
+    out = np.full(np.broadcast(*conditions).shape, default, dtype=np.result_type(*choices, default))
+    # Assigned last to first, so earlier conditions overwrite later ones
+    for condition, choice in zip(reversed(conditions), reversed(choices)):
+        out[condition] = choice
+    return out
+
+
+def _labels(labels: np.ndarray, conditions: list) -> np.ndarray:
+    """Label of the first true condition, the last label otherwise"""
+    return labels[_select(conditions, list(range(len(conditions))), len(conditions))]
+
+
+def _records(dtype: np.dtype, **fields: ArrayLike) -> np.ndarray:
+    """Structured array with the given fields, broadcast to a common shape"""
+    arrays = np.broadcast_arrays(*(np.asarray(value) for value in fields.values()))
+    out = np.empty(arrays[0].shape if arrays else (), dtype=dtype)
+    for name, value in zip(fields, arrays):
+        out[name] = value
+    return out
+
+
+# =============================================================================
+# Income calculations
+# =============================================================================
+
+ANNUAL_INCOME_DTYPE = np.dtype([("annual_gross", "f8"), ("annual_net", "f8")])
+
+MAX_AFFORDABLE_PAYMENT_DTYPE = np.dtype([
+    ("max_payment_dti", "f8"),
+    ("max_payment_housing", "f8"),
+    ("recommended_max_payment", "f8"),
+])
+
+INCOME_STRESS_TEST_DTYPE = np.dtype([
+    ("income_stress_stressed_income", "f8"),
+    ("income_stress_dti_ratio", "f8"),
+    ("income_stress_passes", "?"),
+    ("rate_stress_stressed_rate", "f8"),
+    ("rate_stress_stressed_payment", "f8"),
+    ("rate_stress_dti_ratio", "f8"),
+    ("rate_stress_passes", "?"),
+    ("combined_stress_stressed_income", "f8"),
+    ("combined_stress_stressed_payment", "f8"),
+    ("combined_stress_dti_ratio", "f8"),
+    ("combined_stress_passes", "?"),
+    ("overall_passes_stress_test", "?"),
+])
+
+_EMPLOYMENT_TYPE_POINTS = {
+    "employed": 15,
+    "self_employed": 5,
+    "contractor": -5,
+    "freelance": -5,
+    "unemployed": -20,
+    "student": -20,
+}
+
+_INCOME_TREND_POINTS = {"growing": 10, "declining": -15}
+
+
+def calculate_annual_income(monthly_gross: ArrayLike, monthly_net: ArrayLike) -> np.ndarray:
+    """Vectorized calculate_annual_income (ANNUAL_INCOME_DTYPE records)"""
+    return _records(
+        ANNUAL_INCOME_DTYPE,
+        annual_gross=_float(monthly_gross) * 12,
+        annual_net=_float(monthly_net) * 12
+    )
+
+
+def calculate_disposable_income(
+    monthly_net_income: ArrayLike,
+    essential_expenses: ArrayLike = 0.0,
+    existing_debt_payments: ArrayLike = 0.0
+) -> np.ndarray:
+    """Vectorized calculate_disposable_income"""
+    return _float(monthly_net_income) - essential_expenses - existing_debt_payments
+
+
+def calculate_max_affordable_payment(
+    monthly_gross_income: ArrayLike,
+    existing_monthly_debt: ArrayLike,
+    max_dti_ratio: ArrayLike = 43.0,
+    housing_expense_ratio: ArrayLike = 28.0
+) -> np.ndarray:
+    """Vectorized calculate_max_affordable_payment (MAX_AFFORDABLE_PAYMENT_DTYPE records)"""
+    income = _float(monthly_gross_income)
+    max_payment_dti = (income * max_dti_ratio) / 100 - existing_monthly_debt
+    max_payment_housing = (income * housing_expense_ratio) / 100
+    return _records(
+        MAX_AFFORDABLE_PAYMENT_DTYPE,
+        max_payment_dti=_py_max(0.0, max_payment_dti),
+        max_payment_housing=max_payment_housing,
+        recommended_max_payment=_py_min(max_payment_dti, max_payment_housing)
+    )
+
+
+def perform_income_stress_test(
+    monthly_gross_income: ArrayLike,
+    monthly_payment: ArrayLike,
+    income_reduction_pct: ArrayLike = 20.0,
+    interest_rate_increase_bps: ArrayLike = 200.0,
+    current_interest_rate: ArrayLike = 4.0,
+    loan_amount: ArrayLike = 0.0,
+    loan_term_months: ArrayLike = 240
+) -> np.ndarray:
+    """Vectorized perform_income_stress_test (INCOME_STRESS_TEST_DTYPE records)"""
+    income = _float(monthly_gross_income)
+    payment = _float(monthly_payment)
+    bps = _float(interest_rate_increase_bps)
+    loan_amount = _float(loan_amount)
+    term = _float(loan_term_months)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        stressed_income = income * (1 - _float(income_reduction_pct) / 100)
+        income_stress_dti = np.where(stressed_income > 0, (payment / stressed_income) * 100, 999.0)
+
+        stressed_rate = current_interest_rate + (bps / 100)
+        monthly_rate = (stressed_rate / 100) / 12
+        growth = _pow(1 + monthly_rate, term)
+        amortized = np.where(
+            monthly_rate > 0,
+            loan_amount * (monthly_rate * growth) / (growth - 1),
+            loan_amount / term
+        )
+        stressed_payment = np.where(
+            (loan_amount > 0) & (term > 0),
+            amortized,
+            payment * (1 + (bps / 10000))
+        )
+        rate_stress_dti = (stressed_payment / income) * 100
+        combined_dti = np.where(stressed_income > 0, (stressed_payment / stressed_income) * 100, 999.0)
+
+    passes_income_stress = income_stress_dti <= 43.0
+    passes_rate_stress = rate_stress_dti <= 43.0
+    return _records(
+        INCOME_STRESS_TEST_DTYPE,
+        income_stress_stressed_income=_py_round(stressed_income, 2),
+        income_stress_dti_ratio=_py_round(income_stress_dti, 2),
+        income_stress_passes=passes_income_stress,
+        rate_stress_stressed_rate=_py_round(stressed_rate, 2),
+        rate_stress_stressed_payment=_py_round(stressed_payment, 2),
+        rate_stress_dti_ratio=_py_round(rate_stress_dti, 2),
+        rate_stress_passes=passes_rate_stress,
+        combined_stress_stressed_income=_py_round(stressed_income, 2),
+        combined_stress_stressed_payment=_py_round(stressed_payment, 2),
+        combined_stress_dti_ratio=_py_round(combined_dti, 2),
+        combined_stress_passes=combined_dti <= 43.0,
+        overall_passes_stress_test=passes_income_stress & passes_rate_stress
+    )
+
+
+def calculate_income_stability_score(
+    years_employed: ArrayLike,
+    employment_type: ArrayLike,
+    income_trend: ArrayLike = "stable",
+    has_multiple_sources: ArrayLike = False
+) -> np.ndarray:
+    """Vectorized calculate_income_stability_score (int64 scores 0-100)"""
+    years = _float(years_employed)
+    score = 50 + _select([years >= 5, years >= 3, years >= 1], [20, 15, 10], -10)
+    score = score + _lookup(employment_type, _EMPLOYMENT_TYPE_POINTS, 0, np.int64)
+    score = score + _lookup(income_trend, _INCOME_TREND_POINTS, 0, np.int64)
+    score = score + np.where(np.asarray(has_multiple_sources, dtype=bool), 5, 0)
+    return np.clip(score, 0, 100).astype(np.int64)
+
+
+# =============================================================================
+# Debt calculations
+# =============================================================================
+
+DEBT_BURDEN_DTYPE = np.dtype([
+    ("dti_assessment_level", "U10"),
+    ("dti_assessment_score", "i8"),
+    ("dscr_assessment_level", "U10"),
+    ("dscr_assessment_score", "i8"),
+    ("overall_debt_burden", "U10"),
+    ("overall_score", "f8"),
+])
+
+DEBT_PAYOFF_DTYPE = np.dtype([
+    ("months_to_payoff", "i8"),
+    ("years_to_payoff", "f8"),
+    ("total_interest_paid", "f8"),
+    ("total_amount_paid", "f8"),
+    ("payment_insufficient", "?"),
+])
+
+_DTI_LEVELS = np.array(["excellent", "good", "acceptable", "high", "very_high"])
+_DSCR_LEVELS = np.array(["strong", "good", "acceptable", "weak", "critical"])
+_BURDEN_LEVELS = np.array(["low", "moderate", "high", "very_high"])
+
+
+def calculate_estimated_payment(
+    amount: ArrayLike,
+    term_months: ArrayLike,
+    rate: ArrayLike = 0.05
+) -> np.ndarray:
+    """Vectorized calculate_estimated_payment (a zero rate returns the unrounded amount / term)"""
+    amount = _float(amount)
+    term = _float(term_months)
+    monthly_rate = _float(rate) / 12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payment = (monthly_rate * amount) / (1 - _pow(1 + monthly_rate, -term))
+        return np.where(monthly_rate == 0, amount / term, _py_round(payment, 2))
+
+
+def calculate_total_monthly_debt(monthly_payments: ArrayLike) -> np.ndarray:
+    """
+    Vectorized calculate_total_monthly_debt.
+
+    Args:
+        monthly_payments: (applications, debts) matrix of monthly payments,
+            zero-padded for applications with fewer debts
+
+    Returns:
+        Total per application, summed left to right like sum()
+    """
+    payments = _float(monthly_payments)
+    total = np.zeros(payments.shape[:-1])
+    for column in range(payments.shape[-1]):
+        total = total + payments[..., column]
+    return total
+
+
+def calculate_dti_ratio(total_monthly_debt: ArrayLike, monthly_gross_income: ArrayLike) -> np.ndarray:
+    """Vectorized calculate_dti_ratio (999.0 where income <= 0)"""
+    income = _float(monthly_gross_income)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(income <= 0, 999.0, (total_monthly_debt / income) * 100)
+
+
+def calculate_dscr(monthly_net_income: ArrayLike, total_monthly_debt: ArrayLike) -> np.ndarray:
+    """Vectorized calculate_dscr (999.0 where there is no debt)"""
+    debt = _float(total_monthly_debt)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(debt <= 0, 999.0, monthly_net_income / debt)
+
+
+def assess_debt_burden(dti_ratio: ArrayLike, dscr: ArrayLike) -> np.ndarray:
+    """Vectorized assess_debt_burden (DEBT_BURDEN_DTYPE records)"""
+    dti = _float(dti_ratio)
+    dscr = _float(dscr)
+    dti_conditions = [dti < 20, dti < 28, dti < 36, dti < 43]
+    dscr_conditions = [dscr >= 2.0, dscr >= 1.5, dscr >= 1.25, dscr >= 1.0]
+    dti_score = _select(dti_conditions, [100, 85, 70, 50], 25)
+    dscr_score = _select(dscr_conditions, [100, 85, 70, 50], 25)
+    overall_score = (dti_score + dscr_score) / 2
+    return _records(
+        DEBT_BURDEN_DTYPE,
+        dti_assessment_level=_labels(_DTI_LEVELS, dti_conditions),
+        dti_assessment_score=dti_score,
+        dscr_assessment_level=_labels(_DSCR_LEVELS, dscr_conditions),
+        dscr_assessment_score=dscr_score,
+        overall_debt_burden=_labels(
+            _BURDEN_LEVELS, [overall_score >= 85, overall_score >= 70, overall_score >= 50]
+        ),
+        overall_score=_py_round(overall_score, 2)
+    )
+
+
+def calculate_debt_utilization(total_debt_balance: ArrayLike, total_credit_limit: ArrayLike) -> np.ndarray:
+    """Vectorized calculate_debt_utilization (0.0 where there is no credit limit)"""
+    limit = _float(total_credit_limit)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(limit <= 0, 0.0, (total_debt_balance / limit) * 100)
+
+
+def project_debt_payoff(
+    debt_balance: ArrayLike,
+    monthly_payment: ArrayLike,
+    annual_interest_rate: ArrayLike
+) -> np.ndarray:
+    """
+    Vectorized project_debt_payoff, e.g. over every existing debt of a portfolio.
+
+    Args:
+        debt_balance: Current debt balances
+        monthly_payment: Monthly payment amounts
+        annual_interest_rate: Annual interest rates (%)
+
+    Returns:
+        DEBT_PAYOFF_DTYPE records. years_to_payoff is NaN where the scalar
+        result has no such key (no payment, or a payment that does not cover
+        interest); payment_insufficient marks the results carrying "error".
+    """
+    balance, payment, rate = np.broadcast_arrays(
+        _float(debt_balance), _float(monthly_payment), _float(annual_interest_rate) / 100 / 12
+    )
+    no_payment = payment <= 0
+    outstanding = ~no_payment & (balance > 0)
+    insufficient = outstanding & (payment - balance * rate <= 0)
+    active = outstanding & ~insufficient
+
+    term = np.zeros(balance.shape)
+    zero_rate = active & (rate == 0)
+    term[zero_rate] = balance[zero_rate] / payment[zero_rate]
+    accruing = active & (rate != 0)
+    b, p, r = balance[accruing], payment[accruing], rate[accruing]
+    log_growth = _libm(math.log1p, r)
+    term[accruing] = -_libm(math.log1p, -b * r / p) / log_growth
+    months = np.minimum(np.ceil(term * (1 - PAYOFF_TERM_TOLERANCE)), MAX_PAYOFF_MONTHS).astype(np.int64)
+
+    interest = np.zeros(balance.shape)
+    n = months[accruing]
+    interest[accruing] = n * p + _libm(math.expm1, n * log_growth) * (b - p / r)
+
+    months[no_payment | insufficient] = 999
+    years = np.where(no_payment | insufficient, np.nan, _py_round(months / 12, 1))
+    total_paid = np.where(no_payment, balance, np.where(insufficient, 0.0, _py_round(balance + interest, 2)))
+    return _records(
+        DEBT_PAYOFF_DTYPE,
+        months_to_payoff=months,
+        years_to_payoff=years,
+        total_interest_paid=_py_round(interest, 2),
+        total_amount_paid=total_paid,
+        payment_insufficient=insufficient
+    )
+
+
+# =============================================================================
+# Collateral calculations
+# =============================================================================
+
+LIQUIDATION_VALUE_DTYPE = np.dtype([
+    ("market_value", "f8"),
+    ("liquidation_discount", "f8"),
+    ("liquidation_value", "f8"),
+    ("conservative_value", "f8"),
+    ("recovery_rate", "f8"),
+])
+
+COLLATERAL_COVERAGE_DTYPE = np.dtype([
+    ("coverage_ratio", "f8"),
+    ("required_coverage", "f8"),
+    ("meets_requirement", "?"),
+    ("shortfall", "f8"),
+    ("excess_coverage", "f8"),
+])
+
+_LIQUIDATION_TYPE_DISCOUNTS = {
+    "real_estate": 0.20,
+    "residential_property": 0.20,
+    "commercial_property": 0.25,
+    "vehicle": 0.30,
+    "equipment": 0.40,
+    "securities": 0.10,
+    "inventory": 0.50,
+    "other": 0.50,
+}
+
+_LIQUIDATION_CONDITION_ADJUSTMENTS = {"excellent": -0.05, "good": 0.00, "fair": 0.10, "poor": 0.20}
+
+_PREFERRED_COLLATERAL_POINTS = {"real_estate": 10, "residential_property": 10, "securities": 10}
+
+_MARKETABILITY_POINTS = {"excellent": 15, "good": 10, "fair": 0, "poor": -15}
+
+_LTV_QUALITIES = np.array(["excellent", "good", "acceptable", "high_risk", "very_high_risk"])
+_COLLATERAL_QUALITIES = np.array(["excellent", "good", "acceptable", "weak", "poor"])
+
+
+def calculate_ltv_ratio(loan_amount: ArrayLike, collateral_value: ArrayLike) -> np.ndarray:
+    """Vectorized calculate_ltv_ratio (999.0 where the collateral value is <= 0)"""
+    value = _float(collateral_value)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(value <= 0, 999.0, (loan_amount / value) * 100)
+
+
+def calculate_liquidation_value(
+    market_value: ArrayLike,
+    collateral_type: ArrayLike,
+    condition: ArrayLike = "good"
+) -> np.ndarray:
+    """Vectorized calculate_liquidation_value (LIQUIDATION_VALUE_DTYPE records)"""
+    market_value = _float(market_value)
+    base_discount = _lookup(collateral_type, _LIQUIDATION_TYPE_DISCOUNTS, 0.50)
+    condition_adjustment = _lookup(condition, _LIQUIDATION_CONDITION_ADJUSTMENTS, 0.00)
+    total_discount = _py_min(0.80, base_discount + condition_adjustment)
+    return _records(
+        LIQUIDATION_VALUE_DTYPE,
+        market_value=_py_round(market_value, 2),
+        liquidation_discount=_py_round(total_discount * 100, 2),
+        liquidation_value=_py_round(market_value * (1 - total_discount), 2),
+        conservative_value=_py_round(market_value * (1 - _py_min(0.90, total_discount + 0.10)), 2),
+        recovery_rate=_py_round((1 - total_discount) * 100, 2)
+    )
+
+
+def assess_collateral_quality(
+    ltv_ratio: ArrayLike,
+    collateral_type: ArrayLike,
+    has_insurance: ArrayLike = False,
+    has_clear_title: ArrayLike = True,
+    marketability: ArrayLike = "good"
+) -> np.ndarray:
+    """
+    Vectorized assess_collateral_quality.
+
+    Returns:
+        Structured array with ltv_quality, overall_quality, quality_score and
+        the has_insurance, has_clear_title and marketability inputs
+    """
+    ltv = _float(ltv_ratio)
+    has_insurance = np.asarray(has_insurance, dtype=bool)
+    has_clear_title = np.asarray(has_clear_title, dtype=bool)
+    marketability = np.asarray(marketability, dtype=str)
+
+    ltv_conditions = [ltv < 60, ltv < 75, ltv < 85, ltv < 95]
+    score = 50 + _select(ltv_conditions, [30, 20, 10, -10], -30)
+    score = score + _lookup(collateral_type, _PREFERRED_COLLATERAL_POINTS, 0, np.int64)
+    score = score + np.where(has_insurance, 10, -5)
+    score = score + np.where(has_clear_title, 0, -20)
+    score = score + _lookup(marketability, _MARKETABILITY_POINTS, 0, np.int64)
+    final_score = np.clip(score, 0, 100)
+
+    dtype = np.dtype([
+        ("ltv_quality", "U14"),
+        ("overall_quality", "U10"),
+        ("quality_score", "i8"),
+        ("has_insurance", "?"),
+        ("has_clear_title", "?"),
+        ("marketability", marketability.dtype),
+    ])
+    return _records(
+        dtype,
+        ltv_quality=_labels(_LTV_QUALITIES, ltv_conditions),
+        overall_quality=_labels(
+            _COLLATERAL_QUALITIES,
+            [final_score >= 80, final_score >= 65, final_score >= 50, final_score >= 35]
+        ),
+        quality_score=final_score,
+        has_insurance=has_insurance,
+        has_clear_title=has_clear_title,
+        marketability=marketability
+    )
+
+
+def calculate_collateral_coverage(
+    loan_amount: ArrayLike,
+    liquidation_value: ArrayLike,
+    required_coverage: ArrayLike = 1.2
+) -> np.ndarray:
+    """
+    Vectorized calculate_collateral_coverage (COLLATERAL_COVERAGE_DTYPE records).
+
+    Rows with loan_amount <= 0, where the scalar version returns only
+    coverage_ratio, meets_requirement and shortfall, report 0 excess coverage.
+    """
+    loan_amount = _float(loan_amount)
+    liquidation_value = _float(liquidation_value)
+    required_coverage = _float(required_coverage)
+    valid = loan_amount > 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coverage_ratio = liquidation_value / loan_amount
+    required_value = required_coverage * loan_amount
+    return _records(
+        COLLATERAL_COVERAGE_DTYPE,
+        coverage_ratio=np.where(valid, _py_round(coverage_ratio, 2), 0.0),
+        required_coverage=required_coverage,
+        meets_requirement=valid & (coverage_ratio >= required_coverage),
+        shortfall=np.where(valid, _py_round(_py_max(0.0, required_value - liquidation_value), 2), 0.0),
+        excess_coverage=np.where(valid, _py_round(_py_max(0.0, liquidation_value - required_value), 2), 0.0)
+    )
+
+
+# =============================================================================
+# Risk calculations
+# =============================================================================
+
+EXPECTED_LOSS_DTYPE = np.dtype([
+    ("expected_loss_amount", "f8"),
+    ("expected_loss_percentage", "f8"),
+    ("probability_of_default", "f8"),
+    ("loss_given_default", "f8"),
+    ("exposure_at_default", "f8"),
+])
+
+RISK_SCORE_DTYPE = np.dtype([
+    ("risk_score", "f8"),
+    ("overall_risk_level", "U9"),
+    ("component_scores_pd_score", "f8"),
+    ("component_scores_lgd_score", "f8"),
+    ("component_scores_dti_score", "f8"),
+    ("component_scores_ltv_score", "f8"),
+    ("component_scores_credit_score", "f8"),
+    ("component_scores_income_stability_score", "f8"),
+    ("component_scores_collateral_quality_score", "f8"),
+])
+
+CAPITAL_REQUIREMENT_DTYPE = np.dtype([
+    ("loan_amount", "f8"),
+    ("risk_weight", "f8"),
+    ("risk_weighted_assets", "f8"),
+    ("minimum_capital_ratio", "f8"),
+    ("capital_required", "f8"),
+])
+
+_DEBT_BURDEN_PD_COMPONENTS = {"low": 2.0, "moderate": 8.0, "high": 18.0, "very_high": 30.0}
+
+_COLLATERAL_QUALITY_RECOVERY = {"excellent": 15, "good": 10, "acceptable": 0, "weak": -10, "poor": -20}
+
+_RISK_LEVELS = np.array(["low", "moderate", "elevated", "high", "very_high"])
+
+
+def calculate_probability_of_default(
+    credit_score: ArrayLike,
+    dti_ratio: ArrayLike,
+    employment_years: ArrayLike,
+    payment_history_score: ArrayLike = 100,
+    debt_burden_level: ArrayLike = "moderate"
+) -> np.ndarray:
+    """Vectorized calculate_probability_of_default (PD %, 0.1-99)"""
+    credit_score = _float(credit_score)
+    dti = _float(dti_ratio)
+    years = _float(employment_years)
+
+    credit_component = _select(
+        [credit_score >= 750, credit_score >= 700, credit_score >= 650, credit_score >= 600, credit_score >= 550],
+        [2.0, 5.0, 10.0, 20.0, 35.0],
+        50.0
+    )
+    dti_component = _select([dti < 20, dti < 28, dti < 36, dti < 43], [2.0, 5.0, 12.0, 25.0], 40.0)
+    employment_component = _select([years >= 5, years >= 3, years >= 1], [2.0, 5.0, 10.0], 20.0)
+    payment_component = (100 - _float(payment_history_score)) / 5
+    debt_component = _lookup(debt_burden_level, _DEBT_BURDEN_PD_COMPONENTS, 15.0)
+
+    pd = (
+        credit_component * 0.40 +
+        dti_component * 0.25 +
+        employment_component * 0.15 +
+        payment_component * 0.10 +
+        debt_component * 0.10
+    )
+    return _py_max(0.1, _py_min(99.0, pd))
+
+
+def calculate_loss_given_default(
+    ltv_ratio: ArrayLike,
+    collateral_quality: ArrayLike,
+    recovery_rate: ArrayLike = 70.0,
+    has_guarantor: ArrayLike = False
+) -> np.ndarray:
+    """Vectorized calculate_loss_given_default (LGD %, 5-90)"""
+    ltv = _float(ltv_ratio)
+    ltv_adjustment = _select([ltv < 60, ltv < 75, ltv < 85, ltv < 95], [10, 5, 0, -10], -20)
+    quality_adjustment = _lookup(collateral_quality, _COLLATERAL_QUALITY_RECOVERY, 0, np.int64)
+    guarantor_adjustment = np.where(np.asarray(has_guarantor, dtype=bool), 10, 0)
+
+    total_recovery = _float(recovery_rate) + ltv_adjustment + quality_adjustment + guarantor_adjustment
+    total_recovery = _py_max(10, _py_min(95, total_recovery))
+    return _py_max(5.0, _py_min(90.0, 100 - total_recovery))
+
+
+def calculate_expected_loss(
+    loan_amount: ArrayLike,
+    probability_of_default: ArrayLike,
+    loss_given_default: ArrayLike,
+    exposure_at_default: Optional[ArrayLike] = None
+) -> np.ndarray:
+    """Vectorized calculate_expected_loss (EXPECTED_LOSS_DTYPE records)"""
+    loan_amount = _float(loan_amount)
+    probability_of_default = _float(probability_of_default)
+    loss_given_default = _float(loss_given_default)
+    ead = _float(exposure_at_default) if exposure_at_default is not None else loan_amount
+
+    expected_loss = ead * (probability_of_default / 100) * (loss_given_default / 100)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected_loss_pct = np.where(loan_amount > 0, (expected_loss / loan_amount) * 100, 0.0)
+    return _records(
+        EXPECTED_LOSS_DTYPE,
+        expected_loss_amount=_py_round(expected_loss, 2),
+        expected_loss_percentage=_py_round(expected_loss_pct, 2),
+        probability_of_default=_py_round(probability_of_default, 2),
+        loss_given_default=_py_round(loss_given_default, 2),
+        exposure_at_default=_py_round(ead, 2)
+    )
+
+
+def calculate_risk_score(
+    probability_of_default: ArrayLike,
+    loss_given_default: ArrayLike,
+    dti_ratio: ArrayLike,
+    ltv_ratio: ArrayLike,
+    credit_score: ArrayLike,
+    income_stability_score: ArrayLike = 50,
+    collateral_quality_score: ArrayLike = 50
+) -> np.ndarray:
+    """Vectorized calculate_risk_score (RISK_SCORE_DTYPE records)"""
+    dti = _float(dti_ratio)
+    ltv = _float(ltv_ratio)
+    income_stability_score = _float(income_stability_score)
+    collateral_quality_score = _float(collateral_quality_score)
+
+    pd_score = _py_max(0, 100 - _float(probability_of_default))
+    lgd_score = _py_max(0, 100 - _float(loss_given_default))
+    dti_score = _select([dti < 20, dti < 28, dti < 36, dti < 43], [100, 85, 70, 50], 25)
+    ltv_score = _select([ltv < 60, ltv < 75, ltv < 85, ltv < 95], [100, 85, 70, 50], 25)
+    credit_normalized = ((_float(credit_score) - 300) / (850 - 300)) * 100
+    credit_normalized = _py_max(0, _py_min(100, credit_normalized))
+
+    risk_score = (
+        pd_score * 0.30 +
+        lgd_score * 0.20 +
+        dti_score * 0.15 +
+        ltv_score * 0.15 +
+        credit_normalized * 0.10 +
+        income_stability_score * 0.05 +
+        collateral_quality_score * 0.05
+    )
+    return _records(
+        RISK_SCORE_DTYPE,
+        risk_score=_py_round(risk_score, 2),
+        overall_risk_level=_labels(
+            _RISK_LEVELS, [risk_score >= 80, risk_score >= 65, risk_score >= 50, risk_score >= 35]
+        ),
+        component_scores_pd_score=_py_round(pd_score, 2),
+        component_scores_lgd_score=_py_round(lgd_score, 2),
+        component_scores_dti_score=dti_score,
+        component_scores_ltv_score=ltv_score,
+        component_scores_credit_score=_py_round(credit_normalized, 2),
+        component_scores_income_stability_score=_py_round(income_stability_score, 2),
+        component_scores_collateral_quality_score=_py_round(collateral_quality_score, 2)
+    )
+
+
+def calculate_capital_requirement(
+    loan_amount: ArrayLike,
+    risk_weight: ArrayLike,
+    minimum_capital_ratio: ArrayLike = 8.0
+) -> np.ndarray:
+    """Vectorized calculate_capital_requirement (CAPITAL_REQUIREMENT_DTYPE records)"""
+    loan_amount = _float(loan_amount)
+    risk_weighted_assets = loan_amount * (_float(risk_weight) / 100)
+    capital_required = risk_weighted_assets * (_float(minimum_capital_ratio) / 100)
+    return _records(
+        CAPITAL_REQUIREMENT_DTYPE,
+        loan_amount=_py_round(loan_amount, 2),
+        risk_weight=risk_weight,
+        risk_weighted_assets=_py_round(risk_weighted_assets, 2),
+        minimum_capital_ratio=minimum_capital_ratio,
+        capital_required=_py_round(capital_required, 2)
+    )
+
+
+# =============================================================================
+# Amortization
+# =============================================================================
+
+AMORTIZATION_SCHEDULE_DTYPE = np.dtype([
+    ("installment", "i8"),
+    ("payment_date", "M8[D]"),
+    ("interest_rate", "f8"),
+    ("payment", "f8"),
+    ("principal", "f8"),
+    ("interest", "f8"),
+    ("fee", "f8"),
+    ("balance", "f8"),
+])
+
+LOAN_TERMS_DTYPE = np.dtype([
+    ("monthly_payment", "f8"),
+    ("total_interest", "f8"),
+    ("total_fees", "f8"),
+    ("total_repayment", "f8"),
+    ("annual_percentage_rate", "f8"),
+    ("installments", "i8"),
+    ("first_payment_date", "M8[D]"),
+    ("final_payment_date", "M8[D]"),
+])
+
+
+def level_payment(balance: ArrayLike, monthly_rate: ArrayLike, installments: ArrayLike) -> np.ndarray:
+    """Vectorized level_payment"""
+    balance = _float(balance)
+    monthly_rate = _float(monthly_rate)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = balance * monthly_rate / (1 - _pow(1 + monthly_rate, -_float(installments)))
+        return np.where(monthly_rate == 0, _py_round(balance / installments, 2), _py_round(annuity, 2))
+
+
+def _year_month_day(dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    months = dates.astype("M8[M]")
+    return (
+        dates.astype("M8[Y]").astype(np.int64) + 1970,
+        months.astype(np.int64) % 12 + 1,
+        (dates - months.astype("M8[D]")).astype(np.int64) + 1,
+    )
+
+
+def days_360(start: ArrayLike, end: ArrayLike) -> np.ndarray:
+    """Vectorized days_360 over datetime64 dates"""
+    start_year, start_month, start_day = _year_month_day(np.asarray(start, dtype="M8[D]"))
+    end_year, end_month, end_day = _year_month_day(np.asarray(end, dtype="M8[D]"))
+    start_day = np.minimum(start_day, 30)
+    end_day = np.where(start_day == 30, np.minimum(end_day, 30), end_day)
+    return (end_year - start_year) * 360 + (end_month - start_month) * 30 + (end_day - start_day)
+
+
+def payment_date(disbursement_date: ArrayLike, payment_day: ArrayLike, installment: ArrayLike) -> np.ndarray:
+    """Vectorized payment_date (NaT disbursement dates give NaT)"""
+    month = np.asarray(disbursement_date, dtype="M8[D]").astype("M8[M]") + np.asarray(installment, dtype="m8[M]")
+    first_day = month.astype("M8[D]")
+    month_length = ((month + np.timedelta64(1, "M")).astype("M8[D]") - first_day).astype(np.int64)
+    return first_day + (np.minimum(payment_day, month_length) - 1).astype("m8[D]")
+
+
+def _schedule_inputs(
+    amount: ArrayLike,
+    term_months: ArrayLike,
+    annual_interest_rate: ArrayLike,
+    rate_steps: Optional[Sequence[Tuple[int, ArrayLike]]],
+    disbursement_date: Optional[ArrayLike],
+    payment_day: Optional[ArrayLike],
+    monthly_fee: ArrayLike
+) -> Tuple[np.ndarray, ...]:
+    """1-D loan columns, validated {installment: rates} steps, payment days and first period days"""
+    amount, term, rate, fee = (
+        np.array(column, ndmin=1) for column in np.broadcast_arrays(
+            _float(amount), np.asarray(term_months, dtype=np.int64), _float(annual_interest_rate), _float(monthly_fee)
+        )
+    )
+    if (term < 1).any():
+        raise ValueError("term_months must be at least 1")
+    installments = [installment for installment, _ in rate_steps or ()]
+    if len(set(installments)) != len(installments) or any(not 1 <= k <= term.min() for k in installments):
+        raise ValueError("rate_steps must name distinct installments between 1 and term_months")
+    steps = {installment: np.broadcast_to(_float(step_rate), amount.shape) for installment, step_rate in rate_steps or ()}
+
+    if disbursement_date is None:
+        dates = np.full(amount.shape, np.datetime64("NaT", "D"), dtype="M8[D]")
+    else:
+        dates = np.broadcast_to(np.asarray(disbursement_date, dtype="M8[D]"), amount.shape)
+    disbursement_day = _year_month_day(dates)[2]
+    if payment_day is None:
+        day = disbursement_day
+    else:
+        day = np.asarray(payment_day, dtype=np.int64)
+        day = np.where(day != 0, day, disbursement_day)
+    first_period_days = np.where(np.isnat(dates), 30, days_360(dates, payment_date(dates, day, 1)))
+    return amount, term, rate, fee, steps, dates, day, first_period_days
+
+
+def amortization_schedule(
+    amount: ArrayLike,
+    term_months: ArrayLike,
+    annual_interest_rate: ArrayLike,
+    rate_steps: Optional[Sequence[Tuple[int, ArrayLike]]] = None,
+    disbursement_date: Optional[ArrayLike] = None,
+    payment_day: Optional[ArrayLike] = None,
+    monthly_fee: ArrayLike = 0.0
+) -> np.ndarray:
+    """
+    Vectorized iter_amortization_schedule over a portfolio of loans.
+
+    Args:
+        amount: Principal per loan
+        term_months: Installments per loan
+        annual_interest_rate: Annual rate (%) per loan until the first rate step
+        rate_steps: (installment, annual rate %) pairs; each rate may be an
+            array with one rate per loan
+        disbursement_date: datetime64 dates (NaT = no payment dates for that loan)
+        payment_day: Day of month payments are due (default: disbursement day)
+        monthly_fee: Fee due with every installment
+
+    Returns:
+        (loans, longest term) AMORTIZATION_SCHEDULE_DTYPE records: row i holds
+        the installments of loan i, followed by zero records (installment 0,
+        NaT date) once the loan is repaid
+    """
+    amount, term, rate, fee, steps, dates, day, first_period_days = _schedule_inputs(
+        amount, term_months, annual_interest_rate, rate_steps, disbursement_date, payment_day, monthly_fee
+    )
+    loans, longest = amount.size, int(term.max())
+    columns = {name: np.zeros((loans, longest), dtype=AMORTIZATION_SCHEDULE_DTYPE[name])
+               for name in AMORTIZATION_SCHEDULE_DTYPE.names}
+    columns["payment_date"][:] = np.datetime64("NaT", "D")
+
+    balance = amount.copy()
+    annual_rate = rate.copy()
+    payment = np.zeros(loans)
+    repaying = np.ones(loans, dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for installment in range(1, longest + 1):
+            active = repaying & (installment <= term)
+            if not active.any():
+                break
+            if installment in steps:
+                annual_rate = np.where(active, steps[installment], annual_rate)
+            monthly_rate = annual_rate / 100 / 12
+            if installment == 1 or installment in steps:
+                payment = level_payment(balance, monthly_rate, term - installment + 1)
+
+            regular_interest = _py_round(balance * monthly_rate, 2)
+            interest = regular_interest
+            if installment == 1:
+                odd_interest = balance * (annual_rate / 100 / 360) * (first_period_days - 30)
+                interest = np.where(first_period_days != 30, _py_round(regular_interest + odd_interest, 2), interest)
+
+            principal = _py_round(payment - regular_interest, 2)
+            principal = np.where((installment == term) | (principal > balance), balance, principal)
+            remaining = _py_round(balance - principal, 2)
+
+            column = installment - 1
+            columns["installment"][active, column] = installment
+            columns["payment_date"][active, column] = payment_date(dates[active], day[active], installment)
+            columns["interest_rate"][active, column] = annual_rate[active]
+            columns["payment"][active, column] = _py_round(principal + interest, 2)[active]
+            columns["principal"][active, column] = principal[active]
+            columns["interest"][active, column] = interest[active]
+            columns["fee"][active, column] = fee[active]
+            columns["balance"][active, column] = remaining[active]
+
+            balance = np.where(active, remaining, balance)
+            repaying &= ~(active & (remaining <= 0))
+    return _records(AMORTIZATION_SCHEDULE_DTYPE, **columns)
+
+
+def _apr(
+    net_amount: np.ndarray,
+    payments: np.ndarray,
+    present: np.ndarray,
+    first_period_days: np.ndarray,
+    initial_rate: np.ndarray
+) -> np.ndarray:
+    """Vectorized calculate_apr over (loans, installments) payments; present marks real installments"""
+    first_period = first_period_days / 30
+    rate = np.array(initial_rate, dtype=np.float64)
+    solving = np.ones(rate.shape, dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(APR_MAX_ITERATIONS):
+            rows = np.flatnonzero(solving)
+            if not rows.size:
+                break
+            current = rate[rows]
+            discount = 1 / (1 + current)
+            factor = _libm(math.pow, discount, first_period[rows])
+            time = first_period[rows]
+            present_value = np.zeros(rows.size)
+            derivative = np.zeros(rows.size)
+            for column in range(int(present[rows].sum(axis=1).max())):
+                paid = present[rows, column]
+                payment = payments[rows, column]
+                present_value = np.where(paid, present_value + payment * factor, present_value)
+                derivative = np.where(paid, derivative - time * payment * factor * discount, derivative)
+                factor = factor * discount
+                time = time + 1
+            flat = derivative == 0
+            step = (present_value - net_amount[rows]) / derivative
+            rate[rows] = np.where(flat, current, current - step)
+            solving[rows] = ~flat & ~(np.abs(step) < APR_TOLERANCE)
+    return _py_round(rate * 12 * 100, 2) + 0.0
+
+
+def calculate_loan_terms(
+    amount: ArrayLike,
+    term_months: ArrayLike,
+    annual_interest_rate: ArrayLike,
+    rate_steps: Optional[Sequence[Tuple[int, ArrayLike]]] = None,
+    disbursement_date: Optional[ArrayLike] = None,
+    payment_day: Optional[ArrayLike] = None,
+    upfront_fee: ArrayLike = 0.0,
+    monthly_fee: ArrayLike = 0.0
+) -> np.ndarray:
+    """Vectorized amortization.calculate_loan_terms (LOAN_TERMS_DTYPE records, NaT without dates)"""
+    schedule = amortization_schedule(
+        amount, term_months, annual_interest_rate, rate_steps, disbursement_date, payment_day, monthly_fee
+    )
+    amount, term, rate, fee, steps, dates, _, _ = _schedule_inputs(
+        amount, term_months, annual_interest_rate, rate_steps, disbursement_date, payment_day, monthly_fee
+    )
+    present = schedule["installment"] > 0
+    payments = schedule["payment"] + schedule["fee"]
+    total_interest = np.zeros(amount.size)
+    total_paid = np.zeros(amount.size)
+    for column in range(present.shape[1]):
+        paid = present[:, column]
+        total_interest = np.where(paid, total_interest + schedule["interest"][:, column], total_interest)
+        total_paid = np.where(paid, total_paid + payments[:, column], total_paid)
+
+    installments = present.sum(axis=1)
+    first_payment_date = schedule["payment_date"][:, 0]
+    first_period_days = np.where(np.isnat(dates), 30, days_360(dates, first_payment_date))
+    initial_monthly_rate = steps.get(1, rate) / 100 / 12
+    monthly_payment = level_payment(amount, initial_monthly_rate, term)
+
+    return _records(
+        LOAN_TERMS_DTYPE,
+        monthly_payment=_py_round(monthly_payment + fee, 2),
+        total_interest=_py_round(total_interest, 2),
+        total_fees=_py_round(_float(upfront_fee) + fee * installments, 2),
+        total_repayment=_py_round(total_paid, 2),
+        annual_percentage_rate=_apr(
+            amount - _float(upfront_fee), payments, present, first_period_days, initial_monthly_rate
+        ),
+        installments=installments,
+        first_payment_date=first_payment_date,
+        final_payment_date=schedule["payment_date"][np.arange(amount.size), installments - 1]
+    )
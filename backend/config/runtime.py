@@ -0,0 +1,14 @@
+"""
+Runtime Environment
+Facts about the machine the process runs on, shared by the server launcher and services
+"""
+
+import os
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process may run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS / Windows
+        return os.cpu_count() or 1
@@ -6,7 +6,7 @@ It loads configuration from environment variables (.env file), making the app se
 
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import Optional
+from typing import Dict, Optional
 from functools import lru_cache
 
 
@@ -22,11 +22,28 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False, description="Debug mode")
     api_host: str = Field(default="0.0.0.0", description="API host")
     api_port: int = Field(default=8080, description="API port")
+    workers: int = Field(default=0, ge=0, description="Server processes started by app.server (0 = one per available CPU)")
+    prometheus_multiproc_dir: Optional[str] = Field(default=None, description="Directory for shared metric files with several workers (default: a fresh temporary directory)")
+    agent_warmup_enabled: bool = Field(default=True, description="Build all agent chains during startup instead of on first request")
+    import_time_budget_seconds: float = Field(default=2.0, description="Warn at startup if importing app.main took longer than this (seconds)")
     
     # OpenAI Configuration
-    openai_api_key: str = Field(..., description="OpenAI API key")
+    openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key (required once an agent chain is built)")
     openai_model: str = Field(default="gpt-4o", description="OpenAI model to use")
     openai_temperature: float = Field(default=0.1, description="Model temperature for consistency")
+    openai_max_retries: int = Field(default=3, description="Retries per LLM call after a 429, 5xx or connection error (through the rate limit scheduler when it is enabled)")
+    
+    # Workflow deadlines (a node past its deadline falls back to its deterministic calculations)
+    node_timeout_seconds: float = Field(default=30.0, description="Default deadline for each agent node (seconds)")
+    node_timeouts: Dict[str, float] = Field(default_factory=dict, description="Per-node deadline overrides, e.g. {\"write_decision\": 45}")
+    workflow_timeout_seconds: float = Field(default=120.0, description="Deadline for the whole assessment workflow (seconds)")
+    checkpoint_sqlite_path: Optional[str] = Field(default=None, description="SQLite file for resumable workflow checkpoints (disabled if unset)")
+    
+    # Shared HTTP connection pool (all ChatOpenAI instances)
+    http_pool_max_connections: int = Field(default=100, description="Max concurrent connections to the LLM provider")
+    http_pool_max_keepalive: int = Field(default=20, description="Max idle keep-alive connections kept in the pool")
+    http_keepalive_expiry_seconds: float = Field(default=30.0, description="Idle time before a keep-alive connection is closed (seconds)")
+    http2_enabled: bool = Field(default=True, description="Negotiate HTTP/2 with the LLM provider (requires the h2 package)")
     
     # LangSmith Configuration (Observability)
     langsmith_api_key: Optional[str] = Field(default=None, description="LangSmith API key for tracing")
@@ -36,6 +53,15 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_requests: int = Field(default=100, description="Max requests per minute")
     rate_limit_tokens: int = Field(default=100000, description="Max tokens per minute")
+    llm_scheduler_enabled: bool = Field(default=True, description="Queue LLM calls through the rate limit token buckets")
+    llm_expected_output_tokens: int = Field(default=800, description="Output tokens reserved per LLM call when estimating usage")
+    
+    # LLM Response Cache
+    llm_cache_enabled: bool = Field(default=True, description="Cache agent responses keyed by rendered prompt, model and temperature")
+    llm_cache_max_entries: int = Field(default=1024, description="Max entries in the in-memory LRU cache tier")
+    llm_cache_ttl_seconds: int = Field(default=3600, description="TTL of in-memory cache entries (seconds)")
+    llm_cache_sqlite_path: Optional[str] = Field(default=None, description="SQLite file for the persistent cache tier (disabled if unset)")
+    llm_cache_sqlite_ttl_seconds: int = Field(default=86400, description="TTL of persistent cache entries (seconds)")
     
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
@@ -45,11 +71,52 @@ class Settings(BaseSettings):
     cors_origins: str = Field(default="*", description="Allowed CORS origins (comma-separated)")
     api_key_header: str = Field(default="X-API-Key", description="API key header name")
     
+    # Batch Assessment
+    batch_concurrency: int = Field(default=8, description="Default number of applications assessed concurrently per batch")
+    batch_max_concurrency: int = Field(default=32, description="Upper bound for a batch request's concurrency")
+    batch_max_applications: int = Field(default=10000, description="Max applications accepted in one batch request")
+    bulk_validation_max_rows: int = Field(default=100000, description="Max applications accepted in one bulk validation request")
+    
+    # Asynchronous Job Queue
+    job_queue_enabled: bool = Field(default=True, description="Run the job queue workers behind /api/v1/jobs")
+    job_queue_sqlite_path: str = Field(default="assessment_jobs.sqlite3", description="SQLite file holding queued jobs and their results")
+    job_queue_workers: int = Field(default=4, description="Number of concurrent job workers")
+    job_retention_hours: int = Field(default=168, description="Finished jobs older than this are purged at startup (hours)")
+    job_queue_recover_on_start: bool = Field(default=True, description="Requeue interrupted jobs when the queue starts (app.server recovers once before starting several workers)")
+    
+    # Report Store
+    report_store_enabled: bool = Field(default=True, description="Persist finished reports for /api/v1/reports")
+    report_store_sqlite_path: str = Field(default="assessment_reports.sqlite3", description="SQLite file holding stored reports")
+    
+    # Idempotency / Request Coalescing
+    idempotency_enabled: bool = Field(default=True, description="Share one workflow between identical concurrent /assess requests and replay recent results")
+    idempotency_ttl_seconds: int = Field(default=300, description="How long a successful result is replayed for duplicate requests (seconds)")
+    idempotency_max_entries: int = Field(default=1000, description="Maximum number of recent results kept for replay")
+    
+    # Response Compression
+    compression_enabled: bool = Field(default=True, description="Compress responses with the encoding negotiated from Accept-Encoding")
+    compression_minimum_size: int = Field(default=1024, description="Complete responses smaller than this are sent uncompressed (bytes); streams are always compressed")
+    compression_gzip_level: int = Field(default=6, ge=1, le=9, description="gzip compression level")
+    compression_brotli_quality: int = Field(default=4, ge=0, le=11, description="Brotli quality (used when the optional brotli package is installed)")
+    
+    # Admission Control (/assess and /assess/stream)
+    admission_control_enabled: bool = Field(default=True, description="Cap concurrent workflows and answer 429 beyond the wait queue")
+    max_concurrent_workflows: int = Field(default=32, description="Workflows allowed to run at once")
+    admission_queue_size: int = Field(default=64, description="Requests allowed to wait for a workflow slot")
+    admission_queue_timeout_seconds: float = Field(default=10.0, description="Longest a queued request waits for a slot before 429")
+    admission_default_retry_after_seconds: float = Field(default=30.0, description="Workflow duration assumed for Retry-After before any workflow has finished")
+    
     # Credit Assessment Configuration
     min_credit_score: int = Field(default=300, description="Minimum credit score")
     max_credit_score: int = Field(default=850, description="Maximum credit score")
     default_currency: str = Field(default="EUR", description="Default currency")
     max_dti_ratio: float = Field(default=0.43, description="Maximum debt-to-income ratio")
+    pre_screen_enabled: bool = Field(default=True, description="Decline knock-out applications before any LLM agent runs")
+    
+    # Monte Carlo Affordability Stress Test (income analysis)
+    stress_simulation_scenarios: int = Field(default=2000, ge=0, description="Joint income / rate scenarios simulated per application (0 disables the simulation)")
+    stress_simulation_horizon_years: int = Field(default=5, ge=1, description="Years simulated after today")
+    stress_simulation_seed: int = Field(default=42, description="Random seed of the scenarios (fixed, so results are reproducible)")
     
     # a special inner class that tells Pydantic how to behave.
     class Config:
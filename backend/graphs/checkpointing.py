@@ -0,0 +1,61 @@
+"""
+Workflow Checkpointing
+Optional SQLite persistence of workflow state, keyed by application_id.
+
+When settings.checkpoint_sqlite_path is set, the full workflow is compiled
+with a LangGraph AsyncSqliteSaver and every run uses application_id as its
+thread_id. A run that fails part-way keeps the output of every finished node
+(including parallel siblings of the failed node), so resuming re-executes
+only the nodes that have not finished.
+
+Requires the optional langgraph-checkpoint-sqlite package.
+"""
+
+import inspect
+from enum import Enum
+from typing import Any, List, Tuple
+
+from app import models
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CheckpointNotFoundError(LookupError):
+    """No checkpointed workflow exists for the application"""
+
+
+def _state_enum_types() -> List[Tuple[str, str]]:
+    """(module, name) of the app.models enums stored in workflow state"""
+    return [
+        (models.__name__, name)
+        for name, obj in vars(models).items()
+        if inspect.isclass(obj) and issubclass(obj, Enum) and obj.__module__ == models.__name__
+    ]
+
+
+async def open_sqlite_checkpointer(path: str) -> Any:
+    """
+    Open (and create if needed) the SQLite checkpoint store.
+
+    Args:
+        path: SQLite database file
+
+    Returns:
+        Initialised AsyncSqliteSaver
+    """
+    try:
+        import aiosqlite
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+    except ImportError as e:
+        raise RuntimeError(
+            "checkpoint_sqlite_path is set but langgraph-checkpoint-sqlite is not installed"
+        ) from e
+
+    conn = await aiosqlite.connect(path)
+    # Allow-list the enums held in the analysis dicts for msgpack deserialization
+    saver = AsyncSqliteSaver(conn, serde=JsonPlusSerializer(allowed_msgpack_modules=_state_enum_types()))
+    await saver.setup()
+    logger.info(f"Workflow checkpoints persisted to {path}")
+    return saver
@@ -23,40 +23,35 @@ Defines the multi-agent workflow for credit risk assessment
 9. Each node receives updated state automatically
 """
 
+import asyncio
+import time
 import uuid
-import json
-from datetime import datetime
-from typing import TypedDict, Annotated, Optional, Dict, Any, List
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, AsyncGenerator, Tuple
 from langgraph.graph import StateGraph, START, END
-from langgraph.graph.message import add_messages
 from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel
 
-from agents import (
-    financial_data_collector,
-    income_analyzer,
-    debt_analyzer,
-    collateral_evaluator,
-    risk_scorer,
-    decision_writer
-)
-from calculations import (
-    calculate_annual_income,
-    calculate_max_affordable_payment,
-    perform_income_stress_test,
-    calculate_estimated_payment,
-    calculate_dti_ratio,
-    calculate_dscr,
-    calculate_total_monthly_debt,
-    assess_debt_burden,
-    calculate_ltv_ratio,
-    calculate_liquidation_value,
-    assess_collateral_quality,
-    calculate_collateral_coverage,
-    calculate_probability_of_default,
-    calculate_loss_given_default,
-    calculate_expected_loss,
-    calculate_risk_score,
+from agents import get_agent
+from graphs.state import CreditAssessmentState, assessment_date
+from graphs.deterministic_analysis import (
+    compute_income_calculations,
+    compute_debt_calculations,
+    compute_collateral_calculations,
+    compute_risk_calculations,
+    build_financial_summary,
+    build_income_analysis,
+    build_debt_analysis,
+    build_collateral_evaluation,
+    build_risk_assessment,
+    build_credit_decision,
+    apply_schedule_terms,
+    degraded_note,
 )
+from graphs.fast_assessment_graph import build_fast_assessment_graph
+from graphs.pre_screen import pre_screen, route_after_pre_screen, write_decline_report
+from graphs.checkpointing import CheckpointNotFoundError, open_sqlite_checkpointer
 
 from app.models import (
     LoanApplication,
@@ -68,8 +63,11 @@ from app.models import (
     CreditDecision,
     CreditAssessmentReport
 )
+from config.settings import settings
 from config.logging_config import get_logger
 from monitoring.metrics import (
+    node_degradations,
+    track_workflow,
     track_workflow_duration,
     track_node_duration
 )
@@ -77,34 +75,20 @@ from monitoring.metrics import (
 logger = get_logger(__name__)
 
 
-class CreditAssessmentState(TypedDict):
-    """State schema for the credit assessment workflow"""
-    application: Dict[str, Any]
-    application_id: str
-    
-    financial_summary: Optional[Dict[str, Any]]
-    income_analysis: Optional[Dict[str, Any]]
-    debt_analysis: Optional[Dict[str, Any]]
-    collateral_evaluation: Optional[Dict[str, Any]]
-    risk_assessment: Optional[Dict[str, Any]]
-    credit_decision: Optional[Dict[str, Any]]
-    
-    current_stage: str
-    progress: int
-    errors: List[str]
-    start_time: float
-    
-    messages: Annotated[List[Any], add_messages] # LangGraph message accumulator (reducer)
-
-
 class CreditAssessmentGraph:
     """
     LangGraph-based orchestrator for credit risk assessment.
-    Implements parallel workflow: collect → [income, debt, collateral] → risk → decision
+    Implements parallel workflow: pre_screen → collect → [income, debt, collateral] → risk → decision
+    (knock-out declines go from pre_screen straight to a templated decline report)
     """
     
     def __init__(self):
         self.graph = None
+        self.fast_graph = build_fast_assessment_graph()  # Deterministic-only pipeline for fast_mode
+        self._workflow = None
+        self._checkpointer = None
+        self._checkpointed_graph = None  # Compiled on first use when checkpoint_sqlite_path is set
+        self._checkpointer_lock = asyncio.Lock()
         self._build_graph()
     
     def _build_graph(self):
@@ -112,6 +96,8 @@ class CreditAssessmentGraph:
         workflow = StateGraph(CreditAssessmentState)
         
         # Add all nodes
+        workflow.add_node("pre_screen", pre_screen)
+        workflow.add_node("write_decline_report", write_decline_report)
         workflow.add_node("collect_financial_data", self._collect_financial_data)
         workflow.add_node("analyze_income", self._analyze_income)
         workflow.add_node("analyze_debt", self._analyze_debt)
@@ -120,8 +106,14 @@ class CreditAssessmentGraph:
         workflow.add_node("calculate_risk", self._calculate_risk)
         workflow.add_node("write_decision", self._write_decision)
         
-        # Sequential: START → collect_financial_data
-        workflow.add_edge(START, "collect_financial_data")
+        # Knock-out pre-screen: START → pre_screen → collect_financial_data | write_decline_report
+        workflow.add_edge(START, "pre_screen")
+        workflow.add_conditional_edges(
+            "pre_screen",
+            route_after_pre_screen,
+            ["collect_financial_data", "write_decline_report"]
+        )
+        workflow.add_edge("write_decline_report", END)
         
         # Parallel: collect_financial_data → [income, debt, collateral]
         workflow.add_edge("collect_financial_data", "analyze_income")
@@ -138,185 +130,192 @@ class CreditAssessmentGraph:
         workflow.add_edge("calculate_risk", "write_decision")
         workflow.add_edge("write_decision", END)
         
+        self._workflow = workflow
         self.graph = workflow.compile()
     
+    async def _get_graph(self, fast_mode: bool = False):
+        """Compiled graph for a run: fast-mode, checkpointed (if configured) or plain"""
+        if fast_mode:
+            return self.fast_graph
+        if not settings.checkpoint_sqlite_path:
+            return self.graph
+        
+        if self._checkpointed_graph is None:
+            async with self._checkpointer_lock:
+                if self._checkpointed_graph is None:
+                    self._checkpointer = await open_sqlite_checkpointer(settings.checkpoint_sqlite_path)
+                    self._checkpointed_graph = self._workflow.compile(checkpointer=self._checkpointer)
+        return self._checkpointed_graph
+    
+    async def warm_up(self):
+        """Open the checkpoint store and compile the checkpointed graph ahead of the first run"""
+        await self._get_graph()
+    
+    async def close(self):
+        """Close the checkpoint store connection (if opened)"""
+        if self._checkpointer is not None:
+            await self._checkpointer.conn.close()
+            self._checkpointer = None
+            self._checkpointed_graph = None
+    
+    async def _invoke_agent(
+        self,
+        state: CreditAssessmentState,
+        config: RunnableConfig,
+        node_name: str,
+        agent_name: str,
+        inputs: Dict[str, Any]
+    ) -> Tuple[Optional[BaseModel], Optional[str]]:
+        """
+        Invoke an agent within the node deadline, capped by the workflow deadline.
+        
+        Args:
+            state: Current workflow state
+            config: Node run config (holds the workflow deadline)
+            node_name: Node name (deadline lookup and metrics label)
+            agent_name: Registered agent to invoke
+            inputs: Agent prompt variables
+            
+        Returns:
+            (agent output, None), or (None, reason) if the deadline expired
+            (reason is node_timeout or workflow_deadline; the node then falls
+            back to output built from its calculations)
+        """
+        node_timeout = settings.node_timeouts.get(node_name, settings.node_timeout_seconds)
+        remaining = config["configurable"]["deadline"] - time.time()
+        
+        if remaining <= 0:
+            reason = "workflow_deadline"
+        else:
+            try:
+                return await asyncio.wait_for(
+                    get_agent(agent_name).ainvoke(inputs, config=config),
+                    timeout=min(node_timeout, remaining)
+                ), None
+            except asyncio.TimeoutError:
+                reason = "node_timeout" if node_timeout < remaining else "workflow_deadline"
+        
+        node_degradations.labels(node_name=node_name, reason=reason).inc()
+        logger.warning(f"[{state['application_id']}] {node_name} degraded ({reason}), using calculations only")
+        return None, reason
+    
     @track_node_duration("collect_financial_data") # Decorator for timing and metrics
-    async def _collect_financial_data(self, state: CreditAssessmentState) -> Dict[str, Any]:
+    async def _collect_financial_data(self, state: CreditAssessmentState, config: RunnableConfig) -> Dict[str, Any]:
         """Node: Collect and validate financial data"""
         logger.info(f"[{state['application_id']}] Collecting financial data...")
         
         try:
-            app = state["application"]
-            application_data = json.dumps(app, indent=2, default=str)
-            
-            result = await financial_data_collector.ainvoke({
-                "application_data": application_data
+            # Dict inputs are projected onto each agent's PAYLOAD_FIELDS and compactly encoded
+            result, reason = await self._invoke_agent(state, config, "collect_financial_data", "financial_data_collector", {
+                "application_data": state["application"]
             })
+            degraded = reason is not None
+            if degraded:
+                result = build_financial_summary(state["application"])
+            
+            financial_summary = result.model_dump() # Convert Pydantic model to dict
+            financial_summary["degraded"] = degraded
             
             return {
-                "financial_summary": result.model_dump(), # Convert Pydantic model to dict
+                "financial_summary": financial_summary,
+                "degraded_sections": ["financial_summary"] if degraded else [],
                 "current_stage": "financial_data_collected",
                 "progress": 20,
                 # income_stability_score is generated by the financial_data_collector agent via prompt rules as part of a Pydantic output (FinancialDataSummary)
                 "messages": [AIMessage(content=f"Financial data collected: stability score {result.income_stability_score}")]
             }
         except Exception as e:
+            # Raised so a checkpointed run keeps the finished nodes and can resume here
             logger.error(f"Error collecting financial data: {e}")
-            return {
-                "errors": state.get("errors", []) + [f"Financial data collection failed: {str(e)}"],
-                "current_stage": "error"
-            }
+            raise
     
     @track_node_duration("analyze_income")
-    async def _analyze_income(self, state: CreditAssessmentState) -> Dict[str, Any]:
+    async def _analyze_income(self, state: CreditAssessmentState, config: RunnableConfig) -> Dict[str, Any]:
         """Node: Analyze income and affordability (runs in parallel)"""
         logger.info(f"[{state['application_id']}] Analyzing income (parallel execution)...")
         
         try:
             app = state["application"]
-            financial_summary = state.get("financial_summary", {}) 
-            
-            # Extract data
-            employment = app.get("employment", {})
+            financial_summary = state.get("financial_summary", {})
             loan_request = app.get("loan_request", {})
-            monthly_gross = employment.get("monthly_gross_income", 0)
-            monthly_net = employment.get("monthly_net_income", 0)
-            requested_amount = loan_request.get("requested_amount", 0)
-            requested_term = loan_request.get("requested_term_months", 240)
             
             # Perform Python calculations
-            annual_income = calculate_annual_income(monthly_gross, monthly_net)
-            
-            # Calculate existing debt (will be 0 if no debts yet)
-            existing_debts = app.get("debts", [])
-            existing_monthly_debt = calculate_total_monthly_debt(existing_debts)
-            
-            max_payment = calculate_max_affordable_payment(
-                monthly_gross,
-                existing_monthly_debt
-            )
-            
-            # Estimate monthly payment for stress test
-            estimated_payment = calculate_estimated_payment(
-                requested_amount,
-                requested_term,
-                rate=0.04  # 4% default rate
-            ) if requested_amount > 0 and requested_term > 0 else 0
-            
-            stress_test = perform_income_stress_test(
-                monthly_gross,
-                estimated_payment,
-                loan_amount=requested_amount,
-                loan_term_months=requested_term
-            )
+            calculations = compute_income_calculations(app)
             
             # Pass calculations to LLM for qualitative analysis
-            result = await income_analyzer.ainvoke({
-                "financial_summary": json.dumps(financial_summary, indent=2, default=str),
-                "application_data": json.dumps(app, indent=2, default=str),
-                "requested_amount": requested_amount,
-                "requested_term": requested_term,
-                "calculations": json.dumps({
-                    "annual_income": annual_income,
-                    "max_affordable_payment": max_payment,
-                    "stress_test_results": stress_test
-                }, indent=2)
+            result, reason = await self._invoke_agent(state, config, "analyze_income", "income_analyzer", {
+                "financial_summary": financial_summary,
+                "application_data": app,
+                "requested_amount": loan_request.get("requested_amount", 0),
+                "requested_term": loan_request.get("requested_term_months", 240),
+                "calculations": calculations
             })
+            degraded = reason is not None
+            if degraded:
+                result = build_income_analysis(calculations, note=degraded_note("analyze_income", reason))
             
             # Merge calculations with LLM analysis
             income_analysis = result.model_dump()
-            income_analysis["calculations"] = {
-                "annual_gross_income": annual_income["annual_gross"],
-                "annual_net_income": annual_income["annual_net"],
-                "max_affordable_payment": max_payment["recommended_max_payment"],
-                "stress_test_passed": stress_test["overall_passes_stress_test"]
-            }
+            income_analysis["calculations"] = calculations
+            income_analysis["degraded"] = degraded
             
             return {
                 "income_analysis": income_analysis,
+                "degraded_sections": ["income_analysis"] if degraded else [],
                 "current_stage": "income_analyzed",
                 "progress": 40,
                 "messages": [AIMessage(content=f"Income analyzed: sustainability {result.income_sustainability}")]
             }
         except Exception as e:
+            # Raised so a checkpointed run keeps the finished nodes and can resume here
             logger.error(f"Error analyzing income: {e}")
-            return {
-                "errors": state.get("errors", []) + [f"Income analysis failed: {str(e)}"],
-                "current_stage": "error"
-            }
+            raise
     
     @track_node_duration("analyze_debt")
-    async def _analyze_debt(self, state: CreditAssessmentState) -> Dict[str, Any]:
+    async def _analyze_debt(self, state: CreditAssessmentState, config: RunnableConfig) -> Dict[str, Any]:
         """Node: Analyze existing debt obligations (runs in parallel)"""
         logger.info(f"[{state['application_id']}] Analyzing debt (parallel)...")
         
         try:
             app = state["application"]
             loan_request = app.get("loan_request", {})
-            employment = app.get("employment", {})
-            existing_debts = app.get("debts", [])
-            
-            requested_amount = loan_request.get("requested_amount", 0)
-            requested_term = loan_request.get("requested_term_months", 12)
-            estimated_payment = calculate_estimated_payment(requested_amount, requested_term)
-            
-            # Extract income data
-            monthly_gross = employment.get("monthly_gross_income", 0)
-            monthly_net = employment.get("monthly_net_income", 0)
+            existing_debts = app.get("existing_debts", [])
             
             # Perform Python calculations
-            total_monthly_debt = calculate_total_monthly_debt(existing_debts)
-            current_dti = calculate_dti_ratio(total_monthly_debt, monthly_gross)
-            projected_dti = calculate_dti_ratio(total_monthly_debt + estimated_payment, monthly_gross)
-            dscr = calculate_dscr(monthly_net, total_monthly_debt)
-            debt_burden = assess_debt_burden(current_dti, dscr)
-            
-            # Calculate credit utilization if available
-            total_balance = sum(d.get("balance", 0) for d in existing_debts if d.get("type") in ["credit_card", "line_of_credit"])
-            total_limit = sum(d.get("credit_limit", 0) for d in existing_debts if d.get("credit_limit", 0) > 0)
-            utilization = (total_balance / total_limit * 100) if total_limit > 0 else 0
+            calculations = compute_debt_calculations(app)
+            current_dti = calculations["current_dti_ratio"]
+            projected_dti = calculations["projected_dti_ratio"]
             
             # Pass calculations to LLM for qualitative analysis
-            result = await debt_analyzer.ainvoke({
-                "existing_debts": json.dumps(existing_debts, default=str),
-                "income_analysis": json.dumps(state.get("financial_summary", {}), default=str),
-                "requested_amount": requested_amount,
-                "requested_term": requested_term,
-                "estimated_payment": estimated_payment,
-                "calculations": json.dumps({
-                    "total_monthly_debt": total_monthly_debt,
-                    "current_dti_ratio": current_dti,
-                    "projected_dti_ratio": projected_dti,
-                    "dscr": dscr,
-                    "debt_burden_assessment": debt_burden,
-                    "credit_utilization": utilization
-                }, indent=2)
+            result, reason = await self._invoke_agent(state, config, "analyze_debt", "debt_analyzer", {
+                "existing_debts": existing_debts,
+                "income_analysis": state.get("financial_summary", {}),
+                "requested_amount": loan_request.get("requested_amount", 0),
+                "requested_term": loan_request.get("requested_term_months", 12),
+                "estimated_payment": calculations["estimated_payment"],
+                "calculations": calculations
             })
+            degraded = reason is not None
+            if degraded:
+                result = build_debt_analysis(calculations)
             
             # Merge calculations with LLM analysis
             debt_analysis = result.model_dump()
-            debt_analysis["calculations"] = {
-                "total_monthly_debt": total_monthly_debt,
-                "current_dti_ratio": current_dti,
-                "projected_dti_ratio": projected_dti,
-                "dscr": dscr,
-                "debt_burden_level": debt_burden["overall_debt_burden"],
-                "credit_utilization": utilization
-            }
+            debt_analysis["calculations"] = calculations
+            debt_analysis["degraded"] = degraded
             
             return {
                 "debt_analysis": debt_analysis,
+                "degraded_sections": ["debt_analysis"] if degraded else [],
                 "messages": [AIMessage(content=f"Debt analyzed: DTI {current_dti:.1f}%, projected {projected_dti:.1f}%")]
             }
         except Exception as e:
+            # Raised so a checkpointed run keeps the finished nodes and can resume here
             logger.error(f"Error analyzing debt: {e}")
-            return {
-                "errors": state.get("errors", []) + [f"Debt analysis failed: {str(e)}"],
-                "current_stage": "error"
-            }
+            raise
     
     @track_node_duration("evaluate_collateral")
-    async def _evaluate_collateral(self, state: CreditAssessmentState) -> Dict[str, Any]:
+    async def _evaluate_collateral(self, state: CreditAssessmentState, config: RunnableConfig) -> Dict[str, Any]:
         """Node: Evaluate collateral (runs in parallel)"""
         logger.info(f"[{state['application_id']}] Evaluating collateral (parallel)...")
         
@@ -326,82 +325,40 @@ class CreditAssessmentGraph:
             collateral = app.get("collateral")
             requested_amount = loan_request.get("requested_amount", 0)
             
-            # Perform Python calculations if collateral exists
+            # Perform Python calculations (unsecured defaults if no collateral)
+            calculations = compute_collateral_calculations(app)
+            
             if collateral:
-                collateral_value = collateral.get("estimated_value", 0)
-                collateral_type = collateral.get("type", "other")
-                condition = collateral.get("condition", "good")
-                has_insurance = collateral.get("has_insurance", False)
-                has_clear_title = collateral.get("clear_title", True)
-                
-                # Calculate LTV
-                ltv = calculate_ltv_ratio(requested_amount, collateral_value)
-                
-                # Calculate liquidation value
-                liquidation = calculate_liquidation_value(collateral_value, collateral_type, condition)
-                
-                # Assess collateral quality
-                quality = assess_collateral_quality(
-                    ltv,
-                    collateral_type,
-                    has_insurance,
-                    has_clear_title,
-                    collateral.get("marketability", "good")
-                )
-                
-                # Calculate coverage
-                coverage = calculate_collateral_coverage(
-                    requested_amount,
-                    liquidation["liquidation_value"]
-                )
-                
-                calculations = {
-                    "ltv_ratio": ltv,
-                    "liquidation_value": liquidation["liquidation_value"],
-                    "liquidation_discount": liquidation["liquidation_discount"],
-                    "recovery_rate": liquidation["recovery_rate"],
-                    "quality_score": quality["quality_score"],
-                    "overall_quality": quality["overall_quality"],
-                    "coverage_ratio": coverage["coverage_ratio"],
-                    "meets_coverage_requirement": coverage["meets_requirement"]
-                }
-                
-                collateral_info = json.dumps(collateral, default=str)
+                collateral_info = collateral
             else:
-                # Unsecured loan
-                calculations = {
-                    "ltv_ratio": 100.0,
-                    "liquidation_value": 0,
-                    "quality_score": 0,
-                    "overall_quality": "none",
-                    "coverage_ratio": 0,
-                    "meets_coverage_requirement": False
-                }
                 collateral_info = "No collateral provided - unsecured loan"
             
             # Pass calculations to LLM for qualitative analysis
-            result = await collateral_evaluator.ainvoke({
+            result, reason = await self._invoke_agent(state, config, "evaluate_collateral", "collateral_evaluator", {
                 "collateral_info": collateral_info,
                 "requested_amount": requested_amount,
                 "loan_purpose": loan_request.get("loan_purpose", "other"),
                 "requested_term": loan_request.get("requested_term_months", 0),
-                "calculations": json.dumps(calculations, indent=2)
+                "calculations": calculations
             })
+            degraded = reason is not None
+            if degraded:
+                result = build_collateral_evaluation(calculations)
             
             # Merge calculations with LLM analysis
             collateral_evaluation = result.model_dump()
             collateral_evaluation["calculations"] = calculations
+            collateral_evaluation["degraded"] = degraded
             
             return {
                 "collateral_evaluation": collateral_evaluation,
+                "degraded_sections": ["collateral_evaluation"] if degraded else [],
                 "messages": [AIMessage(content=f"Collateral evaluated: quality={calculations.get('overall_quality', 'none')}, LTV={calculations['ltv_ratio']:.1f}%")]
             }
         except Exception as e:
+            # Raised so a checkpointed run keeps the finished nodes and can resume here
             logger.error(f"Error evaluating collateral: {e}")
-            return {
-                "errors": state.get("errors", []) + [f"Collateral evaluation failed: {str(e)}"],
-                "current_stage": "error"
-            }
+            raise
     
     @track_node_duration("sync_parallel_analyses")
     async def _sync_parallel_analyses(self, state: CreditAssessmentState) -> Dict[str, Any]:
@@ -424,7 +381,7 @@ class CreditAssessmentGraph:
             }
     
     @track_node_duration("calculate_risk")
-    async def _calculate_risk(self, state: CreditAssessmentState) -> Dict[str, Any]:
+    async def _calculate_risk(self, state: CreditAssessmentState, config: RunnableConfig) -> Dict[str, Any]:
         """Node: Calculate comprehensive risk metrics"""
         logger.info(f"[{state['application_id']}] Calculating risk scores...")
         
@@ -432,154 +389,114 @@ class CreditAssessmentGraph:
             app = state["application"]
             loan_request = app.get("loan_request", {})
             credit_history = app.get("credit_history", {})
-            employment = app.get("employment", {})
             
             # Extract data from previous analyses
             income_analysis = state.get("income_analysis", {})
             debt_analysis = state.get("debt_analysis", {})
             collateral_evaluation = state.get("collateral_evaluation", {})
             
-            # Get calculations from previous nodes
             income_calcs = income_analysis.get("calculations", {})
             debt_calcs = debt_analysis.get("calculations", {})
             collateral_calcs = collateral_evaluation.get("calculations", {})
             
-            # Extract key metrics
-            credit_score = credit_history.get("credit_score", 650)
-            dti_ratio = debt_calcs.get("current_dti_ratio", 0)
-            ltv_ratio = collateral_calcs.get("ltv_ratio", 100)
-            employment_years = employment.get("years_with_current_employer", 0)
-            
-            # Get income and collateral quality scores
-            income_stability_score = income_calcs.get("stability_score", 50)
-            collateral_quality_score = collateral_calcs.get("quality_score", 0)
-            
-            # Perform Python calculations
-            pd = calculate_probability_of_default(
-                credit_score,
-                dti_ratio,
-                employment_years,
-                payment_history_score=100,  # Could extract from credit_history
-                debt_burden_level=debt_calcs.get("debt_burden_level", "moderate")
-            )
-            
-            lgd = calculate_loss_given_default(
-                ltv_ratio,
-                collateral_calcs.get("overall_quality", "none"),
-                recovery_rate=collateral_calcs.get("recovery_rate", 70.0),
-                has_guarantor=False
-            )
-            
+            # Perform Python calculations on the metrics from previous nodes
+            calculations = compute_risk_calculations(app, income_calcs, debt_calcs, collateral_calcs)
             requested_amount = loan_request.get("requested_amount", 0)
-            el = calculate_expected_loss(requested_amount, pd, lgd)
-            
-            risk = calculate_risk_score(
-                pd,
-                lgd,
-                dti_ratio,
-                ltv_ratio,
-                credit_score,
-                income_stability_score,
-                collateral_quality_score
-            )
-            
-            calculations = {
-                "probability_of_default": pd,
-                "loss_given_default": lgd,
-                "expected_loss_amount": el["expected_loss_amount"],
-                "expected_loss_percentage": el["expected_loss_percentage"],
-                "risk_score": risk["risk_score"],
-                "overall_risk_level": risk["overall_risk_level"],
-                "component_scores": risk["component_scores"]
-            }
             
             # Pass calculations to LLM for qualitative analysis
-            result = await risk_scorer.ainvoke({
-                "financial_summary": json.dumps(state["financial_summary"], default=str),
-                "income_analysis": json.dumps(income_analysis, default=str),
-                "debt_analysis": json.dumps(debt_analysis, default=str),
-                "collateral_evaluation": json.dumps(collateral_evaluation, default=str),
-                "credit_history": json.dumps(credit_history, default=str),
+            result, reason = await self._invoke_agent(state, config, "calculate_risk", "risk_scorer", {
+                "financial_summary": state["financial_summary"],
+                "income_analysis": income_analysis,
+                "debt_analysis": debt_analysis,
+                "collateral_evaluation": collateral_evaluation,
+                "credit_history": credit_history,
                 "requested_amount": requested_amount,
                 "requested_term": loan_request.get("requested_term_months", 0),
                 "loan_purpose": loan_request.get("loan_purpose", "other"),
-                "calculations": json.dumps(calculations, indent=2)
+                "calculations": calculations
             })
+            degraded = reason is not None
+            if degraded:
+                result = build_risk_assessment(app, calculations, income_calcs, debt_calcs, collateral_calcs)
             
             # Merge calculations with LLM analysis
             risk_assessment = result.model_dump()
             risk_assessment["calculations"] = calculations
+            risk_assessment["degraded"] = degraded
             
             return {
                 "risk_assessment": risk_assessment,
+                "degraded_sections": ["risk_assessment"] if degraded else [],
                 "current_stage": "risk_calculated",
                 "progress": 80,
-                "messages": [AIMessage(content=f"Risk calculated: {risk['overall_risk_level']}, PD={pd:.1f}%")]
+                "messages": [AIMessage(content=f"Risk calculated: {calculations['overall_risk_level']}, PD={calculations['probability_of_default']:.1f}%")]
             }
         except Exception as e:
+            # Raised so a checkpointed run keeps the finished nodes and can resume here
             logger.error(f"Error calculating risk: {e}")
-            return {
-                "errors": state.get("errors", []) + [f"Risk calculation failed: {str(e)}"],
-                "current_stage": "error"
-            }
+            raise
     
     @track_node_duration("write_decision")
-    async def _write_decision(self, state: CreditAssessmentState) -> Dict[str, Any]:
+    async def _write_decision(self, state: CreditAssessmentState, config: RunnableConfig) -> Dict[str, Any]:
         """Node: Generate final credit decision"""
         logger.info(f"[{state['application_id']}] Writing credit decision...")
         
         try:
             app = state["application"]
-            applicant = app.get("applicant", {})
             loan_request = app.get("loan_request", {})
             
-            applicant_name = f"{applicant.get('first_name', '')} {applicant.get('last_name', '')}".strip()
-            
-            result = await decision_writer.ainvoke({
-                "applicant_name": applicant_name,
+            result, reason = await self._invoke_agent(state, config, "write_decision", "decision_writer", {
+                "application_id": state["application_id"],
                 "requested_amount": loan_request.get("requested_amount", 0),
                 "requested_term": loan_request.get("requested_term_months", 0),
                 "loan_purpose": loan_request.get("loan_purpose", "other"),
-                "risk_assessment": json.dumps(state["risk_assessment"], default=str),
-                "income_analysis": json.dumps(state["income_analysis"], default=str),
-                "debt_analysis": json.dumps(state["debt_analysis"], default=str),
-                "collateral_evaluation": json.dumps(state["collateral_evaluation"], default=str),
-                "financial_summary": json.dumps(state["financial_summary"], default=str)
+                "risk_assessment": state["risk_assessment"],
+                "income_analysis": state["income_analysis"],
+                "debt_analysis": state["debt_analysis"],
+                "collateral_evaluation": state["collateral_evaluation"],
+                "financial_summary": state["financial_summary"]
             })
+            degraded = reason is not None
+            if degraded:
+                # Rule-based decision from the same decision matrix
+                result = build_credit_decision(
+                    app,
+                    state["risk_assessment"]["calculations"],
+                    state["income_analysis"]["calculations"],
+                    state["debt_analysis"]["calculations"],
+                    disbursement_date=assessment_date(state)
+                )
+            else:
+                result = apply_schedule_terms(result, app, disbursement_date=assessment_date(state))
+            
+            credit_decision = result.model_dump()
+            credit_decision["degraded"] = degraded
             
             return {
-                "credit_decision": result.model_dump(),
+                "credit_decision": credit_decision,
+                "degraded_sections": ["credit_decision"] if degraded else [],
                 "current_stage": "decision_complete",
                 "progress": 100,
                 "messages": [AIMessage(content=f"Decision: {result.decision.value} (confidence: {result.confidence_score:.0f}%)")]
             }
         except Exception as e:
+            # Raised so a checkpointed run keeps the finished nodes and can resume here
             logger.error(f"Error writing decision: {e}")
-            return {
-                "errors": state.get("errors", []) + [f"Decision writing failed: {str(e)}"],
-                "current_stage": "error"
-            }
+            raise
     
-    @track_workflow_duration
-    async def run(self, application: LoanApplication, trace_id: Optional[str] = None) -> CreditAssessmentReport:
-        """
-        Execute the credit assessment workflow.
-        
-        Args:
-            application: Complete loan application
-            trace_id: Optional trace ID for LangSmith
-            
-        Returns:
-            Complete credit assessment report
-        """
-        start_time = datetime.utcnow()
-        application_id = application.application_id or str(uuid.uuid4())
-        
-        logger.info(f"Starting credit assessment for application {application_id}")
-        
-        initial_state: CreditAssessmentState = {
+    def _initial_state(
+        self,
+        application: LoanApplication,
+        application_id: str,
+        start_time: datetime,
+        include_detailed_report: bool = True
+    ) -> CreditAssessmentState:
+        """Build the initial workflow state for an application"""
+        return {
             "application": application.model_dump(),
             "application_id": application_id,
+            "include_detailed_report": include_detailed_report,
+            "pre_screen": None,
             "financial_summary": None,
             "income_analysis": None,
             "debt_analysis": None,
@@ -589,22 +506,46 @@ class CreditAssessmentGraph:
             "current_stage": "started",
             "progress": 0,
             "errors": [],
-            "start_time": start_time.timestamp(),
+            "start_time": start_time.replace(tzinfo=timezone.utc).timestamp(),  # start_time is naive UTC
+            "degraded_sections": [],
             "messages": [HumanMessage(content=f"Starting credit assessment for {application_id}")]
         }
-        
-        config = {"configurable": {"thread_id": application_id}}
+    
+    def _run_config(self, application_id: str, trace_id: Optional[str]) -> Dict[str, Any]:
+        """Build the LangGraph run config (thread, workflow deadline and tracing metadata)"""
+        config = {
+            "configurable": {
+                "thread_id": application_id,
+                "deadline": time.time() + settings.workflow_timeout_seconds
+            }
+        }
         if trace_id:
             config["metadata"] = {"trace_id": trace_id}
-        
-        final_state = await self.graph.ainvoke(initial_state, config=config)
-        
+        return config
+    
+    def _build_report(
+        self,
+        final_state: Dict[str, Any],
+        application: LoanApplication,
+        application_id: str,
+        start_time: datetime,
+        trace_id: Optional[str]
+    ) -> CreditAssessmentReport:
+        """Assemble the final report from the completed workflow state"""
         end_time = datetime.utcnow()
         processing_time = (end_time - start_time).total_seconds()
         
         applicant = application.applicant
         applicant_name = f"{applicant.first_name} {applicant.last_name}"
         
+        # Narrative sections are only built when the caller asked for the detailed report
+        if final_state.get("include_detailed_report", True):
+            executive_summary = self._generate_executive_summary(final_state)
+            detailed_analysis = self._generate_detailed_analysis(final_state)
+            recommendations = self._generate_recommendations(final_state)
+        else:
+            executive_summary, detailed_analysis, recommendations = "", "", []
+        
         report = CreditAssessmentReport(
             report_id=str(uuid.uuid4()),
             application_id=application_id,
@@ -616,9 +557,10 @@ class CreditAssessmentGraph:
             collateral_evaluation=CollateralEvaluation(**final_state["collateral_evaluation"]),
             risk_assessment=RiskAssessment(**final_state["risk_assessment"]),
             credit_decision=CreditDecision(**final_state["credit_decision"]),
-            executive_summary=self._generate_executive_summary(final_state),
-            detailed_analysis=self._generate_detailed_analysis(final_state),
-            recommendations=self._generate_recommendations(final_state),
+            executive_summary=executive_summary,
+            detailed_analysis=detailed_analysis,
+            recommendations=recommendations,
+            degraded_sections=final_state.get("degraded_sections", []),
             processing_time_seconds=processing_time,
             trace_id=trace_id
         )
@@ -627,6 +569,124 @@ class CreditAssessmentGraph:
         
         return report
     
+    @track_workflow_duration
+    async def run(
+        self,
+        application: LoanApplication,
+        trace_id: Optional[str] = None,
+        fast_mode: bool = False,
+        include_detailed_report: bool = True
+    ) -> CreditAssessmentReport:
+        """
+        Execute the credit assessment workflow.
+        
+        Args:
+            application: Complete loan application
+            trace_id: Optional trace ID for LangSmith
+            fast_mode: Run the deterministic-only graph (no LLM calls)
+            include_detailed_report: Build the narrative report sections
+            
+        Returns:
+            Complete credit assessment report
+        """
+        start_time = datetime.utcnow()
+        application_id = application.application_id or str(uuid.uuid4())
+        
+        logger.info(f"Starting {'fast-mode ' if fast_mode else ''}credit assessment for application {application_id}")
+        
+        graph = await self._get_graph(fast_mode)
+        await self._reset_checkpoint(graph, application_id)
+        final_state = await graph.ainvoke(
+            self._initial_state(application, application_id, start_time, include_detailed_report),
+            config=self._run_config(application_id, trace_id)
+        )
+        
+        return self._build_report(final_state, application, application_id, start_time, trace_id)
+    
+    async def _reset_checkpoint(self, graph, application_id: str):
+        """Drop an earlier run's checkpoints so a new assessment starts from scratch"""
+        if graph.checkpointer is not None:
+            await graph.checkpointer.adelete_thread(application_id)
+    
+    @track_workflow_duration
+    async def resume(
+        self,
+        application_id: str,
+        trace_id: Optional[str] = None
+    ) -> CreditAssessmentReport:
+        """
+        Resume a checkpointed workflow, re-executing only the unfinished nodes.
+        
+        Args:
+            application_id: Application whose earlier run should be resumed
+            trace_id: Optional trace ID for LangSmith
+            
+        Returns:
+            Complete credit assessment report
+        """
+        graph = await self._get_graph()
+        if graph.checkpointer is None:
+            raise RuntimeError("Workflow checkpointing is disabled (set CHECKPOINT_SQLITE_PATH)")
+        
+        start_time = datetime.utcnow()
+        config = self._run_config(application_id, trace_id)
+        snapshot = await graph.aget_state(config)
+        if not snapshot.values:
+            raise CheckpointNotFoundError(f"No checkpointed assessment for application {application_id}")
+        
+        if snapshot.next:
+            logger.info(f"Resuming credit assessment for {application_id} at {', '.join(snapshot.next)}")
+            final_state = await graph.ainvoke(None, config=config)
+        else:
+            logger.info(f"Credit assessment for {application_id} already complete, rebuilding report")
+            final_state = snapshot.values
+        
+        application = LoanApplication(**final_state["application"])
+        return self._build_report(final_state, application, application_id, start_time, trace_id)
+    
+    async def stream(
+        self,
+        application: LoanApplication,
+        trace_id: Optional[str] = None,
+        fast_mode: bool = False,
+        include_detailed_report: bool = True
+    ) -> AsyncGenerator[Tuple[str, Any], None]:
+        """
+        Execute the credit assessment workflow, yielding each node's output as it finishes.
+        
+        Args:
+            application: Complete loan application
+            trace_id: Optional trace ID for LangSmith
+            fast_mode: Run the deterministic-only graph (no LLM calls)
+            include_detailed_report: Build the narrative report sections
+            
+        Yields:
+            (node_name, state_update) for every completed node, then
+            ("report", CreditAssessmentReport) once the workflow is done
+        """
+        start_time = datetime.utcnow()
+        application_id = application.application_id or str(uuid.uuid4())
+        
+        logger.info(f"Starting streamed {'fast-mode ' if fast_mode else ''}credit assessment for application {application_id}")
+        
+        graph = await self._get_graph(fast_mode)
+        await self._reset_checkpoint(graph, application_id)
+        
+        async with track_workflow():
+            final_state: Dict[str, Any] = {}
+            async for mode, chunk in graph.astream(
+                self._initial_state(application, application_id, start_time, include_detailed_report),
+                config=self._run_config(application_id, trace_id),
+                stream_mode=["updates", "values"]
+            ):
+                if mode == "updates":
+                    for node_name, update in chunk.items():
+                        yield node_name, update or {}
+                else:
+                    final_state = chunk
+            
+            yield "report", self._build_report(final_state, application, application_id, start_time, trace_id)
+    
     def _generate_executive_summary(self, state: Dict[str, Any]) -> str:
         """Generate executive summary from state"""
         decision = state.get("credit_decision", {})
@@ -638,7 +698,7 @@ class CreditAssessmentGraph:
         risk_level = risk.get("overall_risk_level", "unknown")
         dti = debt.get("projected_dti_ratio", 0)
         
-        return f"""
+        summary = f"""
                     ## Executive Summary
 
                     **Decision:** {decision_type.upper()}
@@ -656,6 +716,15 @@ class CreditAssessmentGraph:
                     The decision is based on comprehensive evaluation of income stability, 
                     debt obligations, collateral coverage, and overall creditworthiness.
                 """
+        
+        degraded_sections = state.get("degraded_sections", [])
+        if degraded_sections:
+            summary += f"""
+                    ### Degraded Sections
+                    Deadline reached; built from deterministic calculations only: {', '.join(degraded_sections)}
+                """
+        
+        return summary
     
     def _generate_detailed_analysis(self, state: Dict[str, Any]) -> str:
         """Generate detailed analysis narrative"""
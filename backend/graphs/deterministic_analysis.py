@@ -0,0 +1,813 @@
+"""
+Deterministic Credit Analysis
+Calculation-only building blocks shared by the full and fast-mode workflows.
+
+The compute_* functions turn the application dict held in the workflow state
+into the `calculations` dict each node attaches to its analysis. The build_*
+functions fill the analysis models from those calculations using fixed
+templates, so the fast-mode graph can produce a complete report without any
+LLM call.
+"""
+
+from datetime import date, datetime, timezone
+from typing import Dict, Any, Iterator, List, Optional
+
+from calculations import (
+    calculate_annual_income,
+    calculate_disposable_income,
+    calculate_max_affordable_payment,
+    perform_income_stress_test,
+    calculate_income_stability_score,
+    calculate_estimated_payment,
+    calculate_loan_terms,
+    iter_amortization_schedule,
+    calculate_dti_ratio,
+    calculate_dscr,
+    calculate_total_monthly_debt,
+    assess_debt_burden,
+    calculate_ltv_ratio,
+    calculate_liquidation_value,
+    assess_collateral_quality,
+    calculate_collateral_coverage,
+    calculate_probability_of_default,
+    calculate_loss_given_default,
+    calculate_expected_loss,
+    calculate_risk_score,
+    simulate_affordability,
+)
+from calculations.debt_calculations import calculate_debt_utilization
+from graphs.knockout_rules import compute_knockout_metrics, evaluate_knockout_rules
+from config.settings import settings
+from app.models import (
+    FinancialDataSummary,
+    IncomeAnalysis,
+    DebtAnalysis,
+    CollateralEvaluation,
+    RiskAssessment,
+    RiskScoreBreakdown,
+    RiskLevel,
+    CreditDecision,
+    DecisionType,
+    LoanTerms,
+)
+
+
+# Collateral types from the application schema mapped to the categories used
+# by the liquidation discount tables
+COLLATERAL_CALCULATION_TYPES = {
+    "real_estate": "real_estate",
+    "vehicle": "vehicle",
+    "savings": "securities",
+    "investment_portfolio": "securities",
+    "business_assets": "equipment",
+}
+
+# Risk levels from calculate_risk_score mapped onto the RiskLevel enum
+RISK_LEVEL_MAPPING = {
+    "low": RiskLevel.VERY_LOW,
+    "moderate": RiskLevel.LOW,
+    "elevated": RiskLevel.MEDIUM,
+    "high": RiskLevel.HIGH,
+    "very_high": RiskLevel.VERY_HIGH,
+}
+
+# Basel III standardised risk weights (%) per risk level
+BASEL_RISK_WEIGHTS = {
+    RiskLevel.VERY_LOW: 20.0,
+    RiskLevel.LOW: 50.0,
+    RiskLevel.MEDIUM: 75.0,
+    RiskLevel.HIGH: 100.0,
+    RiskLevel.VERY_HIGH: 150.0,
+}
+
+# Collateral quality from assess_collateral_quality mapped to the report scale
+COLLATERAL_QUALITY_MAPPING = {
+    "excellent": "excellent",
+    "good": "good",
+    "acceptable": "fair",
+    "weak": "poor",
+    "poor": "poor",
+}
+
+FAST_MODE_NOTE = "Deterministic fast-mode assessment - no qualitative LLM review performed"
+PRE_SCREEN_NOTE = "Knock-out pre-screen decline - no qualitative LLM review performed"
+
+
+def _enum_value(value: Any) -> str:
+    """Return the plain string value of an enum member or string"""
+    return getattr(value, "value", value) or ""
+
+
+def _income_stability_score(employment: Dict[str, Any]) -> int:
+    """Income stability score derived from the employment section"""
+    return calculate_income_stability_score(
+        employment.get("years_employed", 0),
+        _enum_value(employment.get("employment_type", "employed")),
+        has_multiple_sources=employment.get("additional_income", 0) > 0
+    )
+
+
+# ============================================================================
+# CALCULATIONS - attached to each analysis under the "calculations" key
+# ============================================================================
+
+def compute_income_calculations(app: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the income and affordability calculations for an application.
+
+    Args:
+        app: Loan application as a dict (LoanApplication.model_dump())
+
+    Returns:
+        Dictionary of income metrics
+    """
+    employment = app.get("employment", {})
+    loan_request = app.get("loan_request", {})
+    monthly_gross = employment.get("monthly_gross_income", 0)
+    monthly_net = employment.get("monthly_net_income", 0)
+    requested_amount = loan_request.get("requested_amount", 0)
+    requested_term = loan_request.get("requested_term_months", 240)
+
+    annual_income = calculate_annual_income(monthly_gross, monthly_net)
+    existing_monthly_debt = calculate_total_monthly_debt(app.get("existing_debts", []))
+    max_payment = calculate_max_affordable_payment(monthly_gross, existing_monthly_debt)
+
+    # Estimate monthly payment for stress test
+    estimated_payment = calculate_estimated_payment(
+        requested_amount,
+        requested_term,
+        rate=0.04  # 4% default rate
+    ) if requested_amount > 0 and requested_term > 0 else 0
+
+    stress_test = perform_income_stress_test(
+        monthly_gross,
+        estimated_payment,
+        loan_amount=requested_amount,
+        loan_term_months=requested_term
+    )
+
+    # Monte Carlo stress test: joint income / rate paths at the same 4% rate
+    stress_simulation = simulate_affordability(
+        monthly_gross,
+        existing_monthly_debt,
+        requested_amount,
+        requested_term,
+        current_interest_rate=4.0,
+        scenarios=settings.stress_simulation_scenarios,
+        horizon_years=settings.stress_simulation_horizon_years,
+        seed=settings.stress_simulation_seed
+    ) if settings.stress_simulation_scenarios > 0 and requested_amount > 0 and requested_term > 0 else None
+
+    return {
+        "annual_gross_income": annual_income["annual_gross"],
+        "annual_net_income": annual_income["annual_net"],
+        "monthly_net_income": monthly_net,
+        "additional_income": employment.get("additional_income", 0),
+        "existing_monthly_debt": existing_monthly_debt,
+        "disposable_income": calculate_disposable_income(
+            monthly_net,
+            existing_debt_payments=existing_monthly_debt
+        ),
+        "estimated_payment": estimated_payment,
+        "max_affordable_payment": max_payment["recommended_max_payment"],
+        "max_payment_dti": max_payment["max_payment_dti"],
+        "max_payment_housing": max_payment["max_payment_housing"],
+        "stability_score": _income_stability_score(employment),
+        "stress_test_passed": stress_test["overall_passes_stress_test"],
+        "stress_test_results": stress_test,
+        "stress_simulation": stress_simulation
+    }
+
+
+def compute_debt_calculations(app: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the debt burden calculations for an application.
+
+    Args:
+        app: Loan application as a dict (LoanApplication.model_dump())
+
+    Returns:
+        Dictionary of debt metrics (DTI values in %)
+    """
+    loan_request = app.get("loan_request", {})
+    employment = app.get("employment", {})
+    existing_debts = app.get("existing_debts", [])
+
+    requested_amount = loan_request.get("requested_amount", 0)
+    requested_term = loan_request.get("requested_term_months", 12)
+    estimated_payment = calculate_estimated_payment(
+        requested_amount,
+        requested_term
+    ) if requested_amount > 0 and requested_term > 0 else 0
+
+    monthly_gross = employment.get("monthly_gross_income", 0)
+    monthly_net = employment.get("monthly_net_income", 0)
+
+    total_monthly_debt = calculate_total_monthly_debt(existing_debts)
+    current_dti = calculate_dti_ratio(total_monthly_debt, monthly_gross)
+    projected_dti = calculate_dti_ratio(total_monthly_debt + estimated_payment, monthly_gross)
+    dscr = calculate_dscr(monthly_net, total_monthly_debt)
+    debt_burden = assess_debt_burden(current_dti, dscr)
+
+    # Credit utilization of revolving facilities (original amount used as the limit)
+    revolving = [d for d in existing_debts if d.get("debt_type") in ["credit_card", "line_of_credit"]]
+    utilization = calculate_debt_utilization(
+        sum(d.get("current_balance", 0) for d in revolving),
+        sum(d.get("original_amount", 0) for d in revolving)
+    )
+
+    return {
+        "total_existing_debt": sum(d.get("current_balance", 0) for d in existing_debts),
+        "total_monthly_debt": total_monthly_debt,
+        "estimated_payment": estimated_payment,
+        "current_dti_ratio": current_dti,
+        "projected_dti_ratio": projected_dti,
+        "dscr": dscr,
+        "debt_burden_level": debt_burden["overall_debt_burden"],
+        "debt_burden_score": debt_burden["overall_score"],
+        "debt_burden_assessment": debt_burden,
+        "credit_utilization": utilization
+    }
+
+
+def compute_collateral_calculations(app: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the collateral coverage calculations for an application.
+
+    Args:
+        app: Loan application as a dict (LoanApplication.model_dump())
+
+    Returns:
+        Dictionary of collateral metrics (unsecured defaults if no collateral)
+    """
+    loan_request = app.get("loan_request", {})
+    collateral = app.get("collateral")
+    requested_amount = loan_request.get("requested_amount", 0)
+
+    if not collateral:
+        # Unsecured loan
+        return {
+            "collateral_present": False,
+            "ltv_ratio": 100.0,
+            "liquidation_value": 0,
+            "quality_score": 0,
+            "overall_quality": "none",
+            "coverage_ratio": 0,
+            "meets_coverage_requirement": False
+        }
+
+    collateral_value = collateral.get("estimated_value", 0)
+    collateral_type = _enum_value(collateral.get("collateral_type", "other"))
+    calculation_type = COLLATERAL_CALCULATION_TYPES.get(collateral_type, "other")
+    has_insurance = bool(collateral.get("insurance_coverage"))
+
+    ltv = calculate_ltv_ratio(requested_amount, collateral_value)
+    liquidation = calculate_liquidation_value(collateral_value, calculation_type)
+    quality = assess_collateral_quality(ltv, calculation_type, has_insurance)
+    coverage = calculate_collateral_coverage(requested_amount, liquidation["liquidation_value"])
+
+    return {
+        "collateral_present": True,
+        "collateral_type": collateral_type,
+        "collateral_value": collateral_value,
+        "ltv_ratio": ltv,
+        "liquidation_value": liquidation["liquidation_value"],
+        "liquidation_discount": liquidation["liquidation_discount"],
+        "recovery_rate": liquidation["recovery_rate"],
+        "quality_score": quality["quality_score"],
+        "overall_quality": quality["overall_quality"],
+        "coverage_ratio": coverage["coverage_ratio"],
+        "meets_coverage_requirement": coverage["meets_requirement"]
+    }
+
+
+def compute_risk_calculations(
+    app: Dict[str, Any],
+    income_calcs: Dict[str, Any],
+    debt_calcs: Dict[str, Any],
+    collateral_calcs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Run PD/LGD/EL and risk score calculations from the earlier node results.
+
+    Args:
+        app: Loan application as a dict (LoanApplication.model_dump())
+        income_calcs: Output of compute_income_calculations
+        debt_calcs: Output of compute_debt_calculations
+        collateral_calcs: Output of compute_collateral_calculations
+
+    Returns:
+        Dictionary of risk metrics
+    """
+    loan_request = app.get("loan_request", {})
+    credit_history = app.get("credit_history", {})
+    employment = app.get("employment", {})
+
+    credit_score = credit_history.get("credit_score", 650)
+    dti_ratio = debt_calcs.get("current_dti_ratio", 0)
+    ltv_ratio = collateral_calcs.get("ltv_ratio", 100)
+    employment_years = employment.get("years_employed", 0)
+
+    pd = calculate_probability_of_default(
+        credit_score,
+        dti_ratio,
+        employment_years,
+        payment_history_score=100,  # Could extract from credit_history
+        debt_burden_level=debt_calcs.get("debt_burden_level", "moderate")
+    )
+
+    lgd = calculate_loss_given_default(
+        ltv_ratio,
+        collateral_calcs.get("overall_quality", "none"),
+        recovery_rate=collateral_calcs.get("recovery_rate", 70.0),
+        has_guarantor=False
+    )
+
+    requested_amount = loan_request.get("requested_amount", 0)
+    el = calculate_expected_loss(requested_amount, pd, lgd)
+
+    risk = calculate_risk_score(
+        pd,
+        lgd,
+        dti_ratio,
+        ltv_ratio,
+        credit_score,
+        income_calcs.get("stability_score", 50),
+        collateral_calcs.get("quality_score", 0)
+    )
+
+    risk_level = RISK_LEVEL_MAPPING.get(risk["overall_risk_level"], RiskLevel.MEDIUM)
+
+    return {
+        "probability_of_default": pd,
+        "loss_given_default": lgd,
+        "expected_loss_amount": el["expected_loss_amount"],
+        "expected_loss_percentage": el["expected_loss_percentage"],
+        "risk_score": risk["risk_score"],
+        "overall_risk_level": risk["overall_risk_level"],
+        "component_scores": risk["component_scores"],
+        "basel_risk_weight": BASEL_RISK_WEIGHTS[risk_level]
+    }
+
+
+# ============================================================================
+# TEMPLATES - analysis models filled from the calculations
+# ============================================================================
+
+def build_financial_summary(app: Dict[str, Any]) -> FinancialDataSummary:
+    """Templated FinancialDataSummary built from the application data"""
+    employment = app.get("employment", {})
+    credit_history = app.get("credit_history", {})
+    additional_income = employment.get("additional_income", 0)
+    verified = employment.get("income_verified", False)
+
+    income_sources = [f"{_enum_value(employment.get('employment_type', 'employed'))} income"]
+    if additional_income > 0:
+        income_sources.append("additional income")
+
+    red_flags = []
+    if credit_history.get("bankruptcies", 0) > 0:
+        red_flags.append("Bankruptcy on record")
+    if credit_history.get("foreclosures", 0) > 0:
+        red_flags.append("Foreclosure on record")
+    if credit_history.get("delinquencies_90_days", 0) > 0:
+        red_flags.append("90+ day delinquencies on record")
+    if credit_history.get("collections", 0) > 0:
+        red_flags.append("Accounts in collections")
+    if not verified:
+        red_flags.append("Income not verified")
+
+    return FinancialDataSummary(
+        total_monthly_income=employment.get("monthly_gross_income", 0) + additional_income,
+        income_stability_score=_income_stability_score(employment),
+        income_sources=income_sources,
+        employment_stability=(
+            f"{employment.get('years_employed', 0):.1f} years with current employer, "
+            f"{employment.get('years_in_profession', 0):.1f} years in profession"
+        ),
+        income_trend="stable",
+        verification_status="verified" if verified else "unverified",
+        red_flags=red_flags,
+        data_quality_score=8 if verified else 6
+    )
+
+
+def degraded_note(node_name: str, reason: str) -> str:
+    """Analysis note of a full-graph section built from calculations after its agent missed a deadline"""
+    return (
+        f"Degraded assessment - {node_name} reached its deadline ({reason}); "
+        "built from deterministic calculations, no qualitative LLM review performed"
+    )
+
+
+def build_income_analysis(calcs: Dict[str, Any], note: str = FAST_MODE_NOTE) -> IncomeAnalysis:
+    """
+    Templated IncomeAnalysis built from compute_income_calculations output.
+
+    Args:
+        calcs: compute_income_calculations output
+        note: Analysis note saying why no agent reviewed the section (fast mode,
+            pre-screen decline or a missed deadline)
+    """
+    obligations = calcs["existing_monthly_debt"] + calcs["estimated_payment"]
+    stress = calcs["stress_test_results"]
+    simulation = calcs.get("stress_simulation")
+    stability = calcs["stability_score"]
+    total_income = calcs["annual_gross_income"] / 12 + calcs["additional_income"]
+
+    if stability >= 75:
+        sustainability = "high"
+    elif stability >= 50:
+        sustainability = "medium"
+    else:
+        sustainability = "low"
+
+    return IncomeAnalysis(
+        gross_annual_income=calcs["annual_gross_income"],
+        net_annual_income=calcs["annual_net_income"],
+        income_to_expense_ratio=round(calcs["monthly_net_income"] / obligations, 2) if obligations > 0 else 999.0,
+        disposable_income_monthly=calcs["disposable_income"],
+        income_sustainability=sustainability,
+        income_diversification=round(calcs["additional_income"] / total_income * 100, 2) if total_income > 0 else 0,
+        stress_test_result=(
+            f"{'Passes' if calcs['stress_test_passed'] else 'Fails'} stress test "
+            f"(income -20%: DTI {stress['income_stress']['dti_ratio']}%, "
+            f"rate +200 bps: DTI {stress['rate_stress']['dti_ratio']}%)"
+            + (
+                f"; {simulation['breach_probability']}% of {simulation['scenarios']} simulated "
+                f"{simulation['horizon_years']}-year income / rate scenarios breach "
+                f"{simulation['dti_limit']:g}% DTI (95th percentile worst DTI "
+                f"{simulation['worst_dti_percentiles']['p95']}%)"
+                if simulation else ""
+            )
+        ),
+        max_affordable_payment=calcs["max_affordable_payment"],
+        analysis_notes=[note]
+    )
+
+
+def build_debt_analysis(calcs: Dict[str, Any]) -> DebtAnalysis:
+    """Templated DebtAnalysis built from compute_debt_calculations output"""
+    projected_dti = calcs["projected_dti_ratio"]
+    dscr = calcs["dscr"]
+
+    if projected_dti < 36:
+        payment_shock_risk = "low"
+    elif projected_dti < 43:
+        payment_shock_risk = "medium"
+    else:
+        payment_shock_risk = "high"
+
+    red_flags = []
+    if projected_dti > 43:
+        red_flags.append(f"Projected DTI {projected_dti:.1f}% exceeds the 43% limit")
+    if dscr < 1.0:
+        red_flags.append(f"DSCR {dscr:.2f} below 1.0 - income does not cover existing debt")
+
+    return DebtAnalysis(
+        total_existing_debt=calcs["total_existing_debt"],
+        total_monthly_debt_payments=calcs["total_monthly_debt"],
+        debt_to_income_ratio=calcs["current_dti_ratio"] / 100,
+        projected_dti_ratio=projected_dti / 100,
+        debt_service_coverage_ratio=dscr,
+        utilization_rate=min(100.0, calcs["credit_utilization"]),
+        debt_structure_assessment=(
+            f"{calcs['debt_burden_level'].replace('_', ' ').capitalize()} debt burden "
+            f"(current DTI {calcs['current_dti_ratio']:.1f}%, projected DTI {projected_dti:.1f}%)"
+        ),
+        payment_shock_risk=payment_shock_risk,
+        debt_red_flags=red_flags
+    )
+
+
+def build_collateral_evaluation(calcs: Dict[str, Any]) -> CollateralEvaluation:
+    """Templated CollateralEvaluation built from compute_collateral_calculations output"""
+    if not calcs.get("collateral_present"):
+        return CollateralEvaluation(
+            collateral_present=False,
+            recommendations=["Unsecured loan - consider collateral or a guarantor to reduce LGD"]
+        )
+
+    risks = []
+    if not calcs["meets_coverage_requirement"]:
+        risks.append(f"Coverage ratio {calcs['coverage_ratio']:.2f}x below the 1.2x requirement")
+    if calcs["ltv_ratio"] >= 85:
+        risks.append(f"High LTV ratio {calcs['ltv_ratio']:.1f}%")
+
+    return CollateralEvaluation(
+        collateral_present=True,
+        collateral_type=calcs["collateral_type"],
+        estimated_value=calcs["collateral_value"],
+        loan_to_value_ratio=calcs["ltv_ratio"],
+        collateral_quality=COLLATERAL_QUALITY_MAPPING.get(calcs["overall_quality"], "poor"),
+        liquidation_value=calcs["liquidation_value"],
+        collateral_coverage_ratio=calcs["coverage_ratio"],
+        valuation_confidence="medium",
+        collateral_risks=risks
+    )
+
+
+def _employment_score(years_employed: float) -> float:
+    """Employment stability score (0-100) from years in current employment"""
+    if years_employed >= 5:
+        return 100.0
+    elif years_employed >= 3:
+        return 80.0
+    elif years_employed >= 1:
+        return 60.0
+    return 30.0
+
+
+def build_risk_assessment(
+    app: Dict[str, Any],
+    calcs: Dict[str, Any],
+    income_calcs: Dict[str, Any],
+    debt_calcs: Dict[str, Any],
+    collateral_calcs: Dict[str, Any]
+) -> RiskAssessment:
+    """Templated RiskAssessment built from compute_risk_calculations output"""
+    credit_history = app.get("credit_history", {})
+    employment = app.get("employment", {})
+    risk_level = RISK_LEVEL_MAPPING.get(calcs["overall_risk_level"], RiskLevel.MEDIUM)
+
+    risk_factors = []
+    mitigating_factors = []
+    regulatory_flags = []
+
+    if credit_history.get("credit_score", 650) < 650:
+        risk_factors.append(f"Below-average credit score ({credit_history.get('credit_score')})")
+    elif credit_history.get("credit_score", 650) >= 750:
+        mitigating_factors.append(f"Strong credit score ({credit_history.get('credit_score')})")
+    if debt_calcs["projected_dti_ratio"] > 43:
+        risk_factors.append(f"Projected DTI {debt_calcs['projected_dti_ratio']:.1f}% above 43%")
+        regulatory_flags.append("Projected DTI exceeds the 43% affordability limit")
+    elif debt_calcs["projected_dti_ratio"] < 28:
+        mitigating_factors.append(f"Low projected DTI ({debt_calcs['projected_dti_ratio']:.1f}%)")
+    if not income_calcs["stress_test_passed"]:
+        risk_factors.append("Fails affordability stress test")
+    if credit_history.get("bankruptcies", 0) > 0 or credit_history.get("foreclosures", 0) > 0:
+        risk_factors.append("Bankruptcy or foreclosure history")
+    if credit_history.get("delinquencies_90_days", 0) > 0:
+        risk_factors.append("90+ day delinquencies")
+    if collateral_calcs.get("meets_coverage_requirement"):
+        mitigating_factors.append("Collateral coverage meets the 1.2x requirement")
+    if employment.get("years_employed", 0) >= 5:
+        mitigating_factors.append("Long-term stable employment")
+
+    return RiskAssessment(
+        overall_risk_level=risk_level,
+        risk_score=int(round(calcs["risk_score"])),
+        probability_of_default=calcs["probability_of_default"],
+        loss_given_default=calcs["loss_given_default"],
+        expected_loss=calcs["expected_loss_amount"],
+        score_breakdown=RiskScoreBreakdown(
+            credit_history_score=calcs["component_scores"]["credit_score"],
+            income_stability_score=income_calcs["stability_score"],
+            debt_burden_score=debt_calcs["debt_burden_score"],
+            collateral_score=collateral_calcs.get("quality_score", 0),
+            employment_score=_employment_score(employment.get("years_employed", 0))
+        ),
+        risk_factors=risk_factors,
+        mitigating_factors=mitigating_factors,
+        regulatory_flags=regulatory_flags,
+        basel_risk_weight=calcs["basel_risk_weight"]
+    )
+
+
+def _interest_rate(credit_score: int, risk_level: RiskLevel) -> float:
+    """Annual interest rate (%) from the credit score tier plus a risk premium"""
+    if credit_score >= 750:
+        base_rate = 3.5
+    elif credit_score >= 700:
+        base_rate = 4.5
+    elif credit_score >= 650:
+        base_rate = 6.0
+    else:
+        base_rate = 8.0
+
+    risk_premium = {RiskLevel.MEDIUM: 0.5, RiskLevel.HIGH: 1.5, RiskLevel.VERY_HIGH: 3.0}
+    return base_rate + risk_premium.get(risk_level, 0.0)
+
+
+def build_loan_terms(
+    amount: float,
+    term_months: int,
+    interest_rate: float,
+    fees: float = 0.0,
+    payment_day: int = 1,
+    disbursement_date: Optional[date] = None
+) -> LoanTerms:
+    """
+    LoanTerms for a fully amortizing loan at a fixed annual rate (%).
+
+    Payment, totals and APR come from the loan's amortization schedule
+    (calculations.amortization), which /reports/{report_id}/schedule streams.
+
+    Args:
+        amount: Approved amount
+        term_months: Number of monthly installments
+        interest_rate: Annual interest rate (%)
+        fees: Fees paid at disbursement
+        payment_day: Day of month payments are due
+        disbursement_date: Disbursement date (default: today, UTC)
+
+    Returns:
+        LoanTerms with the schedule's first payment date
+    """
+    disbursement_date = disbursement_date or datetime.now(timezone.utc).date()
+    terms = calculate_loan_terms(
+        amount,
+        term_months,
+        interest_rate,
+        disbursement_date=disbursement_date,
+        payment_day=payment_day,
+        upfront_fee=fees
+    )
+
+    return LoanTerms(
+        approved_amount=amount,
+        interest_rate=interest_rate,
+        term_months=term_months,
+        monthly_payment=terms["monthly_payment"],
+        total_interest=terms["total_interest"],
+        total_repayment=terms["total_repayment"],
+        annual_percentage_rate=terms["annual_percentage_rate"],
+        fees=fees,
+        payment_day=payment_day,
+        disbursement_date=disbursement_date,
+        first_payment_date=terms["first_payment_date"]
+    )
+
+
+def iter_loan_terms_schedule(terms: LoanTerms) -> Iterator[Dict[str, Any]]:
+    """
+    Amortization schedule of stored LoanTerms, priced as build_loan_terms priced them.
+
+    Uses the terms' own disbursement date and payment day, so the first
+    installment carries the same stub-period interest. An upfront fee comes
+    first as installment 0 on the disbursement date (no principal or
+    interest): the installments then hold every cash flow behind the terms'
+    APR, and their payments sum to total_repayment.
+
+    Args:
+        terms: Approved terms from a stored report
+
+    Yields:
+        Installment dictionaries (see iter_amortization_schedule)
+    """
+    if terms.fees:
+        yield {
+            "installment": 0,
+            "payment_date": terms.disbursement_date,
+            "interest_rate": terms.interest_rate,
+            "payment": 0.0,
+            "principal": 0.0,
+            "interest": 0.0,
+            "fee": terms.fees,
+            "balance": terms.approved_amount,
+        }
+    yield from iter_amortization_schedule(
+        terms.approved_amount,
+        terms.term_months,
+        terms.interest_rate,
+        disbursement_date=terms.disbursement_date,
+        payment_day=terms.payment_day
+    )
+
+
+def apply_schedule_terms(
+    decision: CreditDecision,
+    app: Dict[str, Any],
+    disbursement_date: Optional[date] = None
+) -> CreditDecision:
+    """
+    Replace the figures of LLM-written approved terms with the schedule's.
+
+    The decision writer chooses amount, term, rate and fees; payment, totals
+    and APR are recomputed so every decision's terms match its schedule.
+
+    Args:
+        decision: Decision from the decision writer
+        app: Loan application as a dict (LoanApplication.model_dump())
+        disbursement_date: Disbursement date (default: today, UTC)
+
+    Returns:
+        The decision, with approved_terms rebuilt if it has any
+    """
+    terms = decision.approved_terms
+    if terms is None:
+        return decision
+    loan_request = app.get("loan_request", {})
+    decision.approved_terms = build_loan_terms(
+        terms.approved_amount,
+        terms.term_months if terms.term_months >= 1 else loan_request.get("requested_term_months", 12),
+        terms.interest_rate,
+        fees=terms.fees,
+        payment_day=loan_request.get("preferred_payment_day", 1),
+        disbursement_date=disbursement_date
+    )
+    return decision
+
+
+def build_credit_decision(
+    app: Dict[str, Any],
+    risk_calcs: Dict[str, Any],
+    income_calcs: Dict[str, Any],
+    debt_calcs: Dict[str, Any],
+    disbursement_date: Optional[date] = None
+) -> CreditDecision:
+    """
+    Rule-based CreditDecision following the decision writer's decision matrix.
+
+    Args:
+        app: Loan application as a dict (LoanApplication.model_dump())
+        risk_calcs: Output of compute_risk_calculations
+        income_calcs: Output of compute_income_calculations
+        debt_calcs: Output of compute_debt_calculations
+        disbursement_date: Disbursement date of approved terms (default: today, UTC)
+
+    Returns:
+        CreditDecision with terms for approvals
+    """
+    credit_history = app.get("credit_history", {})
+    loan_request = app.get("loan_request", {})
+    credit_score = credit_history.get("credit_score", 650)
+    projected_dti = debt_calcs["projected_dti_ratio"]
+    risk_level = RISK_LEVEL_MAPPING.get(risk_calcs["overall_risk_level"], RiskLevel.MEDIUM)
+
+    decline_reasons = [
+        failure["reason"] for failure in evaluate_knockout_rules(compute_knockout_metrics(app))
+    ]
+    if risk_level in (RiskLevel.HIGH, RiskLevel.VERY_HIGH):
+        decline_reasons.append(f"Overall risk level {risk_level.value}")
+
+    if decline_reasons:
+        return CreditDecision(
+            decision=DecisionType.DECLINED,
+            confidence_score=85,
+            decline_reasons=decline_reasons,
+            next_steps=["Applicant may reapply once the decline reasons have been addressed"]
+        )
+
+    terms = build_loan_terms(
+        loan_request.get("requested_amount", 0),
+        loan_request.get("requested_term_months", 12),
+        _interest_rate(credit_score, risk_level),
+        payment_day=loan_request.get("preferred_payment_day", 1),
+        disbursement_date=disbursement_date
+    )
+
+    if (
+        risk_level in (RiskLevel.VERY_LOW, RiskLevel.LOW)
+        and projected_dti < 36
+        and credit_score >= 700
+        and income_calcs["stress_test_passed"]
+    ):
+        return CreditDecision(
+            decision=DecisionType.APPROVED,
+            confidence_score=85,
+            approved_terms=terms,
+            next_steps=["Sign the loan agreement", "Provide identity and income documentation"]
+        )
+
+    if projected_dti <= 43 and credit_score >= 650:
+        conditions = ["Verification of income documentation"]
+        if not income_calcs["stress_test_passed"]:
+            conditions.append("Reduced loan amount or longer term to pass the affordability stress test")
+        if projected_dti >= 36:
+            conditions.append("Reduction of existing debt before disbursement")
+        return CreditDecision(
+            decision=DecisionType.APPROVED_WITH_CONDITIONS,
+            confidence_score=70,
+            approved_terms=terms,
+            conditions=conditions,
+            next_steps=["Satisfy the listed conditions", "Sign the loan agreement"]
+        )
+
+    return CreditDecision(
+        decision=DecisionType.MANUAL_REVIEW,
+        confidence_score=50,
+        manual_review_reasons=[
+            f"Borderline profile: risk level {risk_level.value}, "
+            f"projected DTI {projected_dti:.1f}%, credit score {credit_score}"
+        ],
+        next_steps=["Application referred to an underwriter for full review"]
+    )
+
+
+def build_knockout_decline(failures: List[Dict[str, Any]]) -> CreditDecision:
+    """
+    CreditDecision for an application that failed the pre-screen knock-out rules.
+
+    Args:
+        failures: Output of evaluate_knockout_rules (at least one entry)
+
+    Returns:
+        DECLINED decision listing every failed rule
+    """
+    return CreditDecision(
+        decision=DecisionType.DECLINED,
+        confidence_score=95,
+        decline_reasons=[failure["reason"] for failure in failures],
+        next_steps=["Applicant may reapply once the decline reasons have been addressed"]
+    )
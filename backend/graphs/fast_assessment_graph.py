@@ -0,0 +1,145 @@
+"""
+Fast-Mode Credit Assessment Graph
+Deterministic-only workflow used when AssessmentRequest.fast_mode is set.
+
+Mirrors the node layout of the full workflow but replaces every agent call
+with the calculations package and templated analyses, so an assessment
+completes in milliseconds without any LLM round trip:
+
+   START → pre_screen → collect_financial_data → [income, debt, collateral] → calculate_risk → write_decision → END
+                      └→ write_decline_report → END (knock-out declines)
+"""
+
+from typing import Dict, Any
+from langgraph.graph import StateGraph, START, END
+from langchain_core.messages import AIMessage
+
+from graphs.state import CreditAssessmentState, assessment_date
+from graphs.pre_screen import pre_screen, route_after_pre_screen, write_decline_report
+from graphs.deterministic_analysis import (
+    compute_income_calculations,
+    compute_debt_calculations,
+    compute_collateral_calculations,
+    compute_risk_calculations,
+    build_financial_summary,
+    build_income_analysis,
+    build_debt_analysis,
+    build_collateral_evaluation,
+    build_risk_assessment,
+    build_credit_decision,
+)
+from monitoring.metrics import track_node_duration
+
+
+@track_node_duration("fast_collect_financial_data")
+async def _collect_financial_data(state: CreditAssessmentState) -> Dict[str, Any]:
+    """Node: Templated financial data summary"""
+    summary = build_financial_summary(state["application"])
+    return {
+        "financial_summary": summary.model_dump(),
+        "current_stage": "financial_data_collected",
+        "progress": 20
+    }
+
+
+@track_node_duration("fast_analyze_income")
+async def _analyze_income(state: CreditAssessmentState) -> Dict[str, Any]:
+    """Node: Income calculations (runs in parallel)"""
+    calculations = compute_income_calculations(state["application"])
+    income_analysis = build_income_analysis(calculations).model_dump()
+    income_analysis["calculations"] = calculations
+    return {"income_analysis": income_analysis}
+
+
+@track_node_duration("fast_analyze_debt")
+async def _analyze_debt(state: CreditAssessmentState) -> Dict[str, Any]:
+    """Node: Debt calculations (runs in parallel)"""
+    calculations = compute_debt_calculations(state["application"])
+    debt_analysis = build_debt_analysis(calculations).model_dump()
+    debt_analysis["calculations"] = calculations
+    return {"debt_analysis": debt_analysis}
+
+
+@track_node_duration("fast_evaluate_collateral")
+async def _evaluate_collateral(state: CreditAssessmentState) -> Dict[str, Any]:
+    """Node: Collateral calculations (runs in parallel)"""
+    calculations = compute_collateral_calculations(state["application"])
+    collateral_evaluation = build_collateral_evaluation(calculations).model_dump()
+    collateral_evaluation["calculations"] = calculations
+    return {"collateral_evaluation": collateral_evaluation}
+
+
+@track_node_duration("fast_calculate_risk")
+async def _calculate_risk(state: CreditAssessmentState) -> Dict[str, Any]:
+    """Node: PD/LGD/EL and risk score calculations"""
+    app = state["application"]
+    income_calcs = state["income_analysis"]["calculations"]
+    debt_calcs = state["debt_analysis"]["calculations"]
+    collateral_calcs = state["collateral_evaluation"]["calculations"]
+
+    calculations = compute_risk_calculations(app, income_calcs, debt_calcs, collateral_calcs)
+    risk_assessment = build_risk_assessment(
+        app, calculations, income_calcs, debt_calcs, collateral_calcs
+    ).model_dump()
+    risk_assessment["calculations"] = calculations
+
+    return {
+        "risk_assessment": risk_assessment,
+        "current_stage": "risk_calculated",
+        "progress": 80
+    }
+
+
+@track_node_duration("fast_write_decision")
+async def _write_decision(state: CreditAssessmentState) -> Dict[str, Any]:
+    """Node: Rule-based credit decision"""
+    result = build_credit_decision(
+        state["application"],
+        state["risk_assessment"]["calculations"],
+        state["income_analysis"]["calculations"],
+        state["debt_analysis"]["calculations"],
+        disbursement_date=assessment_date(state)
+    )
+    return {
+        "credit_decision": result.model_dump(),
+        "current_stage": "decision_complete",
+        "progress": 100,
+        "messages": [AIMessage(content=f"Fast-mode decision: {result.decision.value}")]
+    }
+
+
+def build_fast_assessment_graph():
+    """
+    Build and compile the deterministic fast-mode workflow.
+
+    Returns:
+        Compiled LangGraph graph sharing CreditAssessmentState with the full workflow
+    """
+    workflow = StateGraph(CreditAssessmentState)
+
+    workflow.add_node("pre_screen", pre_screen)
+    workflow.add_node("write_decline_report", write_decline_report)
+    workflow.add_node("collect_financial_data", _collect_financial_data)
+    workflow.add_node("analyze_income", _analyze_income)
+    workflow.add_node("analyze_debt", _analyze_debt)
+    workflow.add_node("evaluate_collateral", _evaluate_collateral)
+    workflow.add_node("calculate_risk", _calculate_risk)
+    workflow.add_node("write_decision", _write_decision)
+
+    workflow.add_edge(START, "pre_screen")
+    workflow.add_conditional_edges(
+        "pre_screen",
+        route_after_pre_screen,
+        ["collect_financial_data", "write_decline_report"]
+    )
+    workflow.add_edge("write_decline_report", END)
+    workflow.add_edge("collect_financial_data", "analyze_income")
+    workflow.add_edge("collect_financial_data", "analyze_debt")
+    workflow.add_edge("collect_financial_data", "evaluate_collateral")
+
+    # Waits for all three parallel analyses before scoring risk
+    workflow.add_edge(["analyze_income", "analyze_debt", "evaluate_collateral"], "calculate_risk")
+    workflow.add_edge("calculate_risk", "write_decision")
+    workflow.add_edge("write_decision", END)
+
+    return workflow.compile()
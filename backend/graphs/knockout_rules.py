@@ -0,0 +1,132 @@
+"""
+Knock-out Rules
+Declarative hard-fail rules from the decision writer's decision matrix.
+
+Each rule compares one pre-screen metric against a threshold. An application
+failing any rule is DECLINED regardless of the rest of the analysis, so the
+pre_screen node can skip every LLM agent for it. build_credit_decision applies
+the same rules, keeping the fast-mode and pre-screen declines consistent.
+"""
+
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from calculations.debt_calculations import (
+    calculate_estimated_payment,
+    calculate_total_monthly_debt,
+    calculate_dti_ratio,
+)
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+@dataclass(frozen=True)
+class KnockoutRule:
+    """Hard-fail rule: the application is declined when `metric <operator> threshold`"""
+    rule_id: str
+    metric: str
+    operator: str
+    threshold: float
+    reason: str  # Formatted with {value} and {threshold}
+
+    def fails(self, metrics: Dict[str, Any]) -> bool:
+        """Whether the metrics trigger this rule (missing metrics never fail)"""
+        value = metrics.get(self.metric)
+        return value is not None and OPERATORS[self.operator](value, self.threshold)
+
+
+KNOCKOUT_RULES: List[KnockoutRule] = [
+    KnockoutRule(
+        rule_id="bankruptcy",
+        metric="bankruptcies",
+        operator=">",
+        threshold=0,
+        reason="Bankruptcy on record ({value} filing(s))"
+    ),
+    KnockoutRule(
+        rule_id="foreclosure",
+        metric="foreclosures",
+        operator=">",
+        threshold=0,
+        reason="Foreclosure on record ({value} event(s))"
+    ),
+    KnockoutRule(
+        rule_id="min_credit_score",
+        metric="credit_score",
+        operator="<",
+        threshold=580,
+        reason="Credit score {value} below the {threshold:g} minimum"
+    ),
+    KnockoutRule(
+        rule_id="max_projected_dti",
+        metric="projected_dti_ratio",
+        operator=">",
+        threshold=50,
+        reason="Projected DTI {value:.1f}% above the {threshold:g}% maximum"
+    ),
+]
+
+
+def compute_knockout_metrics(app: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Collect the metrics the knock-out rules are evaluated on.
+
+    Args:
+        app: Loan application as a dict (LoanApplication.model_dump())
+
+    Returns:
+        Credit history counts, credit score and projected DTI (in %)
+    """
+    credit_history = app.get("credit_history", {})
+    loan_request = app.get("loan_request", {})
+    employment = app.get("employment", {})
+
+    requested_amount = loan_request.get("requested_amount", 0)
+    requested_term = loan_request.get("requested_term_months", 12)
+    estimated_payment = calculate_estimated_payment(
+        requested_amount,
+        requested_term
+    ) if requested_amount > 0 and requested_term > 0 else 0
+    total_monthly_debt = calculate_total_monthly_debt(app.get("existing_debts", []))
+
+    return {
+        "bankruptcies": credit_history.get("bankruptcies", 0),
+        "foreclosures": credit_history.get("foreclosures", 0),
+        "credit_score": credit_history.get("credit_score"),
+        "projected_dti_ratio": calculate_dti_ratio(
+            total_monthly_debt + estimated_payment,
+            employment.get("monthly_gross_income", 0)
+        ),
+    }
+
+
+def evaluate_knockout_rules(
+    metrics: Dict[str, Any],
+    rules: List[KnockoutRule] = KNOCKOUT_RULES
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate knock-out rules against pre-screen metrics.
+
+    Args:
+        metrics: Output of compute_knockout_metrics
+        rules: Rule set to apply
+
+    Returns:
+        One entry per failed rule: rule_id, metric value, threshold and reason
+    """
+    return [
+        {
+            "rule_id": rule.rule_id,
+            "value": metrics[rule.metric],
+            "threshold": rule.threshold,
+            "reason": rule.reason.format(value=metrics[rule.metric], threshold=rule.threshold),
+        }
+        for rule in rules
+        if rule.fails(metrics)
+    ]
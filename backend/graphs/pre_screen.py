@@ -0,0 +1,102 @@
+"""
+Pre-Screen Nodes
+Deterministic knock-out check that runs before collect_financial_data.
+
+Applications failing any knock-out rule (see graphs/knockout_rules.py) are
+routed straight to a templated decline report instead of the agent pipeline:
+
+   START → pre_screen ─┬─ passed → collect_financial_data → ...
+                       └─ failed → write_decline_report → END
+
+Shared by the full and fast-mode workflows.
+"""
+
+from typing import Dict, Any
+
+from langchain_core.messages import AIMessage
+
+from graphs.state import CreditAssessmentState
+from graphs.knockout_rules import compute_knockout_metrics, evaluate_knockout_rules
+from graphs.deterministic_analysis import (
+    compute_income_calculations,
+    compute_debt_calculations,
+    compute_collateral_calculations,
+    compute_risk_calculations,
+    build_financial_summary,
+    build_income_analysis,
+    build_debt_analysis,
+    build_collateral_evaluation,
+    build_risk_assessment,
+    build_knockout_decline,
+    PRE_SCREEN_NOTE,
+)
+from config.settings import settings
+from config.logging_config import get_logger
+from monitoring.metrics import track_node_duration, pre_screen_total, pre_screen_rule_failures
+
+logger = get_logger(__name__)
+
+
+@track_node_duration("pre_screen")
+async def pre_screen(state: CreditAssessmentState) -> Dict[str, Any]:
+    """Node: Evaluate the knock-out rules"""
+    if not settings.pre_screen_enabled:
+        return {"pre_screen": {"passed": True, "failures": [], "metrics": {}}}
+
+    metrics = compute_knockout_metrics(state["application"])
+    failures = evaluate_knockout_rules(metrics)
+
+    pre_screen_total.labels(outcome="declined" if failures else "passed").inc()
+    for failure in failures:
+        pre_screen_rule_failures.labels(rule=failure["rule_id"]).inc()
+    if failures:
+        logger.info(
+            f"[{state['application_id']}] Pre-screen decline: "
+            f"{', '.join(f['rule_id'] for f in failures)}"
+        )
+
+    return {
+        "pre_screen": {"passed": not failures, "failures": failures, "metrics": metrics},
+        "current_stage": "pre_screened",
+        "progress": 5
+    }
+
+
+def route_after_pre_screen(state: CreditAssessmentState) -> str:
+    """Conditional edge: full analysis for passing applications, decline report otherwise"""
+    if state["pre_screen"]["passed"]:
+        return "collect_financial_data"
+    return "write_decline_report"
+
+
+@track_node_duration("write_decline_report")
+async def write_decline_report(state: CreditAssessmentState) -> Dict[str, Any]:
+    """Node: Templated report sections and knock-out decline (no LLM calls)"""
+    app = state["application"]
+    income_calcs = compute_income_calculations(app)
+    debt_calcs = compute_debt_calculations(app)
+    collateral_calcs = compute_collateral_calculations(app)
+    risk_calcs = compute_risk_calculations(app, income_calcs, debt_calcs, collateral_calcs)
+
+    decision = build_knockout_decline(state["pre_screen"]["failures"])
+
+    return {
+        "financial_summary": build_financial_summary(app).model_dump(),
+        "income_analysis": {
+            **build_income_analysis(income_calcs, note=PRE_SCREEN_NOTE).model_dump(),
+            "calculations": income_calcs
+        },
+        "debt_analysis": {**build_debt_analysis(debt_calcs).model_dump(), "calculations": debt_calcs},
+        "collateral_evaluation": {
+            **build_collateral_evaluation(collateral_calcs).model_dump(),
+            "calculations": collateral_calcs
+        },
+        "risk_assessment": {
+            **build_risk_assessment(app, risk_calcs, income_calcs, debt_calcs, collateral_calcs).model_dump(),
+            "calculations": risk_calcs
+        },
+        "credit_decision": decision.model_dump(),
+        "current_stage": "decision_complete",
+        "progress": 100,
+        "messages": [AIMessage(content=f"Pre-screen decline: {'; '.join(decision.decline_reasons)}")]
+    }
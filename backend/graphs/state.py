@@ -0,0 +1,42 @@
+"""
+Credit Assessment Workflow State
+Shared state schema for the full and fast-mode assessment graphs
+"""
+
+import operator
+from datetime import date, datetime, timezone
+from typing import TypedDict, Annotated, Optional, Dict, Any, List
+from langgraph.graph.message import add_messages
+
+
+class CreditAssessmentState(TypedDict):
+    """State schema for the credit assessment workflow"""
+    application: Dict[str, Any]
+    application_id: str
+    include_detailed_report: bool # Build the narrative sections (summary, analysis, recommendations)
+
+    pre_screen: Optional[Dict[str, Any]] # Knock-out rule outcome: passed, failures, metrics
+    financial_summary: Optional[Dict[str, Any]]
+    income_analysis: Optional[Dict[str, Any]]
+    debt_analysis: Optional[Dict[str, Any]]
+    collateral_evaluation: Optional[Dict[str, Any]]
+    risk_assessment: Optional[Dict[str, Any]]
+    credit_decision: Optional[Dict[str, Any]]
+
+    current_stage: str
+    progress: int
+    errors: List[str]
+    start_time: float # Epoch seconds
+    degraded_sections: Annotated[List[str], operator.add] # Sections built from calculations after a timeout
+
+    messages: Annotated[List[Any], add_messages] # LangGraph message accumulator (reducer)
+
+
+def assessment_date(state: CreditAssessmentState) -> date:
+    """
+    UTC date the assessment started.
+
+    Kept in the checkpointed state, so a resumed run dates its loan terms
+    like the original one did.
+    """
+    return datetime.fromtimestamp(state["start_time"], tz=timezone.utc).date()
@@ -6,15 +6,38 @@ from .metrics import (
     workflow_active,
     node_duration,
     node_total,
+    node_degradations,
     llm_tokens,
     llm_calls,
     llm_latency,
+    job_queue_depth,
+    job_oldest_queued_age,
+    job_wait,
+    job_total,
+    assessment_coalescing,
+    admission_waiting,
+    admission_rejections,
+    response_compression_bytes,
+    pre_screen_total,
+    pre_screen_rule_failures,
+    llm_cache_hits,
+    llm_cache_misses,
+    llm_cache_evictions,
+    llm_scheduler_queue_depth,
+    llm_scheduler_wait,
+    http_pool_in_flight,
+    http_pool_connections_open,
+    http_pool_utilization,
     errors_total,
+    track_workflow,
     track_workflow_duration,
     track_node_duration,
     track_llm_call,
     record_tokens,
     record_error,
+    multiprocess_enabled,
+    render_metrics,
+    mark_process_dead,
 )
 
 __all__ = [
@@ -23,13 +46,36 @@ __all__ = [
     "workflow_active",
     "node_duration",
     "node_total",
+    "node_degradations",
     "llm_tokens",
     "llm_calls",
     "llm_latency",
+    "job_queue_depth",
+    "job_oldest_queued_age",
+    "job_wait",
+    "job_total",
+    "assessment_coalescing",
+    "admission_waiting",
+    "admission_rejections",
+    "response_compression_bytes",
+    "pre_screen_total",
+    "pre_screen_rule_failures",
+    "llm_cache_hits",
+    "llm_cache_misses",
+    "llm_cache_evictions",
+    "llm_scheduler_queue_depth",
+    "llm_scheduler_wait",
+    "http_pool_in_flight",
+    "http_pool_connections_open",
+    "http_pool_utilization",
     "errors_total",
+    "track_workflow",
     "track_workflow_duration",
     "track_node_duration",
     "track_llm_call",
     "record_tokens",
     "record_error",
+    "multiprocess_enabled",
+    "render_metrics",
+    "mark_process_dead",
 ]
@@ -4,14 +4,26 @@ Prometheus metrics for monitoring credit assessment workflow performance.
 This module defines metrics for tracking:
 - Workflow execution duration
 - Individual node execution duration
+- Node deadline degradations
 - LLM token usage
+- Pre-screen knock-out declines
+- Asynchronous job queue depth and job age
+- LLM response cache efficiency
+- LLM rate limit queueing
+- Shared HTTP connection pool utilisation
 - Error rates
+
+With several worker processes (PROMETHEUS_MULTIPROC_DIR set before this module
+is imported, see app/server.py) values are kept in shared files and
+render_metrics() aggregates all workers; gauges declare how they combine.
 """
 
-from prometheus_client import Counter, Histogram, Gauge
+from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, generate_latest, multiprocess
+import os
 import time
+from contextlib import asynccontextmanager
 from functools import wraps
-from typing import Callable, Any
+from typing import Callable, Any, AsyncIterator, Optional
 import asyncio
 
 # Workflow-level metrics
@@ -29,7 +41,8 @@ workflow_total = Counter(
 
 workflow_active = Gauge(
     'workflow_active',
-    'Number of currently active workflows'
+    'Number of currently active workflows',
+    multiprocess_mode='livesum'
 )
 
 # Node-level metrics
@@ -46,6 +59,12 @@ node_total = Counter(
     ['node_name', 'status']
 )
 
+node_degradations = Counter(
+    'node_degradations_total',
+    'Total nodes that hit their deadline and fell back to deterministic output',
+    ['node_name', 'reason']  # reason: node_timeout, workflow_deadline
+)
+
 # LLM metrics
 llm_tokens = Counter(
     'llm_tokens_total',
@@ -66,6 +85,129 @@ llm_latency = Histogram(
     buckets=(0.5, 1, 2, 3, 4, 5, 7, 10)
 )
 
+# Job queue metrics
+job_queue_depth = Gauge(
+    'job_queue_depth',
+    'Number of assessment jobs waiting for a worker',
+    multiprocess_mode='mostrecent'
+)
+
+job_oldest_queued_age = Gauge(
+    'job_oldest_queued_age_seconds',
+    'Age of the oldest assessment job still waiting for a worker',
+    multiprocess_mode='mostrecent'
+)
+
+job_wait = Histogram(
+    'job_wait_seconds',
+    'Time assessment jobs waited in the queue before a worker picked them up',
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600)
+)
+
+job_total = Counter(
+    'job_total',
+    'Total finished assessment jobs',
+    ['status']  # completed, failed
+)
+
+# Response compression metrics
+response_compression_bytes = Counter(
+    'response_compression_bytes_total',
+    'Response body bytes before and after compression',
+    ['encoding', 'stage']  # encoding: br, gzip; stage: uncompressed, compressed
+)
+
+# Admission control metrics
+admission_waiting = Gauge(
+    'admission_waiting',
+    'Requests waiting for a workflow slot',
+    multiprocess_mode='livesum'
+)
+
+admission_rejections = Counter(
+    'admission_rejections_total',
+    'Requests rejected with 429 by admission control',
+    ['endpoint', 'reason']  # reason: queue_full, queue_timeout
+)
+
+# Request coalescing metrics
+assessment_coalescing = Counter(
+    'assessment_coalescing_total',
+    'Assessment requests by coalescing outcome',
+    ['outcome']  # executed, joined_in_flight, recent_result
+)
+
+# Pre-screen metrics
+pre_screen_total = Counter(
+    'pre_screen_total',
+    'Total pre-screen evaluations',
+    ['outcome']  # passed, declined
+)
+
+pre_screen_rule_failures = Counter(
+    'pre_screen_rule_failures_total',
+    'Total knock-out rule failures at pre-screen',
+    ['rule']
+)
+
+# LLM response cache metrics
+llm_cache_hits = Counter(
+    'llm_cache_hits_total',
+    'Total LLM response cache hits',
+    ['agent', 'tier']  # tier: memory, sqlite
+)
+
+llm_cache_misses = Counter(
+    'llm_cache_misses_total',
+    'Total LLM response cache misses',
+    ['agent']
+)
+
+llm_cache_evictions = Counter(
+    'llm_cache_evictions_total',
+    'Total LLM response cache evictions',
+    ['tier', 'reason']  # reason: capacity, expired
+)
+
+# LLM request scheduler metrics
+llm_scheduler_queue_depth = Gauge(
+    'llm_scheduler_queue_depth',
+    'Number of LLM calls waiting for rate limit capacity',
+    multiprocess_mode='livesum'
+)
+
+llm_scheduler_wait = Histogram(
+    'llm_scheduler_wait_seconds',
+    'Time LLM calls waited in the rate limit queue',
+    ['agent'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60)
+)
+
+llm_retries = Counter(
+    'llm_retries_total',
+    'Total LLM calls retried through the rate limit scheduler after a transient error',
+    ['agent']
+)
+
+# Shared HTTP client pool metrics
+http_pool_in_flight = Gauge(
+    'http_pool_requests_in_flight',
+    'Number of LLM provider requests in flight (request concurrency; HTTP/2 requests share connections)',
+    multiprocess_mode='livesum'
+)
+
+http_pool_connections_open = Gauge(
+    'http_pool_connections_open',
+    'Number of LLM provider connections open in the shared pool',
+    multiprocess_mode='livesum'
+)
+
+http_pool_utilization = Gauge(
+    'http_pool_utilization_ratio',
+    'Open LLM provider connections as a fraction of http_pool_max_connections',
+    multiprocess_mode='livemax'
+)
+
 # Error metrics
 errors_total = Counter(
     'errors_total',
@@ -74,29 +216,35 @@ errors_total = Counter(
 )
 
 
+@asynccontextmanager
+async def track_workflow() -> AsyncIterator[None]:
+    """Context manager to track a workflow execution (usable around async generators)."""
+    workflow_active.inc()
+    start_time = time.time()
+    status = 'success'
+    
+    try:
+        yield
+    except Exception as e:
+        status = 'error'
+        errors_total.labels(
+            error_type=type(e).__name__,
+            component='workflow'
+        ).inc()
+        raise
+    finally:
+        duration = time.time() - start_time
+        workflow_duration.observe(duration)
+        workflow_total.labels(status=status).inc()
+        workflow_active.dec()
+
+
 def track_workflow_duration(func: Callable) -> Callable:
     """Decorator to track workflow execution duration."""
     @wraps(func)
     async def wrapper(*args, **kwargs) -> Any:
-        workflow_active.inc()
-        start_time = time.time()
-        status = 'success'
-        
-        try:
-            result = await func(*args, **kwargs)
-            return result
-        except Exception as e:
-            status = 'error'
-            errors_total.labels(
-                error_type=type(e).__name__,
-                component='workflow'
-            ).inc()
-            raise
-        finally:
-            duration = time.time() - start_time
-            workflow_duration.observe(duration)
-            workflow_total.labels(status=status).inc()
-            workflow_active.dec()
+        async with track_workflow():
+            return await func(*args, **kwargs)
     
     return wrapper
 
@@ -175,3 +323,23 @@ def record_tokens(agent_name: str, input_tokens: int, output_tokens: int):
 def record_error(error_type: str, component: str):
     """Manually record an error."""
     errors_total.labels(error_type=error_type, component=component).inc()
+
+
+def multiprocess_enabled() -> bool:
+    """Whether metrics are shared between worker processes"""
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> bytes:
+    """Prometheus exposition for this process, or for all workers in multiprocess mode."""
+    if not multiprocess_enabled():
+        return generate_latest()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_process_dead(pid: Optional[int] = None):
+    """Drop a stopped worker's live gauges (no-op outside multiprocess mode)."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid or os.getpid())
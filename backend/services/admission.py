@@ -0,0 +1,145 @@
+"""
+Admission Control
+Caps concurrently running assessment workflows and sheds excess load.
+
+Up to settings.max_concurrent_workflows requests run at once; the next
+settings.admission_queue_size wait (FIFO) for a slot for at most
+settings.admission_queue_timeout_seconds. Anything beyond that is rejected
+with WorkflowOverloadedError, which the API turns into 429 Too Many Requests
+with a Retry-After derived from how long recent requests held their slots.
+"""
+
+import asyncio
+import math
+import time
+from functools import lru_cache
+from typing import Optional
+
+from config.settings import settings
+from config.logging_config import get_logger
+from monitoring.metrics import admission_waiting, admission_rejections
+
+logger = get_logger(__name__)
+
+# Bounds on the Retry-After hint (seconds)
+MIN_RETRY_AFTER_SECONDS = 1
+MAX_RETRY_AFTER_SECONDS = 300
+
+# Weight of the latest slot hold time in the moving average behind Retry-After
+HOLD_TIME_SMOOTHING = 0.1
+
+
+class WorkflowOverloadedError(RuntimeError):
+    """No workflow slot is available; retry after retry_after seconds"""
+
+    def __init__(self, retry_after: int, reason: str):
+        super().__init__(f"Too many concurrent assessments ({reason})")
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class AdmissionTicket:
+    """A held workflow slot; release() is idempotent"""
+
+    def __init__(self, controller: "AdmissionController"):
+        self._controller = controller
+        self._acquired_at = time.monotonic()
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._controller._record_hold_time(time.monotonic() - self._acquired_at)
+            self._controller._semaphore.release()
+
+
+class AdmissionController:
+    """
+    Semaphore of workflow slots with a bounded FIFO wait queue.
+    """
+
+    def __init__(self, max_concurrent: int, queue_size: int, queue_timeout: float):
+        self.max_concurrent = max_concurrent
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+        self._mean_hold_time: Optional[float] = None
+
+    @property
+    def mean_hold_time(self) -> Optional[float]:
+        """Moving average of how long released tickets held their slot, or None before the first release"""
+        return self._mean_hold_time
+
+    def _record_hold_time(self, seconds: float) -> None:
+        if self._mean_hold_time is None:
+            self._mean_hold_time = seconds
+        else:
+            self._mean_hold_time += HOLD_TIME_SMOOTHING * (seconds - self._mean_hold_time)
+
+    def retry_after(self) -> int:
+        """
+        Seconds until a slot is likely to free up for a new request.
+
+        Every max_concurrent released slots admit that many waiters, so the
+        estimate is one mean slot hold time per "round" ahead in the queue.
+        The mean only covers requests that held a slot and follows recent
+        ones, so it tracks the current mix of work competing for slots.
+        """
+        duration = self._mean_hold_time or settings.admission_default_retry_after_seconds
+        rounds = (self._waiting + 1) / self.max_concurrent
+        return max(MIN_RETRY_AFTER_SECONDS, min(MAX_RETRY_AFTER_SECONDS, math.ceil(duration * rounds)))
+
+    def _reject(self, endpoint: str, reason: str) -> WorkflowOverloadedError:
+        admission_rejections.labels(endpoint=endpoint, reason=reason).inc()
+        error = WorkflowOverloadedError(self.retry_after(), reason)
+        logger.warning(f"Rejected {endpoint} request: {error} - retry after {error.retry_after}s")
+        return error
+
+    async def acquire(self, endpoint: str) -> AdmissionTicket:
+        """
+        Take a workflow slot, waiting in the queue if all slots are busy.
+
+        Args:
+            endpoint: Endpoint label for the rejection metric
+
+        Returns:
+            Ticket to release when the workflow has finished
+
+        Raises:
+            WorkflowOverloadedError: If the wait queue is full or the wait timed out
+        """
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return AdmissionTicket(self)
+
+        if self._waiting >= self.queue_size:
+            raise self._reject(endpoint, "queue_full")
+
+        self._waiting += 1
+        admission_waiting.inc()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise self._reject(endpoint, "queue_timeout")
+        finally:
+            self._waiting -= 1
+            admission_waiting.dec()
+        return AdmissionTicket(self)
+
+
+@lru_cache()
+def get_admission_controller() -> Optional[AdmissionController]:
+    """
+    Get the process-wide admission controller configured from settings.
+
+    Returns:
+        Shared controller, or None if admission control is disabled
+    """
+    if not settings.admission_control_enabled:
+        return None
+    return AdmissionController(
+        max_concurrent=settings.max_concurrent_workflows,
+        queue_size=settings.admission_queue_size,
+        queue_timeout=settings.admission_queue_timeout_seconds
+    )
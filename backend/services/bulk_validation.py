@@ -0,0 +1,207 @@
+"""
+Bulk Validation
+Columnar, vectorized version of CreditAssessmentService.validate_application.
+
+Applications are turned into one NumPy array per checked field and every rule
+is evaluated for all rows at once; only the rows a rule flags are touched in
+Python to attach its message, and clean rows are left out of the result
+unless asked for. Messages and thresholds match the single
+application validator, so a row's issues and warnings are the same either way.
+"""
+
+import math
+from itertools import chain
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from app.models import LoanApplication
+
+# Same bounds as validate_application
+MIN_CREDIT_SCORE = 300
+MAX_CREDIT_SCORE = 850
+HIGH_DTI_WARNING = 0.6
+
+# Column -> (section, field) in a LoanApplication dict
+APPLICATION_FIELDS = {
+    "requested_amount": ("loan_request", "requested_amount"),
+    "requested_term_months": ("loan_request", "requested_term_months"),
+    "monthly_gross_income": ("employment", "monthly_gross_income"),
+    "monthly_net_income": ("employment", "monthly_net_income"),
+    "credit_score": ("credit_history", "credit_score"),
+    "bankruptcies": ("credit_history", "bankruptcies"),
+    "delinquencies_90_days": ("credit_history", "delinquencies_90_days"),
+}
+
+# Column order of _row_values
+ROW_COLUMNS = tuple(APPLICATION_FIELDS) + ("existing_debt_payments",)
+
+# Columns without which a row cannot be validated
+REQUIRED_COLUMNS = (
+    "requested_amount",
+    "requested_term_months",
+    "monthly_gross_income",
+    "monthly_net_income",
+    "credit_score",
+)
+
+
+def _number(record: Mapping[str, Any], section: str, field: str) -> float:
+    """Numeric field of a nested application dict, NaN if missing or not numeric"""
+    try:
+        value = record[section][field]
+        return float(value) if value is not None else math.nan
+    except (KeyError, TypeError, ValueError):
+        return math.nan
+
+
+def _debt_payments(record: Mapping[str, Any]) -> float:
+    """Total monthly payment on existing debts, NaN if malformed"""
+    try:
+        return float(sum(debt.get("monthly_payment") or 0 for debt in record.get("existing_debts") or ()))
+    except (AttributeError, TypeError, ValueError):
+        return math.nan
+
+
+def _row_values(record: Mapping[str, Any]) -> Tuple[float, ...]:
+    """Checked fields of one application dict, in ROW_COLUMNS order (NaN where missing)"""
+    try:
+        # Fast path for well-formed rows: one function call per row
+        loan, employment, history = record["loan_request"], record["employment"], record["credit_history"]
+        debt_payments = 0.0
+        for debt in record.get("existing_debts") or ():
+            debt_payments += debt["monthly_payment"]
+        return (
+            float(loan["requested_amount"]),
+            float(loan["requested_term_months"]),
+            float(employment["monthly_gross_income"]),
+            float(employment["monthly_net_income"]),
+            float(history["credit_score"]),
+            float(history.get("bankruptcies", 0)),
+            float(history.get("delinquencies_90_days", 0)),
+            float(debt_payments),
+        )
+    except (KeyError, TypeError, ValueError, AttributeError):
+        # Malformed row: resolve field by field so only the bad values become NaN
+        return tuple(
+            _number(record, section, field) for section, field in APPLICATION_FIELDS.values()
+        ) + (_debt_payments(record),)
+
+
+def applications_to_columns(
+    applications: Sequence[Union[Mapping[str, Any], LoanApplication]]
+) -> Dict[str, Any]:
+    """
+    Extract the validated fields of row-oriented applications into columns.
+
+    Args:
+        applications: Application dicts (LoanApplication JSON shape) or models
+
+    Returns:
+        Column name -> float64 array (NaN where missing), plus an application_id list
+    """
+    records = [
+        application.model_dump() if isinstance(application, LoanApplication) else application
+        for application in applications
+    ]
+    # Streamed through fromiter so no per-row tuples stay alive (keeps the cyclic GC quiet)
+    values = np.fromiter(
+        chain.from_iterable(map(_row_values, records)),
+        dtype=np.float64,
+        count=len(records) * len(ROW_COLUMNS)
+    ).reshape(len(records), len(ROW_COLUMNS))
+    columns: Dict[str, Any] = {column: values[:, position] for position, column in enumerate(ROW_COLUMNS)}
+    columns["application_id"] = [record.get("application_id") for record in records]
+    return columns
+
+
+def _as_array(values: Optional[Sequence[Optional[float]]], n: int, default: float) -> np.ndarray:
+    """Float column with None as NaN; a missing optional column is filled with default"""
+    if values is None:
+        return np.full(n, default, dtype=np.float64)
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    return np.array(values, dtype=np.float64)  # None becomes NaN
+
+
+def validate_columns(columns: Mapping[str, Any], include_clean: bool = False) -> List[Dict[str, Any]]:
+    """
+    Validate column-oriented applications.
+
+    Args:
+        columns: Column name -> sequence or array (see ApplicationColumns);
+            existing_debt_payments, bankruptcies and delinquencies_90_days
+            default to 0 when absent
+        include_clean: Also return rows without issues or warnings
+
+    Returns:
+        {index, application_id, valid, issues, warnings} per flagged row (per row with include_clean)
+    """
+    n = len(columns["requested_amount"])
+    required = {column: _as_array(columns[column], n, math.nan) for column in REQUIRED_COLUMNS}
+    amount, term, gross, net, score = (required[column] for column in REQUIRED_COLUMNS)
+    debt = _as_array(columns.get("existing_debt_payments"), n, 0.0)
+    bankruptcies = _as_array(columns.get("bankruptcies"), n, 0.0)
+    delinquencies = _as_array(columns.get("delinquencies_90_days"), n, 0.0)
+
+    dti = np.divide(debt, gross, out=np.zeros(n), where=gross > 0)
+
+    # Comparisons with NaN are False, so missing values only raise the "missing" issue
+    issue_checks = [
+        (np.isnan(values), f"Missing or non-numeric {column}")
+        for column, values in required.items()
+    ] + [
+        (amount <= 0, "Requested amount must be positive"),
+        (term <= 0, "Requested term must be positive"),
+        (net > gross, "Net income cannot exceed gross income"),
+        ((score < MIN_CREDIT_SCORE) | (score > MAX_CREDIT_SCORE),
+         f"Credit score must be between {MIN_CREDIT_SCORE} and {MAX_CREDIT_SCORE}"),
+    ]
+    high_dti = dti > HIGH_DTI_WARNING
+    # Order matches validate_application: DTI first, then history flags
+    warning_checks = [
+        (bankruptcies > 0, "Applicant has bankruptcy history"),
+        (delinquencies > 0, "Applicant has 90+ day delinquencies"),
+    ]
+
+    # Python only touches the rows some rule flagged
+    issues: Dict[int, List[str]] = {}
+    warnings: Dict[int, List[str]] = {}
+    for mask, message in issue_checks:
+        for row in np.flatnonzero(mask).tolist():
+            issues.setdefault(row, []).append(message)
+    for row in np.flatnonzero(high_dti).tolist():
+        warnings.setdefault(row, []).append(f"High existing DTI ratio: {dti[row]:.1%}")
+    for mask, message in warning_checks:
+        for row in np.flatnonzero(mask).tolist():
+            warnings.setdefault(row, []).append(message)
+
+    rows = range(n) if include_clean else sorted(issues.keys() | warnings.keys())
+    application_ids = columns.get("application_id")
+    return [
+        {
+            "index": row,
+            "application_id": application_ids[row] if application_ids is not None else None,
+            "valid": row not in issues,
+            "issues": issues.get(row, []),
+            "warnings": warnings.get(row, []),
+        }
+        for row in rows
+    ]
+
+
+def validate_applications_bulk(
+    applications: Sequence[Union[Mapping[str, Any], LoanApplication]],
+    include_clean: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Validate many row-oriented applications at once.
+
+    Args:
+        applications: Application dicts (LoanApplication JSON shape) or models
+        include_clean: Also return rows without issues or warnings
+
+    Returns:
+        {index, application_id, valid, issues, warnings} per flagged row (per row with include_clean)
+    """
+    return validate_columns(applications_to_columns(applications), include_clean=include_clean)
@@ -3,24 +3,54 @@ Credit Assessment Service
 Business logic layer for credit risk assessment operations
 """
 
+import asyncio
 import uuid
 import os
 from datetime import datetime
-from typing import Optional, AsyncGenerator, Dict, Any
+from typing import Optional, AsyncGenerator, Awaitable, Callable, Dict, Any
 
 from graphs.credit_assessment_graph import CreditAssessmentGraph
+from graphs.checkpointing import CheckpointNotFoundError
 from app.models import (
     LoanApplication,
     CreditAssessmentReport,
     AssessmentRequest,
     AssessmentResponse,
+    BatchAssessmentRequest,
+    BatchAssessmentResult,
     ProgressUpdate
 )
+from services.admission import get_admission_controller
+from services.report_store import get_report_store
+from services.request_coalescer import get_request_coalescer, canonical_request_key
 from config.settings import settings
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Streamed workflow nodes: node name -> (status message, state key holding its output)
+STREAMED_NODES = {
+    "pre_screen": ("Pre-screen rules evaluated", "pre_screen"),
+    "collect_financial_data": ("Financial data collected", "financial_summary"),
+    "analyze_income": ("Income analyzed", "income_analysis"),
+    "analyze_debt": ("Debt analyzed", "debt_analysis"),
+    "evaluate_collateral": ("Collateral evaluated", "collateral_evaluation"),
+    "calculate_risk": ("Risk calculated", "risk_assessment"),
+    "write_decision": ("Credit decision written", "credit_decision"),
+    "write_decline_report": ("Knock-out decline report written", "credit_decision"),
+}
+
+# Nodes on the full path (write_decline_report replaces every node after pre_screen)
+FULL_PATH_NODE_COUNT = len(STREAMED_NODES) - 1
+
+# Receives the workflow progress (%) after every completed node
+ProgressCallback = Callable[[int], Awaitable[None]]
+
+
+def node_progress(completed_nodes: int) -> int:
+    """Progress (%) after the given number of streamed nodes, capped below 100 until the report is assembled"""
+    return min(95, completed_nodes * 100 // FULL_PATH_NODE_COUNT)
+
 
 class CreditAssessmentService:
     """
@@ -55,17 +85,73 @@ class CreditAssessmentService:
     
     async def assess_credit_risk(
         self,
-        request: AssessmentRequest
+        request: AssessmentRequest,
+        idempotency_key: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        admission_endpoint: Optional[str] = None
     ) -> AssessmentResponse:
         """
         Perform complete credit risk assessment.
         
+        Identical requests (same request content, and the same Idempotency-Key if
+        one is given) share one in-flight workflow, and a successful result is
+        replayed for duplicates arriving within settings.idempotency_ttl_seconds.
+        A key reused with a different request never gets the other request's result.
+        
         Args:
             request: Assessment request containing loan application
+            idempotency_key: Optional client-supplied Idempotency-Key
+            on_progress: Awaited with the progress (%) after every completed
+                node, if this call runs the workflow itself (not when it joins
+                an identical in-flight one or is replayed)
+            admission_endpoint: Take a slot from the admission controller
+                (labelled with this endpoint) before running the workflow.
+                Only the call that runs it takes a slot; duplicates that join
+                it or get a recent result do not
             
         Returns:
             Assessment response with report or error
+            
+        Raises:
+            WorkflowOverloadedError: If admission is requested and no slot is available
         """
+        coalescer = get_request_coalescer()
+        if coalescer is None:
+            return await self._admitted(admission_endpoint, request, on_progress)
+        
+        # Keyed before an application_id is assigned, so retries without one still match.
+        # The content hash is part of every key: a reused or colliding Idempotency-Key
+        # with another application must not replay that application's report.
+        request_hash = canonical_request_key(request)
+        key = f"key:{idempotency_key}:{request_hash}" if idempotency_key else f"hash:{request_hash}"
+        return await coalescer.run(
+            key,
+            lambda: self._admitted(admission_endpoint, request, on_progress),
+            should_store=lambda response: response.success
+        )
+    
+    async def _admitted(
+        self,
+        admission_endpoint: Optional[str],
+        request: AssessmentRequest,
+        on_progress: Optional[ProgressCallback]
+    ) -> AssessmentResponse:
+        """Run the workflow holding an admission slot (if an endpoint is given and admission is enabled)"""
+        controller = get_admission_controller() if admission_endpoint else None
+        if controller is None:
+            return await self._assess_credit_risk(request, on_progress)
+        ticket = await controller.acquire(admission_endpoint)
+        try:
+            return await self._assess_credit_risk(request, on_progress)
+        finally:
+            ticket.release()
+    
+    async def _assess_credit_risk(
+        self,
+        request: AssessmentRequest,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> AssessmentResponse:
+        """Run the assessment workflow for one request (no de-duplication)"""
         start_time = datetime.utcnow()
         trace_id = self._generate_trace_id()
         
@@ -76,10 +162,16 @@ class CreditAssessmentService:
             if not application.application_id:
                 application.application_id = str(uuid.uuid4())
             
-            report = await self.graph.run(
-                application=application,
-                trace_id=trace_id
-            )
+            if on_progress is None:
+                report = await self.graph.run(
+                    application=application,
+                    trace_id=trace_id,
+                    fast_mode=request.fast_mode,
+                    include_detailed_report=request.include_detailed_report
+                )
+            else:
+                report = await self._run_with_progress(request, trace_id, on_progress)
+            await self._persist_report(report)
             
             processing_time = (datetime.utcnow() - start_time).total_seconds()
             
@@ -108,6 +200,167 @@ class CreditAssessmentService:
                 trace_url=self._get_trace_url(trace_id)
             )
     
+    async def _run_with_progress(
+        self,
+        request: AssessmentRequest,
+        trace_id: str,
+        on_progress: ProgressCallback
+    ) -> CreditAssessmentReport:
+        """Stream the workflow, reporting progress after every completed node"""
+        report = None
+        completed_nodes = 0
+        async for node_name, update in self.graph.stream(
+            application=request.application,
+            trace_id=trace_id,
+            fast_mode=request.fast_mode,
+            include_detailed_report=request.include_detailed_report
+        ):
+            if node_name == "report":
+                report = update
+            elif node_name in STREAMED_NODES:
+                completed_nodes += 1
+                await on_progress(node_progress(completed_nodes))
+        return report
+    
+    async def assess_credit_risk_batch(
+        self,
+        batch: BatchAssessmentRequest
+    ) -> AsyncGenerator[BatchAssessmentResult, None]:
+        """
+        Assess many applications with bounded concurrency.
+        
+        A fixed pool of workers pulls applications one at a time, and finished
+        results pass through a queue bounded to the pool size, so at most
+        `concurrency` assessments are in flight or waiting to be sent.
+        
+        Args:
+            batch: Batch request (applications and shared options)
+            
+        Yields:
+            One result per application, in completion order
+        """
+        concurrency = min(
+            batch.concurrency or settings.batch_concurrency,
+            settings.batch_max_concurrency,
+            len(batch.applications)
+        )
+        logger.info(f"Starting batch assessment of {len(batch.applications)} applications (concurrency {concurrency})")
+        
+        pending = iter(enumerate(batch.applications))
+        results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        
+        async def assess(index: int, application: LoanApplication) -> BatchAssessmentResult:
+            if not application.application_id:
+                application.application_id = str(uuid.uuid4())
+            
+            validation = self.validate_application(application)
+            if validation["valid"]:
+                response = await self.assess_credit_risk(AssessmentRequest(
+                    application=application,
+                    fast_mode=batch.fast_mode,
+                    include_detailed_report=batch.include_detailed_report
+                ))
+            else:
+                response = AssessmentResponse(
+                    success=False,
+                    error=f"Invalid application: {'; '.join(validation['issues'])}",
+                    processing_time_seconds=0.0
+                )
+            
+            return BatchAssessmentResult.model_construct(
+                index=index,
+                application_id=application.application_id,
+                **dict(response)
+            )
+        
+        async def worker():
+            # Workers share one iterator, so each application is taken exactly once
+            for index, application in pending:
+                try:
+                    result = await assess(index, application)
+                except Exception as e:
+                    logger.error(f"Batch item {index} failed: {str(e)}", exc_info=True)
+                    result = BatchAssessmentResult(
+                        index=index,
+                        application_id=application.application_id or "",
+                        success=False,
+                        error=str(e),
+                        processing_time_seconds=0.0
+                    )
+                await results.put(result)
+        
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        
+        try:
+            for _ in range(len(batch.applications)):
+                yield await results.get()
+        finally:
+            # Client disconnected or batch finished: stop remaining assessments
+            for task in workers:
+                task.cancel()
+    
+    async def resume_assessment(self, application_id: str) -> AssessmentResponse:
+        """
+        Resume a checkpointed assessment, re-running only its unfinished nodes.
+        
+        Args:
+            application_id: Application whose earlier run failed part-way
+            
+        Returns:
+            Assessment response with report or error
+            
+        Raises:
+            CheckpointNotFoundError: If no checkpoint exists for the application
+        """
+        start_time = datetime.utcnow()
+        trace_id = self._generate_trace_id()
+        
+        logger.info(f"Resuming credit assessment {application_id} - trace_id: {trace_id}")
+        
+        try:
+            report = await self.graph.resume(application_id, trace_id=trace_id)
+            await self._persist_report(report)
+            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            
+            return AssessmentResponse(
+                success=True,
+                report=report,
+                processing_time_seconds=processing_time,
+                trace_url=self._get_trace_url(trace_id)
+            )
+            
+        except CheckpointNotFoundError:
+            raise
+        except Exception as e:
+            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            logger.error(f"Resumed credit assessment failed: {str(e)}", exc_info=True)
+            
+            return AssessmentResponse(
+                success=False,
+                error=str(e),
+                processing_time_seconds=processing_time,
+                trace_url=self._get_trace_url(trace_id)
+            )
+    
+    async def _persist_report(self, report: CreditAssessmentReport) -> None:
+        """Save a finished report to the report store (a storage failure does not fail the assessment)"""
+        store = get_report_store()
+        if store is None:
+            return
+        try:
+            await store.save(report)
+        except Exception as e:
+            logger.error(f"Failed to persist report {report.report_id}: {str(e)}", exc_info=True)
+    
+    async def warm_up(self):
+        """Open the per-process connections (checkpoint store, report store) before serving"""
+        await self.graph.warm_up()
+        await asyncio.to_thread(get_report_store)
+    
+    async def close(self):
+        """Release resources held by the workflow (checkpoint store)"""
+        await self.graph.close()
+    
     async def assess_credit_risk_streaming(
         self,
         request: AssessmentRequest
@@ -135,16 +388,41 @@ class CreditAssessmentService:
             if not application.application_id:
                 application.application_id = str(uuid.uuid4())
             
-            yield ProgressUpdate(
-                status="Collecting financial data...",
-                progress=10,
-                stage="financial_data"
-            )
+            report = None
+            completed_nodes = 0
             
-            report = await self.graph.run(
+            async for node_name, update in self.graph.stream(
                 application=application,
-                trace_id=trace_id
-            )
+                trace_id=trace_id,
+                fast_mode=request.fast_mode,
+                include_detailed_report=request.include_detailed_report
+            ):
+                if node_name == "report":
+                    report = update
+                    continue
+                if node_name not in STREAMED_NODES:
+                    continue
+                
+                completed_nodes += 1
+                status, output_key = STREAMED_NODES[node_name]
+                output = update.get(output_key) or {}
+                if node_name == "pre_screen":
+                    data = {"failures": output["failures"]} if output.get("failures") else None
+                else:
+                    data = {"calculations": output["calculations"]} if "calculations" in output else None
+                if output.get("degraded"):
+                    data = {**(data or {}), "degraded": True}
+                if update.get("errors"):
+                    data = {**(data or {}), "errors": update["errors"]}
+                
+                yield ProgressUpdate(
+                    status=status,
+                    progress=node_progress(completed_nodes),
+                    stage=node_name,
+                    data=data
+                )
+            
+            await self._persist_report(report)
             
             yield ProgressUpdate(
                 status="Assessment complete!",
@@ -0,0 +1,291 @@
+"""
+Assessment Job Queue
+Durable SQLite-backed queue drained by an in-process worker pool.
+
+POST /api/v1/jobs enqueues an AssessmentRequest and returns a job id at once;
+workers run each job through CreditAssessmentService.assess_credit_risk and
+store the AssessmentResponse with the job. A running job's progress follows
+the workflow's completed nodes (as in /assess/stream). Jobs survive restarts: anything
+still marked running when the queue starts (the process died mid-job) is put
+back in the queue. Several server processes can drain the same table (claims
+are single UPDATE statements); recovery then runs once, before they start.
+
+The sqlite3 calls block, so the async methods run them in worker threads
+(asyncio.to_thread) and never on the event loop.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
+
+from app.models import AssessmentRequest, AssessmentResponse, AssessmentJob, JobStatus
+from config.settings import settings
+from config.logging_config import get_logger
+from monitoring.metrics import job_queue_depth, job_oldest_queued_age, job_wait, job_total
+
+if TYPE_CHECKING:
+    from services.credit_assessment_service import CreditAssessmentService
+
+logger = get_logger(__name__)
+
+# Seconds an idle worker sleeps before polling again if no submit wakes it
+POLL_INTERVAL_SECONDS = 1.0
+
+
+def _to_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    """Epoch seconds (as stored) to an aware UTC datetime"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp is not None else None
+
+
+def _create_schema(db: sqlite3.Connection) -> None:
+    """Create the job table; WAL lets several server processes share it"""
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS assessment_jobs ("
+        "job_id TEXT PRIMARY KEY, application_id TEXT NOT NULL, status TEXT NOT NULL, "
+        "progress INTEGER NOT NULL, request TEXT NOT NULL, response TEXT, error TEXT, "
+        "created_at REAL NOT NULL, started_at REAL, finished_at REAL)"
+    )
+    db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_assessment_jobs_status_created "
+        "ON assessment_jobs (status, created_at)"
+    )
+    db.commit()
+
+
+class AssessmentJobQueue:
+    """
+    SQLite job table plus the asyncio workers that drain it.
+
+    One connection is shared by the threads the queries run in; _lock
+    serializes its use.
+    """
+
+    def __init__(self, service: "CreditAssessmentService", db_path: str, workers: int = 4):
+        self.service = service
+        self.workers = workers
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+        with self._lock:
+            _create_schema(self._db)
+
+    def _count_queued(self) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM assessment_jobs WHERE status = ?", (JobStatus.QUEUED.value,)
+            ).fetchone()[0]
+
+    def _oldest_queued_age(self) -> float:
+        with self._lock:
+            oldest = self._db.execute(
+                "SELECT MIN(created_at) FROM assessment_jobs WHERE status = ?", (JobStatus.QUEUED.value,)
+            ).fetchone()[0]
+        return time.time() - oldest if oldest is not None else 0.0
+
+    def _update_gauges(self) -> None:
+        job_queue_depth.set(self._count_queued())
+        job_oldest_queued_age.set(self._oldest_queued_age())
+
+    async def update_gauges(self) -> None:
+        """Refresh the queue depth and age gauges from the table (called at scrape time)"""
+        await asyncio.to_thread(self._update_gauges)
+
+    def _row_to_job(self, row: sqlite3.Row) -> AssessmentJob:
+        return AssessmentJob(
+            job_id=row["job_id"],
+            application_id=row["application_id"],
+            status=JobStatus(row["status"]),
+            progress=row["progress"],
+            created_at=_to_datetime(row["created_at"]),
+            started_at=_to_datetime(row["started_at"]),
+            finished_at=_to_datetime(row["finished_at"]),
+            error=row["error"]
+        )
+
+    async def submit(self, request: AssessmentRequest) -> AssessmentJob:
+        """
+        Enqueue an assessment.
+
+        Args:
+            request: Assessment request (an application_id is assigned if missing)
+
+        Returns:
+            The queued job
+        """
+        if not request.application.application_id:
+            request.application.application_id = str(uuid.uuid4())
+
+        job_id = str(uuid.uuid4())
+        await asyncio.to_thread(self._insert, job_id, request)
+
+        self._wakeup.set()
+        logger.info(f"Queued assessment job {job_id} for application {request.application.application_id}")
+        return await self.get(job_id)
+
+    def _insert(self, job_id: str, request: AssessmentRequest) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO assessment_jobs (job_id, application_id, status, progress, request, created_at) "
+                "VALUES (?, ?, ?, 0, ?, ?)",
+                (job_id, request.application.application_id, JobStatus.QUEUED.value,
+                 request.model_dump_json(), time.time())
+            )
+            self._db.commit()
+
+    async def get(self, job_id: str) -> Optional[AssessmentJob]:
+        """Job status, or None if the job does not exist"""
+        return await asyncio.to_thread(self._get, job_id)
+
+    def _get(self, job_id: str) -> Optional[AssessmentJob]:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM assessment_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row is not None else None
+
+    async def get_response(self, job_id: str) -> Optional[AssessmentResponse]:
+        """Stored AssessmentResponse of a finished job, or None if not finished"""
+        return await asyncio.to_thread(self._get_response, job_id)
+
+    def _get_response(self, job_id: str) -> Optional[AssessmentResponse]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response FROM assessment_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None or row["response"] is None:
+            return None
+        return AssessmentResponse.model_validate_json(row["response"])
+
+    def _claim_next(self) -> Optional[sqlite3.Row]:
+        """Atomically move the oldest queued job to running"""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "UPDATE assessment_jobs SET status = ?, progress = 0, started_at = ? "
+                "WHERE job_id = (SELECT job_id FROM assessment_jobs WHERE status = ? "
+                "ORDER BY created_at LIMIT 1) "
+                "RETURNING job_id, request, created_at",
+                (JobStatus.RUNNING.value, now, JobStatus.QUEUED.value)
+            ).fetchone()
+            self._db.commit()
+        if row is not None:
+            job_wait.observe(now - row["created_at"])
+        return row
+
+    def _set_progress(self, job_id: str, progress: int) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE assessment_jobs SET progress = ? WHERE job_id = ? AND status = ?",
+                (progress, job_id, JobStatus.RUNNING.value)
+            )
+            self._db.commit()
+
+    def _finish(self, job_id: str, response: AssessmentResponse) -> None:
+        status = JobStatus.COMPLETED if response.success else JobStatus.FAILED
+        with self._lock:
+            self._db.execute(
+                "UPDATE assessment_jobs SET status = ?, progress = 100, response = ?, error = ?, finished_at = ? "
+                "WHERE job_id = ?",
+                (status.value, response.model_dump_json(), response.error, time.time(), job_id)
+            )
+            self._db.commit()
+        job_total.labels(status=status.value).inc()
+
+    async def _worker(self, worker_id: int) -> None:
+        """Drain the queue until cancelled"""
+        while True:
+            row = await asyncio.to_thread(self._claim_next)
+            if row is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            job_id = row["job_id"]
+            logger.info(f"Worker {worker_id} running assessment job {job_id}")
+
+            async def report_progress(progress: int, job_id: str = job_id) -> None:
+                await asyncio.to_thread(self._set_progress, job_id, progress)
+
+            try:
+                request = AssessmentRequest.model_validate_json(row["request"])
+                response = await self.service.assess_credit_risk(request, on_progress=report_progress)
+            except Exception as e:
+                logger.error(f"Assessment job {job_id} failed: {str(e)}", exc_info=True)
+                response = AssessmentResponse(success=False, error=str(e), processing_time_seconds=0.0)
+            await asyncio.to_thread(self._finish, job_id, response)
+
+    def _recover(self) -> None:
+        """Requeue jobs interrupted by a restart and purge expired finished jobs"""
+        with self._lock:
+            recover_jobs(self._db)
+
+    async def start(self, recover: bool = True) -> None:
+        """
+        Start the worker pool.
+
+        Args:
+            recover: Requeue interrupted jobs first. Must be False when several
+                server processes share the table (the launcher recovers once).
+        """
+        if recover:
+            await asyncio.to_thread(self._recover)
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        logger.info(f"Job queue started with {self.workers} workers")
+
+    async def stop(self) -> None:
+        """Cancel the workers; running jobs are requeued on the next start"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+def recover_jobs(db: sqlite3.Connection) -> None:
+    """
+    Requeue jobs left running by a stopped process and purge expired finished jobs.
+
+    Only safe while no worker is running jobs from the same database.
+
+    Args:
+        db: Connection to the job database
+    """
+    _create_schema(db)
+    cutoff = time.time() - settings.job_retention_hours * 3600
+    requeued = db.execute(
+        "UPDATE assessment_jobs SET status = ?, progress = 0, started_at = NULL WHERE status = ?",
+        (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+    ).rowcount
+    purged = db.execute(
+        "DELETE FROM assessment_jobs WHERE status IN (?, ?) AND finished_at < ?",
+        (JobStatus.COMPLETED.value, JobStatus.FAILED.value, cutoff)
+    ).rowcount
+    db.commit()
+    if requeued or purged:
+        logger.info(f"Job queue recovery: {requeued} interrupted jobs requeued, {purged} expired jobs purged")
+
+
+@lru_cache()
+def get_job_queue() -> AssessmentJobQueue:
+    """
+    Get the process-wide job queue configured from settings.
+
+    Returns:
+        Shared job queue (workers start in the application lifespan)
+    """
+    from services.credit_assessment_service import credit_assessment_service
+
+    return AssessmentJobQueue(
+        service=credit_assessment_service,
+        db_path=settings.job_queue_sqlite_path,
+        workers=settings.job_queue_workers
+    )
@@ -0,0 +1,496 @@
+"""
+Portfolio Scoring
+Deterministic risk pipeline over files of loans, without the API or any LLM.
+
+score_columns is the vectorized counterpart of the compute_*_calculations
+functions used by the workflow nodes (income, debt, collateral, risk), built
+on calculations.vectorized, so each row gets the same DTI, DSCR, LTV, PD, LGD,
+expected loss and risk level as an assessment of the same application.
+
+score_file streams a CSV or Parquet file through it in fixed-size chunks.
+Chunks are scored in a process pool and written to the output file in input
+order as soon as they are done; at most two chunks per worker are in flight,
+so memory stays bounded regardless of the input size.
+
+Input columns (one row per loan):
+    monthly_gross_income, monthly_net_income, requested_amount,
+    requested_term_months, credit_score       required
+    application_id                            default: row number
+    years_employed                            default 0
+    employment_type                           default "employed"
+    additional_income                         default 0
+    existing_debt_payments                    total monthly payment on existing debts, default 0
+    collateral_type                           CollateralType value; empty = unsecured
+    collateral_value                          estimated value of the collateral
+    collateral_insurance_coverage             insured amount; empty or 0 = uninsured
+
+A blank or malformed number in a required column makes that row's dependent
+results NaN instead of failing the whole file.
+
+With stress_scenarios > 0 each row also gets the Monte Carlo affordability
+stress test of compute_income_calculations (STRESS_RESULT_COLUMNS), with the
+configured horizon and seed; rows without a loan request get NaN.
+
+Parquet input and output require the optional pyarrow package.
+"""
+
+import csv
+import re
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import chain, islice, zip_longest
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from calculations import vectorized
+from calculations.affordability_simulation import simulate_affordability_batch
+from config.runtime import available_cpus
+from config.settings import settings
+from graphs.deterministic_analysis import BASEL_RISK_WEIGHTS, COLLATERAL_CALCULATION_TYPES, RISK_LEVEL_MAPPING
+from app.models import RiskLevel
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional dependency: CSV only
+    pa = pq = None
+
+# Input column -> default (None = required)
+INPUT_COLUMNS: Dict[str, Any] = {
+    "application_id": None,
+    "monthly_gross_income": None,
+    "monthly_net_income": None,
+    "requested_amount": None,
+    "requested_term_months": None,
+    "credit_score": None,
+    "years_employed": 0.0,
+    "employment_type": "employed",
+    "additional_income": 0.0,
+    "existing_debt_payments": 0.0,
+    "collateral_type": "",
+    "collateral_value": 0.0,
+    "collateral_insurance_coverage": 0.0,
+}
+
+REQUIRED_COLUMNS = (
+    "monthly_gross_income",
+    "monthly_net_income",
+    "requested_amount",
+    "requested_term_months",
+    "credit_score",
+)
+
+RESULT_COLUMNS = (
+    "application_id",
+    "dti_ratio",
+    "projected_dti_ratio",
+    "dscr",
+    "ltv_ratio",
+    "probability_of_default",
+    "loss_given_default",
+    "expected_loss_amount",
+    "expected_loss_percentage",
+    "risk_score",
+    "risk_level",
+    "debt_burden_level",
+    "basel_risk_weight",
+)
+
+# Result column -> simulate_affordability_batch field, appended to RESULT_COLUMNS
+# when the Monte Carlo stress test is run
+STRESS_RESULT_COLUMNS: Dict[str, str] = {
+    "dti_breach_probability": "breach_probability",
+    "mean_worst_dti": "mean_worst_dti",
+    "worst_dti_p50": "worst_dti_p50",
+    "worst_dti_p95": "worst_dti_p95",
+    "peak_payment_p95": "peak_payment_p95",
+}
+
+DEFAULT_CHUNK_SIZE = 50000
+
+# Same fallbacks as compute_collateral_calculations / compute_risk_calculations for unsecured loans
+UNSECURED_LTV_RATIO = 100.0
+UNSECURED_RECOVERY_RATE = 70.0
+
+Chunk = Tuple[int, Dict[str, Sequence[Any]]]
+
+# Characters that make csv.writer quote a field
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
+
+
+# =============================================================================
+# Column parsing
+# =============================================================================
+
+def _numbers(values: Optional[Sequence[Any]], n: int, default: Optional[float]) -> np.ndarray:
+    """Float column from numbers or CSV strings; blanks become default (NaN if required)"""
+    fill = np.nan if default is None else default
+    if values is None:
+        return np.full(n, fill)
+    if isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+        return values.astype(np.float64)
+    try:
+        return np.fromiter(map(float, values), dtype=np.float64, count=n)
+    except (TypeError, ValueError):
+        # Blanks, None or malformed values: resolve value by value
+        return np.array([_to_float(value, fill) for value in values], dtype=np.float64)
+
+
+def _to_float(value: Any, fill: float) -> float:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return fill
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _strings(values: Optional[Sequence[Any]], n: int, default: str) -> np.ndarray:
+    """String column; blanks (and None) become default"""
+    if values is None or n == 0:
+        return np.full(n, default)
+    if isinstance(values, np.ndarray) and values.dtype == object:
+        values = ["" if value is None else str(value) for value in values]
+    strings = np.asarray(values, dtype=str)
+    return np.where(strings == "", default, strings)
+
+
+def _row_count(columns: Mapping[str, Sequence[Any]]) -> int:
+    return len(columns[REQUIRED_COLUMNS[0]])
+
+
+def result_columns(stress_scenarios: int = 0) -> Tuple[str, ...]:
+    """Output columns, in order, for the given stress_scenarios"""
+    return RESULT_COLUMNS + tuple(STRESS_RESULT_COLUMNS) if stress_scenarios > 0 else RESULT_COLUMNS
+
+
+# =============================================================================
+# Vectorized pipeline
+# =============================================================================
+
+def _stress_columns(
+    gross: np.ndarray,
+    monthly_debt: np.ndarray,
+    amount: np.ndarray,
+    term: np.ndarray,
+    stress_scenarios: int
+) -> Dict[str, np.ndarray]:
+    """Monte Carlo stress test columns (compute_income_calculations: 4% rate, requested loan only)"""
+    simulated = (amount > 0) & (term > 0) & np.isfinite(gross) & np.isfinite(monthly_debt)
+    records = simulate_affordability_batch(
+        gross[simulated], monthly_debt[simulated], amount[simulated], term[simulated],
+        current_interest_rate=4.0,
+        scenarios=stress_scenarios,
+        horizon_years=settings.stress_simulation_horizon_years,
+        seed=settings.stress_simulation_seed
+    )
+    results = {}
+    for column, field in STRESS_RESULT_COLUMNS.items():
+        results[column] = np.full(gross.size, np.nan)
+        results[column][simulated] = records[field]
+    return results
+
+
+def score_columns(
+    columns: Mapping[str, Sequence[Any]],
+    start: int = 0,
+    stress_scenarios: int = 0
+) -> Dict[str, np.ndarray]:
+    """
+    Run the deterministic risk pipeline for a batch of loans.
+
+    Args:
+        columns: Input column -> values (see INPUT_COLUMNS); numbers may be
+            given as strings, blanks take the column default
+        start: Row number of the first loan (default application_id)
+        stress_scenarios: Monte Carlo scenarios per loan (0 skips the stress test)
+
+    Returns:
+        Result column (result_columns(stress_scenarios)) -> array
+    """
+    n = _row_count(columns)
+    gross = _numbers(columns.get("monthly_gross_income"), n, None)
+    net = _numbers(columns.get("monthly_net_income"), n, None)
+    amount = _numbers(columns.get("requested_amount"), n, None)
+    term = _numbers(columns.get("requested_term_months"), n, None)
+    credit_score = _numbers(columns.get("credit_score"), n, None)
+    years = _numbers(columns.get("years_employed"), n, INPUT_COLUMNS["years_employed"])
+    additional_income = _numbers(columns.get("additional_income"), n, INPUT_COLUMNS["additional_income"])
+    monthly_debt = _numbers(columns.get("existing_debt_payments"), n, INPUT_COLUMNS["existing_debt_payments"])
+    collateral_value = _numbers(columns.get("collateral_value"), n, INPUT_COLUMNS["collateral_value"])
+    insurance = _numbers(columns.get("collateral_insurance_coverage"), n, INPUT_COLUMNS["collateral_insurance_coverage"])
+    employment_type = _strings(columns.get("employment_type"), n, INPUT_COLUMNS["employment_type"])
+    collateral_type = _strings(columns.get("collateral_type"), n, INPUT_COLUMNS["collateral_type"])
+
+    application_id = columns.get("application_id")
+    if application_id is None:
+        application_id = np.arange(start, start + n).astype(str)
+    else:
+        application_id = _strings(application_id, n, "")
+
+    # Income (compute_income_calculations)
+    stability_score = vectorized.calculate_income_stability_score(
+        years, employment_type, has_multiple_sources=additional_income > 0
+    )
+
+    # Debt (compute_debt_calculations)
+    estimated_payment = np.where(
+        (amount > 0) & (term > 0), vectorized.calculate_estimated_payment(amount, term), 0.0
+    )
+    dti_ratio = vectorized.calculate_dti_ratio(monthly_debt, gross)
+    projected_dti_ratio = vectorized.calculate_dti_ratio(monthly_debt + estimated_payment, gross)
+    dscr = vectorized.calculate_dscr(net, monthly_debt)
+    debt_burden = vectorized.assess_debt_burden(dti_ratio, dscr)
+
+    # Collateral (compute_collateral_calculations)
+    secured = collateral_type != ""
+    calculation_type = np.full(n, "other", dtype="U12")
+    for application_type, calculation in COLLATERAL_CALCULATION_TYPES.items():
+        calculation_type[collateral_type == application_type] = calculation
+    ltv_ratio = np.where(secured, vectorized.calculate_ltv_ratio(amount, collateral_value), UNSECURED_LTV_RATIO)
+    liquidation = vectorized.calculate_liquidation_value(collateral_value, calculation_type)
+    quality = vectorized.assess_collateral_quality(ltv_ratio, calculation_type, np.nan_to_num(insurance) != 0)
+    quality_score = np.where(secured, quality["quality_score"], 0)
+    overall_quality = np.where(secured, quality["overall_quality"], "none")
+    recovery_rate = np.where(secured, liquidation["recovery_rate"], UNSECURED_RECOVERY_RATE)
+
+    # Risk (compute_risk_calculations)
+    probability_of_default = vectorized.calculate_probability_of_default(
+        credit_score, dti_ratio, years, payment_history_score=100,
+        debt_burden_level=debt_burden["overall_debt_burden"]
+    )
+    loss_given_default = vectorized.calculate_loss_given_default(
+        ltv_ratio, overall_quality, recovery_rate=recovery_rate, has_guarantor=False
+    )
+    expected_loss = vectorized.calculate_expected_loss(amount, probability_of_default, loss_given_default)
+    risk = vectorized.calculate_risk_score(
+        probability_of_default, loss_given_default, dti_ratio, ltv_ratio, credit_score,
+        stability_score, quality_score
+    )
+
+    risk_level = np.full(n, RiskLevel.MEDIUM.value, dtype="U9")
+    basel_risk_weight = np.full(n, BASEL_RISK_WEIGHTS[RiskLevel.MEDIUM])
+    for calculated_level, level in RISK_LEVEL_MAPPING.items():
+        match = risk["overall_risk_level"] == calculated_level
+        risk_level[match] = level.value
+        basel_risk_weight[match] = BASEL_RISK_WEIGHTS[level]
+
+    results = {
+        "application_id": application_id,
+        "dti_ratio": dti_ratio,
+        "projected_dti_ratio": projected_dti_ratio,
+        "dscr": dscr,
+        "ltv_ratio": ltv_ratio,
+        "probability_of_default": probability_of_default,
+        "loss_given_default": loss_given_default,
+        "expected_loss_amount": expected_loss["expected_loss_amount"],
+        "expected_loss_percentage": expected_loss["expected_loss_percentage"],
+        "risk_score": risk["risk_score"],
+        "risk_level": risk_level,
+        "debt_burden_level": debt_burden["overall_debt_burden"],
+        "basel_risk_weight": basel_risk_weight,
+    }
+    if stress_scenarios > 0:
+        results.update(_stress_columns(gross, monthly_debt, amount, term, stress_scenarios))
+    return results
+
+
+def _csv_field(value: str) -> str:
+    """Quote a text field the way csv.writer does when needed"""
+    if _CSV_SPECIAL.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _format_csv(results: Dict[str, np.ndarray], columns: Sequence[str]) -> str:
+    """Result rows as CSV text (no header); formatted column-wise, floats as repr like csv.writer"""
+    fields = []
+    for name in columns:
+        values = results[name].tolist()
+        if results[name].dtype.kind != "U":
+            values = list(map(repr, values))
+        elif _CSV_SPECIAL.search("".join(values)):
+            values = list(map(_csv_field, values))
+        fields.append(values)
+    return "".join(",".join(row) + "\n" for row in zip(*fields))
+
+
+def score_chunk(
+    chunk: Chunk,
+    output_format: str,
+    stress_scenarios: int = 0
+) -> Tuple[int, Union[str, Dict[str, np.ndarray]]]:
+    """
+    Score one chunk (runs in a pool worker).
+
+    Args:
+        chunk: (row number of the first row, input columns)
+        output_format: "csv" to return CSV text, "parquet" to return the result columns
+        stress_scenarios: Monte Carlo scenarios per loan (0 skips the stress test)
+
+    Returns:
+        (number of rows, formatted results)
+    """
+    start, columns = chunk
+    results = score_columns(columns, start, stress_scenarios)
+    if output_format == "csv":
+        return _row_count(columns), _format_csv(results, result_columns(stress_scenarios))
+    return _row_count(columns), results
+
+
+# =============================================================================
+# Readers / writers
+# =============================================================================
+
+def _file_format(path: Union[str, Path]) -> str:
+    return "parquet" if Path(path).suffix.lower() in (".parquet", ".pq") else "csv"
+
+
+def _require_pyarrow() -> None:
+    if pq is None:
+        raise RuntimeError("Parquet files require the optional pyarrow package (pip install pyarrow)")
+
+
+def _check_columns(names: Sequence[str]) -> None:
+    missing = [column for column in REQUIRED_COLUMNS if column not in names]
+    if missing:
+        raise ValueError(f"Input is missing required columns: {', '.join(missing)}")
+
+
+def iter_csv_chunks(path: Union[str, Path], chunk_size: int) -> Iterator[Chunk]:
+    """Read a CSV file with a header row as column chunks of up to chunk_size rows"""
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        header = [name.strip() for name in next(reader, [])]
+        _check_columns(header)
+        start = 0
+        while True:
+            rows = list(islice(reader, chunk_size))
+            if not rows:
+                return
+            # zip_longest: short rows get blanks instead of truncating every column
+            columns = dict(zip(header, zip_longest(*rows, fillvalue="")))
+            yield start, {name: values for name, values in columns.items() if name in INPUT_COLUMNS}
+            start += len(rows)
+
+
+def iter_parquet_chunks(path: Union[str, Path], chunk_size: int) -> Iterator[Chunk]:
+    """Read a Parquet file as column chunks of up to chunk_size rows (input columns only)"""
+    _require_pyarrow()
+    parquet_file = pq.ParquetFile(path)
+    names = parquet_file.schema_arrow.names
+    _check_columns(names)
+    start = 0
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=[n for n in names if n in INPUT_COLUMNS]):
+        columns = {
+            name: batch.column(position).to_numpy(zero_copy_only=False)
+            for position, name in enumerate(batch.schema.names)
+        }
+        yield start, columns
+        start += batch.num_rows
+
+
+class _CsvWriter:
+    def __init__(self, path: Union[str, Path], columns: Sequence[str]):
+        self._file = open(path, "w", newline="")
+        csv.writer(self._file, lineterminator="\n").writerow(columns)
+
+    def write(self, results: str) -> None:
+        self._file.write(results)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Union[str, Path], columns: Sequence[str]):
+        _require_pyarrow()
+        self._path = path
+        self._columns = columns
+        self._writer = None
+
+    def write(self, results: Dict[str, np.ndarray]) -> None:
+        table = pa.table({name: results[name] for name in self._columns})
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is None:  # Empty input: still write a file with the schema
+            self._writer = pq.ParquetWriter(self._path, pa.table({name: [] for name in self._columns}).schema)
+        self._writer.close()
+
+
+class _InlineExecutor(Executor):
+    """Runs submissions synchronously (single worker: no process pool)"""
+
+    def submit(self, fn, *args, **kwargs):
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def score_file(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    stress_scenarios: int = 0
+) -> int:
+    """
+    Score every loan in a CSV / Parquet file and write the results.
+
+    Args:
+        input_path: Loans file (.parquet / .pq for Parquet, anything else is CSV)
+        output_path: Results file, same format rule; written incrementally in input order
+        chunk_size: Rows per chunk
+        workers: Worker processes (default one per available CPU; 1 scores in this process)
+        stress_scenarios: Monte Carlo scenarios per loan (0 skips the stress test)
+
+    Returns:
+        Number of rows scored
+
+    Raises:
+        ValueError: If the input lacks a required column
+        RuntimeError: If a Parquet file is used without pyarrow installed
+    """
+    workers = workers or available_cpus()
+    output_format = _file_format(output_path)
+    if _file_format(input_path) == "parquet":
+        chunks = iter_parquet_chunks(input_path, chunk_size)
+    else:
+        chunks = iter_csv_chunks(input_path, chunk_size)
+    # Read the header (and first chunk) before creating the output file
+    first = next(chunks, None)
+    if first is not None:
+        chunks = chain([first], chunks)
+
+    columns = result_columns(stress_scenarios)
+    writer = _ParquetWriter(output_path, columns) if output_format == "parquet" else _CsvWriter(output_path, columns)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else _InlineExecutor()
+    pending: Deque[Future] = deque()
+    rows = 0
+
+    def write_oldest() -> None:
+        nonlocal rows
+        count, results = pending.popleft().result()
+        writer.write(results)
+        rows += count
+
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(score_chunk, chunk, output_format, stress_scenarios))
+            # Bounded read-ahead: wait for the oldest chunk before reading more
+            if len(pending) >= 2 * workers:
+                write_oldest()
+        while pending:
+            write_oldest()
+    finally:
+        executor.shutdown(cancel_futures=True)
+        writer.close()
+    return rows
@@ -0,0 +1,236 @@
+"""
+Report Store
+Persistent SQLite store of finished CreditAssessmentReports.
+
+Each report is kept as a JSON document next to the few columns it is looked up
+and filtered by (application_id, decision, risk level, report_date). Listing
+uses keyset pagination over (report_date, report_id), so every page is an index
+range scan no matter how deep the client pages or how large the table grows.
+
+The sqlite3 calls block, so the async methods run them in worker threads
+(asyncio.to_thread) and never on the event loop.
+"""
+
+import asyncio
+import base64
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from app.models import CreditAssessmentReport, ReportSummary, ReportPage, DecisionType, RiskLevel
+from config.settings import settings
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SUMMARY_COLUMNS = (
+    "report_id, application_id, applicant_name, report_date, decision, "
+    "risk_level, risk_score, confidence_score"
+)
+
+
+def _to_timestamp(value: datetime) -> float:
+    """Datetime to epoch seconds; naive values are UTC (reports use datetime.utcnow)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def encode_cursor(report_date: float, report_id: str) -> str:
+    """Opaque page cursor for the last (report_date, report_id) returned"""
+    return base64.urlsafe_b64encode(f"{report_date!r}|{report_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """
+    Inverse of encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        report_date, report_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return float(report_date), report_id
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+
+class ReportStore:
+    """
+    SQLite table of assessment reports with lookup and listing queries.
+
+    One connection is shared by the threads the queries run in; _lock
+    serializes its use.
+    """
+
+    def __init__(self, db_path: str):
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS assessment_reports ("
+                "report_id TEXT PRIMARY KEY, application_id TEXT NOT NULL, applicant_name TEXT NOT NULL, "
+                "report_date REAL NOT NULL, decision TEXT NOT NULL, risk_level TEXT NOT NULL, "
+                "risk_score INTEGER NOT NULL, confidence_score REAL NOT NULL, report TEXT NOT NULL)"
+            )
+            # report_id trails each index so the (report_date, report_id) page order needs no sort
+            for name, columns in (
+                ("application", "application_id, report_date, report_id"),
+                ("decision", "decision, report_date, report_id"),
+                ("risk_level", "risk_level, report_date, report_id"),
+                ("date", "report_date, report_id"),
+            ):
+                self._db.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_assessment_reports_{name} ON assessment_reports ({columns})"
+                )
+            self._db.commit()
+
+    async def save(self, report: CreditAssessmentReport) -> None:
+        """
+        Insert or replace a report.
+
+        Args:
+            report: Finished assessment report
+        """
+        await asyncio.to_thread(self._save, report)
+
+    def _save(self, report: CreditAssessmentReport) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO assessment_reports "
+                f"({SUMMARY_COLUMNS}, report) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    report.report_id,
+                    report.application_id,
+                    report.applicant_name,
+                    _to_timestamp(report.report_date),
+                    report.credit_decision.decision.value,
+                    report.risk_assessment.overall_risk_level.value,
+                    report.risk_assessment.risk_score,
+                    report.credit_decision.confidence_score,
+                    report.model_dump_json()
+                )
+            )
+            self._db.commit()
+
+    async def get(self, report_id: str) -> Optional[CreditAssessmentReport]:
+        """Report by id, or None if it does not exist"""
+        return await asyncio.to_thread(self._get, report_id)
+
+    def _get(self, report_id: str) -> Optional[CreditAssessmentReport]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT report FROM assessment_reports WHERE report_id = ?", (report_id,)
+            ).fetchone()
+        return CreditAssessmentReport.model_validate_json(row["report"]) if row is not None else None
+
+    async def list_reports(
+        self,
+        application_id: Optional[str] = None,
+        decision: Optional[DecisionType] = None,
+        risk_level: Optional[RiskLevel] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> ReportPage:
+        """
+        Filtered page of report summaries, newest first.
+
+        Args:
+            application_id: Only reports for this application
+            decision: Only reports with this decision
+            risk_level: Only reports with this overall risk level
+            since: Only reports dated at or after this time
+            until: Only reports dated before this time
+            limit: Maximum number of summaries
+            cursor: next_cursor of the previous page
+
+        Returns:
+            Page of summaries and the cursor of the following page (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return await asyncio.to_thread(
+            self._list_reports, application_id, decision, risk_level, since, until, limit, cursor
+        )
+
+    def _list_reports(
+        self,
+        application_id: Optional[str],
+        decision: Optional[DecisionType],
+        risk_level: Optional[RiskLevel],
+        since: Optional[datetime],
+        until: Optional[datetime],
+        limit: int,
+        cursor: Optional[str]
+    ) -> ReportPage:
+        clauses: List[str] = []
+        params: List[object] = []
+        for column, value in (
+            ("application_id", application_id),
+            ("decision", decision.value if decision else None),
+            ("risk_level", risk_level.value if risk_level else None),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("report_date >= ?")
+            params.append(_to_timestamp(since))
+        if until is not None:
+            clauses.append("report_date < ?")
+            params.append(_to_timestamp(until))
+        if cursor is not None:
+            clauses.append("(report_date, report_id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {SUMMARY_COLUMNS} FROM assessment_reports {where}"
+                "ORDER BY report_date DESC, report_id DESC LIMIT ?",
+                (*params, limit + 1)
+            ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["report_date"], rows[-1]["report_id"])
+
+        return ReportPage(
+            items=[
+                ReportSummary(
+                    report_id=row["report_id"],
+                    application_id=row["application_id"],
+                    applicant_name=row["applicant_name"],
+                    report_date=datetime.fromtimestamp(row["report_date"], tz=timezone.utc),
+                    decision=DecisionType(row["decision"]),
+                    risk_level=RiskLevel(row["risk_level"]),
+                    risk_score=row["risk_score"],
+                    confidence_score=row["confidence_score"]
+                )
+                for row in rows
+            ],
+            next_cursor=next_cursor
+        )
+
+
+@lru_cache()
+def get_report_store() -> Optional[ReportStore]:
+    """
+    Get the process-wide report store configured from settings.
+
+    Returns:
+        Shared report store, or None if report persistence is disabled
+    """
+    if not settings.report_store_enabled:
+        return None
+    return ReportStore(settings.report_store_sqlite_path)
@@ -0,0 +1,133 @@
+"""
+Request Coalescer
+In-flight de-duplication and short-TTL replay of identical assessments.
+
+Requests are keyed by a canonical hash of the AssessmentRequest, combined with
+the client's Idempotency-Key header when one is sent (so the same key with a
+different application is a different request). The first request for a key runs the
+workflow in its own task; concurrent duplicates (double-clicks, client retries)
+await that same task, and duplicates arriving shortly after it finished get the
+stored result instead of re-running every LLM call.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from app.models import AssessmentRequest
+from config.settings import settings
+from config.logging_config import get_logger
+from monitoring.metrics import assessment_coalescing
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def canonical_request_key(request: AssessmentRequest) -> str:
+    """
+    Content hash of an assessment request (application and options).
+
+    Args:
+        request: Assessment request, before an application_id is assigned
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON form
+    """
+    payload = json.dumps(
+        request.model_dump(mode="json"),
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RequestCoalescer:
+    """
+    Maps request keys to one shared in-flight task and recently stored results.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._recent: "OrderedDict[str, Tuple[float, object]]" = OrderedDict()  # key -> (stored_at, result)
+
+    def _get_recent(self, key: str) -> Optional[object]:
+        entry = self._recent.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._recent[key]
+            return None
+        return result
+
+    def _store_recent(self, key: str, result: object) -> None:
+        self._recent[key] = (time.monotonic(), result)
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.max_entries:
+            self._recent.popitem(last=False)
+
+    async def run(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+        should_store: Callable[[T], bool] = lambda result: True
+    ) -> T:
+        """
+        Run factory once per key, sharing its result with concurrent and recent duplicates.
+
+        Args:
+            key: Idempotency key or canonical request hash
+            factory: Coroutine function performing the work
+            should_store: Whether a finished result may be replayed (e.g. only successes)
+
+        Returns:
+            Result of the (possibly shared) work
+        """
+        recent = self._get_recent(key)
+        if recent is not None:
+            assessment_coalescing.labels(outcome="recent_result").inc()
+            logger.info(f"Returning recent result for duplicate request {key[:16]}")
+            return recent
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            assessment_coalescing.labels(outcome="joined_in_flight").inc()
+            logger.info(f"Joining in-flight assessment for duplicate request {key[:16]}")
+            return await asyncio.shield(task)
+
+        assessment_coalescing.labels(outcome="executed").inc()
+        task = asyncio.create_task(factory())
+        self._in_flight[key] = task
+
+        def _on_done(finished: asyncio.Task) -> None:
+            self._in_flight.pop(key, None)
+            if not finished.cancelled() and finished.exception() is None and should_store(finished.result()):
+                self._store_recent(key, finished.result())
+
+        task.add_done_callback(_on_done)
+        # Shielded: a disconnecting first caller does not cancel the work others await
+        return await asyncio.shield(task)
+
+
+@lru_cache()
+def get_request_coalescer() -> Optional[RequestCoalescer]:
+    """
+    Get the process-wide coalescer configured from settings.
+
+    Returns:
+        Shared coalescer, or None if idempotency handling is disabled
+    """
+    if not settings.idempotency_enabled:
+        return None
+
+    return RequestCoalescer(
+        ttl_seconds=settings.idempotency_ttl_seconds,
+        max_entries=settings.idempotency_max_entries
+    )
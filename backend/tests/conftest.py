@@ -0,0 +1,31 @@
+"""
+Shared test fixtures.
+
+Settings are read from the environment when config.settings is first
+imported, so the test defaults are set here, before any test module imports
+the application: no LLM warm-up, no tracing, and no SQLite files written to
+the working directory.
+"""
+
+import copy
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+os.environ.setdefault("AGENT_WARMUP_ENABLED", "false")
+os.environ.setdefault("LANGSMITH_TRACING_ENABLED", "false")
+os.environ.setdefault("JOB_QUEUE_ENABLED", "false")
+os.environ.setdefault("REPORT_STORE_ENABLED", "false")
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[2] / "examples"
+
+
+@pytest.fixture
+def sample_application() -> Dict[str, Any]:
+    """The sample loan application (a fresh copy per test)"""
+    with open(EXAMPLES_DIR / "sample_application.json") as file:
+        data = json.load(file)
+    return copy.deepcopy(data.get("application", data))
@@ -0,0 +1,70 @@
+"""
+Admission control of /api/v1/assess runs: only requests that execute a workflow take a slot.
+"""
+
+import asyncio
+
+import pytest
+
+from app.models import AssessmentRequest, AssessmentResponse, LoanApplication
+from services import credit_assessment_service as service_module
+from services.admission import AdmissionController, WorkflowOverloadedError
+from services.credit_assessment_service import CreditAssessmentService
+from services.request_coalescer import RequestCoalescer
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    # One slot and no wait queue: a second concurrent workflow is rejected at once
+    controller = AdmissionController(max_concurrent=1, queue_size=0, queue_timeout=1.0)
+    coalescer = RequestCoalescer()
+    monkeypatch.setattr(service_module, "get_admission_controller", lambda: controller)
+    monkeypatch.setattr(service_module, "get_request_coalescer", lambda: coalescer)
+    return controller
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = CreditAssessmentService()
+    runs = []
+
+    async def slow_assessment(request, on_progress=None):
+        runs.append(request.application.application_id)
+        await asyncio.sleep(0.05)
+        return AssessmentResponse(success=True, processing_time_seconds=0.05)
+
+    monkeypatch.setattr(service, "_assess_credit_risk", slow_assessment)
+    service.runs = runs
+    return service
+
+
+def _request(sample_application, application_id):
+    return AssessmentRequest(application=LoanApplication(**{**sample_application, "application_id": application_id}))
+
+
+async def test_duplicates_join_without_taking_a_slot(controller, service, sample_application):
+    request = _request(sample_application, "APP-1")
+
+    responses = await asyncio.gather(*(
+        service.assess_credit_risk(request.model_copy(deep=True), admission_endpoint="assess")
+        for _ in range(3)
+    ))
+
+    assert all(response.success for response in responses)
+    assert service.runs == ["APP-1"]
+
+    replayed = await service.assess_credit_risk(request.model_copy(deep=True), admission_endpoint="assess")
+    assert replayed is responses[0]
+
+
+async def test_distinct_request_is_rejected_while_the_slot_is_held(controller, service, sample_application):
+    first = asyncio.create_task(
+        service.assess_credit_risk(_request(sample_application, "APP-1"), admission_endpoint="assess")
+    )
+    await asyncio.sleep(0)
+
+    with pytest.raises(WorkflowOverloadedError):
+        await service.assess_credit_risk(_request(sample_application, "APP-2"), admission_endpoint="assess")
+
+    assert (await first).success
+    assert service.runs == ["APP-1"]
@@ -0,0 +1,60 @@
+"""
+Income analysis notes of templated sections: fast mode, pre-screen declines and degraded full-graph runs.
+"""
+
+import asyncio
+
+import pytest
+
+from app.models import DecisionType, LoanApplication
+from config.settings import settings
+from graphs.credit_assessment_graph import CreditAssessmentGraph
+from graphs.deterministic_analysis import FAST_MODE_NOTE, PRE_SCREEN_NOTE, degraded_note
+
+
+class StalledAgent:
+    """Agent whose LLM call never returns"""
+
+    async def ainvoke(self, inputs, config=None):
+        await asyncio.sleep(3600)
+
+
+@pytest.fixture
+def graph():
+    return CreditAssessmentGraph()
+
+
+async def test_fast_mode_report_carries_fast_mode_note(graph, sample_application):
+    report = await graph.run(LoanApplication(**sample_application), fast_mode=True)
+
+    assert report.income_analysis.analysis_notes == [FAST_MODE_NOTE]
+
+
+async def test_pre_screen_decline_carries_pre_screen_note(graph, sample_application):
+    sample_application["credit_history"]["credit_score"] = 450
+
+    report = await graph.run(LoanApplication(**sample_application))
+
+    assert report.credit_decision.decision == DecisionType.DECLINED
+    assert report.income_analysis.analysis_notes == [PRE_SCREEN_NOTE]
+
+
+async def test_workflow_deadline_report_carries_degraded_note(graph, sample_application, monkeypatch):
+    monkeypatch.setattr(settings, "workflow_timeout_seconds", 0.0)
+
+    report = await graph.run(LoanApplication(**sample_application))
+
+    assert "income_analysis" in report.degraded_sections
+    assert report.income_analysis.analysis_notes == [degraded_note("analyze_income", "workflow_deadline")]
+    assert FAST_MODE_NOTE not in report.income_analysis.analysis_notes
+
+
+async def test_node_timeout_report_carries_degraded_note(graph, sample_application, monkeypatch):
+    monkeypatch.setattr(settings, "node_timeout_seconds", 0.01)
+    monkeypatch.setattr("graphs.credit_assessment_graph.get_agent", lambda name: StalledAgent())
+
+    report = await graph.run(LoanApplication(**sample_application))
+
+    assert "income_analysis" in report.degraded_sections
+    assert report.income_analysis.analysis_notes == [degraded_note("analyze_income", "node_timeout")]
+    assert FAST_MODE_NOTE not in report.income_analysis.analysis_notes
@@ -0,0 +1,122 @@
+"""
+project_debt_payoff (closed form) and its vectorized mirror against the original payoff loop.
+"""
+
+import math
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pytest
+
+from benchmarks.debt_payoff import EDGE_CASES, iterative_debt_payoff, random_debts
+from calculations import vectorized
+from calculations.debt_calculations import project_debt_payoff
+
+Debt = Tuple[float, float, float]
+
+INSUFFICIENT = {
+    "months_to_payoff": 999,
+    "total_interest_paid": 0,
+    "total_amount_paid": 0,
+    "error": "Payment insufficient to cover interest"
+}
+
+
+def _balance_after(debt: Debt, months: int) -> float:
+    """Loop balance after the given number of payments"""
+    balance, payment, annual_rate = debt
+    monthly_rate = (annual_rate / 100) / 12
+    for _ in range(months):
+        balance -= payment - balance * monthly_rate
+    return balance
+
+
+def _assert_matches_loop(debt: Debt, loop: Dict[str, Any], closed: Dict[str, Any]) -> None:
+    """
+    Same keys and months as the loop, amounts within a cent.
+
+    The loop takes one extra month when floating-point error leaves it a
+    remainder below a millionth of a cent after the last real payment, and
+    accumulates rounding error over up to 600 additions.
+    """
+    assert loop.keys() == closed.keys(), debt
+    assert loop["months_to_payoff"] == closed["months_to_payoff"] or (
+        loop["months_to_payoff"] == closed["months_to_payoff"] + 1
+        and abs(_balance_after(debt, closed["months_to_payoff"])) < 1e-8
+    ), (debt, loop, closed)
+    for key in ("total_interest_paid", "total_amount_paid"):
+        assert abs(loop[key] - closed[key]) <= 0.01 + 1e-9, (debt, key, loop, closed)
+
+
+def _assert_vectorized_matches(debt: Debt, closed: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """Bit-for-bit the closed form; NaN for fields the closed form leaves out"""
+    record = dict(record)
+    assert record.pop("payment_insufficient") == ("error" in closed), debt
+    for key, value in record.items():
+        if key in closed:
+            assert float(closed[key]) == value and math.copysign(1, closed[key]) == math.copysign(1, value), \
+                (debt, key, closed, record)
+        else:
+            assert math.isnan(value), (debt, key, record)
+
+
+def _vectorized_records(debts):
+    records = vectorized.project_debt_payoff(*(np.array(column) for column in zip(*debts)))
+    return [dict(zip(records.dtype.names, record)) for record in records.tolist()]
+
+
+@pytest.mark.parametrize("debt", EDGE_CASES, ids=[str(debt) for debt in EDGE_CASES])
+def test_edge_cases_match_loop(debt):
+    closed = project_debt_payoff(*debt)
+
+    _assert_matches_loop(debt, iterative_debt_payoff(*debt), closed)
+    _assert_vectorized_matches(debt, closed, _vectorized_records([debt])[0])
+
+
+def test_random_portfolio_matches_loop():
+    debts = random_debts(2000, seed=7)
+    records = _vectorized_records(debts)
+
+    for debt, record in zip(debts, records):
+        closed = project_debt_payoff(*debt)
+        _assert_matches_loop(debt, iterative_debt_payoff(*debt), closed)
+        _assert_vectorized_matches(debt, closed, record)
+
+
+@pytest.mark.parametrize(("debt", "months"), [
+    ((10000.0, 500.0, 0.0), 20),
+    ((10000.0, 300.0, 0.0), 34),
+    ((11470.32, 1274.48, 0.0), 9),
+])
+def test_zero_rate_debt(debt, months):
+    result = project_debt_payoff(*debt)
+
+    assert result["months_to_payoff"] == months
+    assert result["total_interest_paid"] == 0
+    assert result["total_amount_paid"] == debt[0]
+
+
+@pytest.mark.parametrize("debt", [(10000.0, 50.0, 6.0), (10000.0, 49.99, 6.0), (250000.0, 100.0, 24.99)])
+def test_payment_not_covering_interest_never_amortizes(debt):
+    assert project_debt_payoff(*debt) == INSUFFICIENT
+
+
+def test_payment_just_above_interest_is_capped():
+    result = project_debt_payoff(10000.0, 50.01, 6.0)
+
+    assert result["months_to_payoff"] == 600
+    assert result["years_to_payoff"] == 50.0
+
+
+@pytest.mark.parametrize(("debt", "interest"), [
+    ((500.0, 1000.0, 19.99), 8.33),
+    ((500.0, 500.0, 0.0), 0.0),
+    ((0.01, 0.01, 0.0), 0.0),
+])
+def test_single_payment_debt(debt, interest):
+    result = project_debt_payoff(*debt)
+
+    assert result["months_to_payoff"] == 1
+    assert result["years_to_payoff"] == 0.1
+    assert result["total_interest_paid"] == interest
+    assert result["total_amount_paid"] == round(debt[0] + interest, 2)
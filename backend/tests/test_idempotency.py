@@ -0,0 +1,52 @@
+"""
+Idempotency-Key handling of /api/v1/assess (fast mode, no LLM calls).
+"""
+
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _assess(client: TestClient, application: dict, idempotency_key: str) -> dict:
+    response = client.post(
+        "/api/v1/assess",
+        json={"application": application, "fast_mode": True},
+        headers={"Idempotency-Key": idempotency_key}
+    )
+    assert response.status_code == 200
+    return response.json()["report"]
+
+
+def test_same_key_with_different_applications_returns_different_reports(client, sample_application):
+    key = str(uuid.uuid4())
+    other_application = {
+        **sample_application,
+        "application_id": "APP-OTHER-001",
+        "applicant": {**sample_application["applicant"], "first_name": "Jean", "last_name": "Dupont"},
+    }
+
+    first = _assess(client, sample_application, key)
+    second = _assess(client, other_application, key)
+
+    assert first["report_id"] != second["report_id"]
+    assert first["application_id"] == sample_application["application_id"]
+    assert second["application_id"] == "APP-OTHER-001"
+    assert second["applicant_name"] == "Jean Dupont"
+
+
+def test_same_key_with_same_application_replays_report(client, sample_application):
+    key = str(uuid.uuid4())
+
+    first = _assess(client, sample_application, key)
+    second = _assess(client, sample_application, key)
+
+    assert first["report_id"] == second["report_id"]
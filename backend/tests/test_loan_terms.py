@@ -0,0 +1,43 @@
+"""
+Dating of approved loan terms: reports are priced as of the day their assessment started.
+"""
+
+from datetime import date, datetime, timezone
+
+from app.models import LoanApplication
+from graphs.credit_assessment_graph import CreditAssessmentGraph
+from graphs.deterministic_analysis import (
+    build_credit_decision,
+    compute_collateral_calculations,
+    compute_debt_calculations,
+    compute_income_calculations,
+    compute_risk_calculations,
+)
+from graphs.state import assessment_date
+
+
+def test_assessment_date_is_the_utc_start_day():
+    start = datetime(2026, 3, 31, 23, 30, tzinfo=timezone.utc)
+
+    assert assessment_date({"start_time": start.timestamp()}) == date(2026, 3, 31)
+
+
+def test_decision_terms_are_reproducible_for_a_given_date(sample_application):
+    app = LoanApplication(**sample_application).model_dump()
+    income_calcs = compute_income_calculations(app)
+    debt_calcs = compute_debt_calculations(app)
+    risk_calcs = compute_risk_calculations(app, income_calcs, debt_calcs, compute_collateral_calculations(app))
+
+    first = build_credit_decision(app, risk_calcs, income_calcs, debt_calcs, disbursement_date=date(2025, 3, 10))
+    second = build_credit_decision(app, risk_calcs, income_calcs, debt_calcs, disbursement_date=date(2025, 3, 10))
+
+    assert first.approved_terms == second.approved_terms
+    assert first.approved_terms.disbursement_date == date(2025, 3, 10)
+    assert first.approved_terms.first_payment_date == date(2025, 4, 5)
+
+
+async def test_report_terms_are_dated_on_the_assessment_day(sample_application):
+    before = datetime.now(timezone.utc).date()
+    report = await CreditAssessmentGraph().run(LoanApplication(**sample_application), fast_mode=True)
+
+    assert report.credit_decision.approved_terms.disbursement_date in (before, datetime.now(timezone.utc).date())
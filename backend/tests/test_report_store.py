@@ -0,0 +1,104 @@
+"""
+ReportStore round trips and the /api/v1/reports endpoints (fast mode, no LLM calls).
+"""
+
+import json
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app, _require_report_store
+from app.models import CreditAssessmentReport
+from calculations.amortization import calculate_apr, days_360
+from graphs.deterministic_analysis import build_loan_terms
+from services.report_store import ReportStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ReportStore(str(tmp_path / "reports.db"))
+
+
+@pytest.fixture
+def client(store):
+    app.dependency_overrides[_require_report_store] = lambda: store
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def report(client, sample_application) -> CreditAssessmentReport:
+    response = client.post("/api/v1/assess", json={"application": sample_application, "fast_mode": True})
+    assert response.status_code == 200
+    return CreditAssessmentReport.model_validate(response.json()["report"])
+
+
+async def test_save_get_and_list(store, report):
+    await store.save(report)
+
+    assert await store.get(report.report_id) == report
+    assert await store.get("missing") is None
+
+    page = await store.list_reports(application_id=report.application_id)
+    assert [summary.report_id for summary in page.items] == [report.report_id]
+    assert page.next_cursor is None
+
+
+async def test_list_pages_with_cursor(store, report):
+    for index in range(3):
+        await store.save(report.model_copy(update={"report_id": f"RPT-{index}"}))
+
+    first = await store.list_reports(limit=2)
+    second = await store.list_reports(limit=2, cursor=first.next_cursor)
+
+    assert [summary.report_id for summary in first.items] == ["RPT-2", "RPT-1"]
+    assert [summary.report_id for summary in second.items] == ["RPT-0"]
+    assert second.next_cursor is None
+
+
+def test_report_endpoints(client, store, report):
+    client.portal.call(store.save, report)
+
+    assert client.get(f"/api/v1/reports/{report.report_id}").json()["report_id"] == report.report_id
+    assert client.get("/api/v1/reports/missing").status_code == 404
+    assert client.get("/api/v1/reports", params={"cursor": "not-a-cursor"}).status_code == 400
+    items = client.get("/api/v1/reports", params={"application_id": report.application_id}).json()["items"]
+    assert [item["report_id"] for item in items] == [report.report_id]
+
+
+def _schedule(client, report_id):
+    response = client.get(f"/api/v1/reports/{report_id}/schedule")
+    assert response.status_code == 200
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.parametrize("fees", [0.0, 1500.0])
+def test_schedule_reproduces_stored_terms(client, store, report, fees):
+    # Disbursed on the 20th, paid on the 5th: the first installment carries stub-period interest
+    terms = build_loan_terms(250000.0, 300, 4.25, fees=fees, payment_day=5, disbursement_date=date(2026, 1, 20))
+    report.credit_decision.approved_terms = terms
+    client.portal.call(store.save, report)
+
+    installments = _schedule(client, report.report_id)
+    payments = [installment for installment in installments if installment["installment"] > 0]
+
+    assert len(payments) == terms.term_months
+    assert payments[0]["payment_date"] == terms.first_payment_date.isoformat()
+    assert round(sum(installment["interest"] for installment in installments), 2) == terms.total_interest
+    assert round(sum(installment["payment"] for installment in installments), 2) == terms.total_repayment
+    assert round(sum(installment["fee"] for installment in installments), 2) == fees
+    first_period_days = days_360(terms.disbursement_date, terms.first_payment_date)
+    net_amount = terms.approved_amount - sum(installment["fee"] for installment in installments)
+    apr = calculate_apr(net_amount, [installment["payment"] for installment in payments], first_period_days)
+    assert apr == terms.annual_percentage_rate
+
+
+def test_schedule_of_assessed_report_matches_its_terms(client, store, report):
+    client.portal.call(store.save, report)
+    terms = report.credit_decision.approved_terms
+
+    installments = _schedule(client, report.report_id)
+
+    assert round(sum(installment["interest"] for installment in installments), 2) == terms.total_interest
@@ -0,0 +1,70 @@
+"""
+LLMResponseCache memory and SQLite tiers.
+"""
+
+import threading
+
+from agents.response_cache import LLMResponseCache
+
+
+async def test_memory_tier_hit_and_miss():
+    cache = LLMResponseCache(max_entries=2)
+
+    await cache.set("a", '{"value": 1}')
+
+    assert await cache.get("a", "test") == '{"value": 1}'
+    assert await cache.get("b", "test") is None
+
+
+async def test_memory_tier_evicts_least_recently_used():
+    cache = LLMResponseCache(max_entries=2)
+    for key in ("a", "b"):
+        await cache.set(key, key)
+    await cache.get("a", "test")
+
+    await cache.set("c", "c")
+
+    assert await cache.get("b", "test") is None
+    assert await cache.get("a", "test") == "a"
+
+
+async def test_sqlite_tier_survives_a_new_instance(tmp_path):
+    path = str(tmp_path / "cache.db")
+    await LLMResponseCache(sqlite_path=path).set("a", "persisted")
+
+    cache = LLMResponseCache(sqlite_path=path)
+
+    assert len(cache) == 0
+    assert await cache.get("a", "test") == "persisted"
+    assert len(cache) == 1
+
+
+async def test_sqlite_tier_drops_expired_entries(tmp_path):
+    path = str(tmp_path / "cache.db")
+    await LLMResponseCache(sqlite_path=path).set("a", "stale")
+
+    cache = LLMResponseCache(sqlite_path=path, sqlite_ttl_seconds=-1)
+
+    assert await cache.get("a", "test") is None
+    assert cache._db.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 0
+
+
+async def test_sqlite_tier_runs_off_the_event_loop_thread(tmp_path, monkeypatch):
+    cache = LLMResponseCache(sqlite_path=str(tmp_path / "cache.db"))
+    threads = []
+
+    def recording(method):
+        def wrapper(*args):
+            threads.append(threading.get_ident())
+            return method(*args)
+        return wrapper
+
+    for name in ("_get_persistent", "_set_persistent"):
+        monkeypatch.setattr(cache, name, recording(getattr(cache, name)))
+
+    await cache.set("a", "value")
+    cache._entries.clear()
+    assert await cache.get("a", "test") == "value"
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
@@ -0,0 +1,139 @@
+"""
+Parity of calculations.vectorized with the scalar calculations functions.
+"""
+
+import math
+import struct
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from benchmarks.vectorized_calculations import build_cases, run_scalar
+
+SAMPLE_ROWS = 2000
+SAMPLE_SEED = 11
+
+CASES = build_cases(SAMPLE_ROWS, SAMPLE_SEED)
+FUNCTIONS = {name: (scalar_fn, vectorized_fn) for name, scalar_fn, vectorized_fn, _ in CASES}
+
+# Zero income, zero amount and zero rate rows. perform_income_stress_test has
+# no zero-income row: the scalar version raises ZeroDivisionError there.
+EDGE_CASES = {
+    "calculate_annual_income": [
+        dict(monthly_gross=0.0, monthly_net=0.0),
+    ],
+    "calculate_disposable_income": [
+        dict(monthly_net_income=0.0, essential_expenses=0.0, existing_debt_payments=0.0),
+        dict(monthly_net_income=0.0, essential_expenses=1200.0, existing_debt_payments=350.0),
+    ],
+    "calculate_max_affordable_payment": [
+        dict(monthly_gross_income=0.0, existing_monthly_debt=0.0, max_dti_ratio=43.0, housing_expense_ratio=28.0),
+        dict(monthly_gross_income=0.0, existing_monthly_debt=500.0, max_dti_ratio=43.0, housing_expense_ratio=28.0),
+    ],
+    "perform_income_stress_test": [
+        dict(monthly_gross_income=5000.0, monthly_payment=0.0, income_reduction_pct=20.0,
+             interest_rate_increase_bps=200.0, current_interest_rate=4.0, loan_amount=0.0, loan_term_months=240),
+        dict(monthly_gross_income=5000.0, monthly_payment=1200.0, income_reduction_pct=20.0,
+             interest_rate_increase_bps=200.0, current_interest_rate=0.0, loan_amount=200000.0, loan_term_months=240),
+        dict(monthly_gross_income=5000.0, monthly_payment=1200.0, income_reduction_pct=20.0,
+             interest_rate_increase_bps=0.0, current_interest_rate=0.0, loan_amount=200000.0, loan_term_months=240),
+    ],
+    "calculate_estimated_payment": [
+        dict(amount=0.0, term_months=240, rate=0.04),
+        dict(amount=100000.0, term_months=240, rate=0.0),
+        dict(amount=0.0, term_months=240, rate=0.0),
+    ],
+    "calculate_dti_ratio": [
+        dict(total_monthly_debt=500.0, monthly_gross_income=0.0),
+        dict(total_monthly_debt=0.0, monthly_gross_income=0.0),
+        dict(total_monthly_debt=0.0, monthly_gross_income=5000.0),
+    ],
+    "calculate_dscr": [
+        dict(monthly_net_income=0.0, total_monthly_debt=0.0),
+        dict(monthly_net_income=0.0, total_monthly_debt=500.0),
+    ],
+    "calculate_ltv_ratio": [
+        dict(loan_amount=0.0, collateral_value=0.0),
+        dict(loan_amount=100000.0, collateral_value=0.0),
+        dict(loan_amount=0.0, collateral_value=250000.0),
+    ],
+    "calculate_liquidation_value": [
+        dict(market_value=0.0, collateral_type="vehicle", condition="good"),
+    ],
+    "calculate_collateral_coverage": [
+        dict(loan_amount=0.0, liquidation_value=0.0, required_coverage=1.2),
+        dict(loan_amount=100000.0, liquidation_value=0.0, required_coverage=1.2),
+    ],
+    "calculate_expected_loss": [
+        dict(loan_amount=0.0, probability_of_default=5.0, loss_given_default=45.0),
+    ],
+    "calculate_capital_requirement": [
+        dict(loan_amount=0.0, risk_weight=100.0, minimum_capital_ratio=8.0),
+    ],
+}
+
+
+def _flatten(result: Any, prefix: str = "") -> Dict[str, Any]:
+    if not isinstance(result, dict):
+        return {prefix: result}
+    flat: Dict[str, Any] = {}
+    for key, value in result.items():
+        flat.update(_flatten(value, f"{prefix}_{key}" if prefix else key))
+    return flat
+
+
+def _same(expected: Any, actual: Any) -> bool:
+    """Equal strings / booleans, or bit-identical floats (NaN matches NaN)"""
+    if isinstance(expected, (str, bool)):
+        return expected == actual
+    expected, actual = float(expected), float(actual)
+    if math.isnan(expected):
+        return math.isnan(actual)
+    return struct.pack("<d", expected) == struct.pack("<d", actual)
+
+
+def _mismatches(expected: List[Any], actual: np.ndarray) -> List[str]:
+    """Differing fields as "row N field: scalar != vectorized" (rows where the scalar raised are skipped)"""
+    if actual.dtype.names:
+        fields = {name: actual[name].tolist() for name in actual.dtype.names}
+    else:
+        fields = {"": actual.tolist()}
+    mismatches = []
+    for index, result in enumerate(expected):
+        if result is None:
+            continue
+        for key, value in _flatten(result).items():
+            if not _same(value, fields[key][index]):
+                mismatches.append(f"row {index} {key or 'value'}: {value!r} != {fields[key][index]!r}")
+    return mismatches
+
+
+def _columns(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    return {name: np.asarray([row[name] for row in rows]) for name in rows[0]}
+
+
+@pytest.mark.parametrize(
+    ("scalar_fn", "vectorized_fn", "columns"),
+    [case[1:] for case in CASES],
+    ids=[case[0] for case in CASES]
+)
+def test_seeded_sample_matches_scalar(scalar_fn, vectorized_fn, columns):
+    expected = run_scalar(scalar_fn, columns)
+    actual = vectorized_fn(**columns)
+
+    assert len(actual) == SAMPLE_ROWS
+    assert sum(result is not None for result in expected) > SAMPLE_ROWS // 2
+    assert _mismatches(expected, actual)[:5] == []
+
+
+@pytest.mark.parametrize("name", list(EDGE_CASES))
+def test_zero_income_amount_and_rate_match_scalar(name):
+    scalar_fn, vectorized_fn = FUNCTIONS[name]
+    columns = _columns(EDGE_CASES[name])
+
+    expected = run_scalar(scalar_fn, columns)
+    actual = vectorized_fn(**columns)
+
+    assert None not in expected
+    assert _mismatches(expected, actual) == []